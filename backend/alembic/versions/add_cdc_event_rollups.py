@@ -0,0 +1,61 @@
+"""Add cdc_event_rollups table.
+
+Revision ID: add_cdc_event_rollups
+Revises: add_incremental_reload
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_cdc_event_rollups"
+down_revision: Union[str, None] = "add_incremental_reload"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'cdc_event_rollups',
+        sa.Column('pipeline_id', sa.String(36), nullable=False),
+        sa.Column('schema_name', sa.String(255), nullable=False),
+        sa.Column('table_name', sa.String(255), nullable=False),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(50), nullable=False),
+        sa.Column('bucket_start', sa.DateTime(), nullable=False),
+        sa.Column('event_count', sa.BigInteger(), nullable=False),
+        sa.Column('total_bytes', sa.BigInteger(), nullable=False),
+        sa.Column('max_latency_ms', sa.BigInteger(), nullable=True),
+        sa.Column('last_event_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['pipeline_id'], ['pipelines.id']),
+        sa.PrimaryKeyConstraint('pipeline_id', 'schema_name', 'table_name', 'event_type', 'status', 'bucket_start')
+    )
+    op.create_index('idx_event_rollup_bucket', 'cdc_event_rollups', ['bucket_start'])
+
+    # Roll up the CDC events logged so far; message sizes and latencies were not recorded
+    op.execute("""
+        INSERT INTO cdc_event_rollups (
+            pipeline_id, schema_name, table_name, event_type, status, bucket_start,
+            event_count, total_bytes, max_latency_ms, last_event_at
+        )
+        SELECT
+            pipeline_id,
+            COALESCE(run_metadata->>'schema_name', 'unknown'),
+            COALESCE(run_metadata->>'table_name', 'unknown'),
+            COALESCE(run_metadata->>'event_type', 'unknown'),
+            status,
+            date_trunc('minute', started_at),
+            COUNT(*),
+            0,
+            NULL,
+            MAX(started_at)
+        FROM pipeline_runs
+        WHERE run_type = 'CDC'
+        GROUP BY 1, 2, 3, 4, 5, 6;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_event_rollup_bucket', table_name='cdc_event_rollups')
+    op.drop_table('cdc_event_rollups')
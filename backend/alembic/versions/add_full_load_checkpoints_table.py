@@ -0,0 +1,39 @@
+"""Add full_load_checkpoints table.
+
+Revision ID: add_full_load_checkpoints
+Revises: add_full_load_config
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_full_load_checkpoints"
+down_revision: Union[str, None] = "add_full_load_config"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'full_load_checkpoints',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('pipeline_id', sa.String(36), nullable=False),
+        sa.Column('table_name', sa.String(255), nullable=False),
+        sa.Column('status', sa.String(50), nullable=False),
+        sa.Column('chunks', sa.JSON(), nullable=True),
+        sa.Column('chunk_states', sa.JSON(), nullable=True),
+        sa.Column('rows_copied', sa.BigInteger(), nullable=True),
+        sa.Column('lsn_info', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['pipeline_id'], ['pipelines.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_checkpoint_pipeline_table', 'full_load_checkpoints', ['pipeline_id', 'table_name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_checkpoint_pipeline_table', table_name='full_load_checkpoints')
+    op.drop_table('full_load_checkpoints')
@@ -0,0 +1,23 @@
+"""Add full_load_config to pipelines.
+
+Revision ID: add_full_load_config
+Revises: add_db2_enum
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_full_load_config"
+down_revision: Union[str, None] = "add_db2_enum"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('pipelines', sa.Column('full_load_config', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('pipelines', 'full_load_config')
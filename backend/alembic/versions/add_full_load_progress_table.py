@@ -0,0 +1,42 @@
+"""Add full_load_progress table.
+
+Revision ID: add_full_load_progress
+Revises: add_full_load_checkpoints
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_full_load_progress"
+down_revision: Union[str, None] = "add_full_load_checkpoints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'full_load_progress',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('pipeline_id', sa.String(36), nullable=False),
+        sa.Column('run_started_at', sa.DateTime(), nullable=False),
+        sa.Column('table_name', sa.String(255), nullable=False),
+        sa.Column('stage', sa.String(50), nullable=False),
+        sa.Column('rows_copied', sa.BigInteger(), nullable=True),
+        sa.Column('total_rows', sa.BigInteger(), nullable=True),
+        sa.Column('bytes_copied', sa.BigInteger(), nullable=True),
+        sa.Column('rows_per_second', sa.Float(), nullable=True),
+        sa.Column('bytes_per_second', sa.Float(), nullable=True),
+        sa.Column('eta_seconds', sa.Float(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('recorded_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['pipeline_id'], ['pipelines.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_progress_pipeline_recorded', 'full_load_progress', ['pipeline_id', 'recorded_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_progress_pipeline_recorded', table_name='full_load_progress')
+    op.drop_table('full_load_progress')
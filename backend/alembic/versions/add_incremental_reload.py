@@ -0,0 +1,40 @@
+"""Add incremental_reload pipeline mode and incremental_watermarks table.
+
+Revision ID: add_incremental_reload
+Revises: add_full_load_progress
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "add_incremental_reload"
+down_revision: Union[str, None] = "add_full_load_progress"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        ALTER TYPE pipelinemode ADD VALUE IF NOT EXISTS 'incremental_reload';
+    """)
+    op.create_table(
+        'incremental_watermarks',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('pipeline_id', sa.String(36), nullable=False),
+        sa.Column('table_name', sa.String(255), nullable=False),
+        sa.Column('watermark_column', sa.String(255), nullable=False),
+        sa.Column('watermark_value', sa.JSON(), nullable=True),
+        sa.Column('rows_copied', sa.BigInteger(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['pipeline_id'], ['pipelines.id']),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_watermark_pipeline_table', 'incremental_watermarks', ['pipeline_id', 'table_name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_watermark_pipeline_table', table_name='incremental_watermarks')
+    op.drop_table('incremental_watermarks')
+    # PostgreSQL cannot drop an enum value; 'incremental_reload' is left in pipelinemode
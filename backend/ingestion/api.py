@@ -466,6 +466,26 @@ if socketio_server:
             return {"status": "error", "message": str(e)}
 
 
+    @socketio_server.on('get_full_load_progress')
+
+    async def on_get_full_load_progress(sid, data):
+
+        """Return the live full load progress of a pipeline (rows, rates, ETA per table)."""
+
+        try:
+            from ingestion.progress import progress_registry
+            pipeline_id = str((data or {}).get('pipeline_id', ''))
+            if not pipeline_id:
+                return {"status": "error", "message": "pipeline_id required"}
+            snapshot = progress_registry.snapshot(pipeline_id)
+            if snapshot is None:
+                return {"status": "not_found", "pipeline_id": pipeline_id}
+            return {"status": "ok", "progress": snapshot}
+        except Exception as e:
+            logger.error(f"Error in get_full_load_progress handler: {e}", exc_info=True)
+            return {"status": "error", "message": str(e)}
+
+
     @socketio_server.on('unsubscribe_pipeline')
 
     async def on_unsubscribe_pipeline(sid, data):
@@ -893,6 +913,8 @@ class PipelineCreate(BaseModel):
 
     table_filter: Optional[str] = None
 
+    full_load_config: Optional[Dict[str, Any]] = None  # Full load tuning, e.g. {"max_parallel_tables": 4}
+
     # Frontend format support
 
     table_mappings: Optional[List[Dict[str, Any]]] = None  # Frontend sends table_mappings
@@ -1047,6 +1069,8 @@ class PipelineUpdate(BaseModel):
 
     table_filter: Optional[str] = None
 
+    full_load_config: Optional[Dict[str, Any]] = None
+
 
 
 
@@ -3193,7 +3217,7 @@ async def create_pipeline(
 
                     mode = PipelineMode.CDC_ONLY.value
 
-            else:
+            elif mode != PipelineMode.INCREMENTAL_RELOAD.value:
 
                 mode = PipelineMode.FULL_LOAD_ONLY.value
 
@@ -3319,7 +3343,9 @@ async def create_pipeline(
 
             target_table_mapping=pipeline_data.target_table_mapping,
 
-            table_filter=pipeline_data.table_filter
+            table_filter=pipeline_data.table_filter,
+
+            full_load_config=pipeline_data.full_load_config
 
         )
 
@@ -3375,6 +3401,8 @@ async def create_pipeline(
 
             table_filter=created_pipeline.table_filter,
 
+            full_load_config=created_pipeline.full_load_config,
+
             status=PipelineStatus.STOPPED,
 
             full_load_status=FullLoadStatus.NOT_STARTED,
@@ -3581,6 +3609,8 @@ async def list_pipelines(
 
                 "table_filter": pm.table_filter,
 
+                "full_load_config": pm.full_load_config or {},
+
                 "status": pm.status.value if hasattr(pm.status, 'value') else str(pm.status),
 
                 "full_load_status": pm.full_load_status.value if hasattr(pm.full_load_status, 'value') else str(pm.full_load_status),
@@ -3878,6 +3908,10 @@ async def update_pipeline(
 
             pipeline_model.table_filter = pipeline_data.table_filter
 
+        if pipeline_data.full_load_config is not None:
+
+            pipeline_model.full_load_config = pipeline_data.full_load_config
+
         
 
         pipeline_model.updated_at = datetime.utcnow()
@@ -3954,6 +3988,10 @@ async def update_pipeline(
 
                 existing_pipeline.table_filter = pipeline_data.table_filter
 
+            if pipeline_data.full_load_config is not None:
+
+                existing_pipeline.full_load_config = pipeline_data.full_load_config
+
         
 
         # Return updated pipeline
@@ -3990,6 +4028,8 @@ async def update_pipeline(
 
             "table_filter": pipeline_model.table_filter,
 
+            "full_load_config": pipeline_model.full_load_config or {},
+
             "status": pipeline_model.status.value if hasattr(pipeline_model.status, 'value') else str(pipeline_model.status),
 
             "full_load_status": pipeline_model.full_load_status.value if hasattr(pipeline_model.full_load_status, 'value') else str(pipeline_model.full_load_status),
@@ -4230,7 +4270,9 @@ def start_pipeline_sync(pipeline_id: str, db: Session) -> Dict[str, Any]:
 
             debezium_config=pipeline_model.debezium_config or {},
 
-            sink_config=pipeline_model.sink_config or {}
+            sink_config=pipeline_model.sink_config or {},
+
+            full_load_config=pipeline_model.full_load_config or {}
 
         )
 
@@ -4526,7 +4568,9 @@ async def start_pipeline(
 
             debezium_config=pipeline_model.debezium_config or {},
 
-            sink_config=pipeline_model.sink_config or {}
+            sink_config=pipeline_model.sink_config or {},
+
+            full_load_config=pipeline_model.full_load_config or {}
 
         )
 
@@ -6106,6 +6150,104 @@ async def validate_pipeline(pipeline_id: str) -> Dict[str, Any]:
 
 
 
+@app.post("/api/v1/pipelines/{pipeline_id}/reconcile")
+
+async def reconcile_pipeline(
+
+    pipeline_id: str,
+
+    tables: Optional[List[str]] = None
+
+) -> Dict[str, Any]:
+
+    """Reconcile pipeline source tables with their target copies.
+
+    
+
+    Rows are compared by primary key range hashes; mismatched ranges are
+
+    bisected down to the differing keys.
+
+    
+
+    Args:
+
+        pipeline_id: Pipeline ID
+
+        tables: Source tables to reconcile (optional, default all pipeline tables)
+
+        
+
+    Returns:
+
+        Reconciliation result per table with the keys that differ
+
+    """
+
+    import asyncio
+
+    from ingestion.exceptions import ValidationError
+
+    
+
+    try:
+
+        if not cdc_manager.pipeline_store.get(pipeline_id):
+
+            raise HTTPException(
+
+                status_code=status.HTTP_404_NOT_FOUND,
+
+                detail=f"Pipeline not found: {pipeline_id}"
+
+            )
+
+        
+
+        # Reconciliation reads both databases; run it off the event loop
+
+        loop = asyncio.get_event_loop()
+
+        return await loop.run_in_executor(
+
+            None,
+
+            lambda: cdc_manager.reconcile_pipeline(pipeline_id, tables)
+
+        )
+
+        
+
+    except HTTPException:
+
+        raise
+
+    except ValidationError as e:
+
+        raise HTTPException(
+
+            status_code=status.HTTP_400_BAD_REQUEST,
+
+            detail=str(e)
+
+        )
+
+    except Exception as e:
+
+        logger.error(f"Failed to reconcile pipeline: {e}", exc_info=True)
+
+        raise HTTPException(
+
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+
+            detail=str(e)
+
+        )
+
+
+
+
+
 @app.post("/api/v1/pipelines/{pipeline_id}/tables/select")
 
 async def select_pipeline_tables(
@@ -6850,8 +6992,7 @@ async def sync_pipeline_stats(pipeline_id: str, db: Session = Depends(get_db)) -
         Dictionary with synced statistics
     """
     try:
-        from ingestion.database.models_db import PipelineModel, PipelineRunModel
-        from sqlalchemy import func
+        from ingestion.database.models_db import PipelineModel
         
         # Get pipeline from database
         pipeline_model = db.query(PipelineModel).filter(
@@ -6865,38 +7006,14 @@ async def sync_pipeline_stats(pipeline_id: str, db: Session = Depends(get_db)) -
                 detail=f"Pipeline not found: {pipeline_id}"
             )
         
-        # CRITICAL FIX: Count all CDC events
-        total_events = db.query(func.count(PipelineRunModel.id)).filter(
-            PipelineRunModel.pipeline_id == pipeline_id,
-            PipelineRunModel.run_type == 'CDC'
-        ).scalar() or 0
-        
-        # Count applied events (status = 'applied', 'success', or 'completed')
-        applied_events = db.query(func.count(PipelineRunModel.id)).filter(
-            PipelineRunModel.pipeline_id == pipeline_id,
-            PipelineRunModel.run_type == 'CDC',
-            PipelineRunModel.status.in_(['applied', 'success', 'completed'])
-        ).scalar() or 0
-        
-        # Count failed events (status = 'failed' or 'error')
-        failed_events = db.query(func.count(PipelineRunModel.id)).filter(
-            PipelineRunModel.pipeline_id == pipeline_id,
-            PipelineRunModel.run_type == 'CDC',
-            PipelineRunModel.status.in_(['failed', 'error'])
-        ).scalar() or 0
-        
-        # Count pending events (status = 'pending' or 'processing' or 'running')
-        pending_events = db.query(func.count(PipelineRunModel.id)).filter(
-            PipelineRunModel.pipeline_id == pipeline_id,
-            PipelineRunModel.run_type == 'CDC',
-            PipelineRunModel.status.in_(['pending', 'processing', 'running'])
-        ).scalar() or 0
-        
-        # Get latest event timestamp
-        latest_event = db.query(PipelineRunModel).filter(
-            PipelineRunModel.pipeline_id == pipeline_id,
-            PipelineRunModel.run_type == 'CDC'
-        ).order_by(PipelineRunModel.started_at.desc()).first()
+        # Count all CDC events from the per-minute event rollups
+        from ingestion.event_rollups import summarize_event_rollups
+        event_summary = summarize_event_rollups(db, pipeline_id=pipeline_id)
+        total_events = event_summary["total"]
+        applied_events = event_summary["applied"]
+        failed_events = event_summary["failed"]
+        pending_events = event_summary["pending"]
+        last_event_time = event_summary["last_event_at"]
         
         # Calculate success rate
         success_rate = (applied_events / total_events * 100) if total_events > 0 else 0.0
@@ -6908,7 +7025,7 @@ async def sync_pipeline_stats(pipeline_id: str, db: Session = Depends(get_db)) -
             "events_failed": failed_events,
             "events_pending": pending_events,
             "success_rate": round(success_rate, 2),
-            "last_event_time": latest_event.started_at.isoformat() if latest_event and latest_event.started_at else None,
+            "last_event_time": last_event_time.isoformat() if last_event_time else None,
             "timestamp": datetime.utcnow().isoformat(),
             "message": "Statistics synced successfully"
         }
@@ -7080,6 +7197,23 @@ async def get_pipeline_progress(pipeline_id: str, db: Session = Depends(get_db))
 
             tables_completed = tables_total // 2 if tables_total > 0 else 0
 
+        # Live per-table progress of the full load, reported by the transfer engine;
+        # after a restart, the last snapshot persisted by the interrupted run
+        from ingestion.progress import load_persisted_snapshot, progress_registry
+        full_load_progress = progress_registry.snapshot(pipeline_id)
+        if full_load_progress is None and full_load_status_value in (DBFullLoadStatus.IN_PROGRESS.value, "IN_PROGRESS"):
+            try:
+                full_load_progress = load_persisted_snapshot(db, pipeline_id)
+            except Exception as e:
+                logger.warning(f"Could not load persisted full load progress for {pipeline_id}: {e}")
+        if full_load_progress:
+            records_processed = full_load_progress.get("rows_copied", 0)
+            records_total = full_load_progress.get("total_rows") or records_total
+            if full_load_progress.get("progress_percent") is not None:
+                progress_percentage = full_load_progress["progress_percent"]
+            if "tables_completed" in full_load_progress:
+                tables_completed = full_load_progress["tables_completed"]
+
         
 
         # Get connector status for additional info
@@ -7178,6 +7312,14 @@ async def get_pipeline_progress(pipeline_id: str, db: Session = Depends(get_db))
 
             full_load_info["total_records"] = records_total
 
+        if full_load_progress:
+            for key in (
+                "rows_per_second", "bytes_per_second", "mb_per_second", "eta_seconds",
+                "current_tables", "tables", "started_at", "completed_at", "recorded_at"
+            ):
+                if key in full_load_progress:
+                    full_load_info.setdefault(key, full_load_progress[key])
+
         
 
         # Extract CDC info if available
@@ -7202,55 +7344,17 @@ async def get_pipeline_progress(pipeline_id: str, db: Session = Depends(get_db))
         # Use timeout to prevent slow queries from hanging
         if "events_captured" not in cdc_info or "events_applied" not in cdc_info or "events_failed" not in cdc_info:
             try:
-                from ingestion.database.models_db import PipelineRunModel
-                from sqlalchemy import func
-                import time
+                from ingestion.event_rollups import summarize_event_rollups
                 
-                # Set a timeout for the query (5 seconds max)
-                start_time = time.time()
-                query_timeout = 5.0
-                
-                # Count all events for this pipeline (captured = total)
+                # Count all events for this pipeline from the per-minute event rollups
                 try:
-                    total_events = db.query(func.count(PipelineRunModel.id)).filter(
-                        PipelineRunModel.pipeline_id == pipeline_id,
-                        PipelineRunModel.run_type == 'CDC'
-                    ).scalar() or 0
-                    
-                    if time.time() - start_time > query_timeout:
-                        raise TimeoutError("Query timeout")
-
-                    # Count applied events (status = 'applied', 'success', or 'completed')
-                    applied_events = db.query(func.count(PipelineRunModel.id)).filter(
-                        PipelineRunModel.pipeline_id == pipeline_id,
-                        PipelineRunModel.run_type == 'CDC',
-                        PipelineRunModel.status.in_(['applied', 'success', 'completed'])
-                    ).scalar() or 0
-                    
-                    if time.time() - start_time > query_timeout:
-                        raise TimeoutError("Query timeout")
-
-                    # Count failed events (status = 'failed' or 'error')
-                    failed_events = db.query(func.count(PipelineRunModel.id)).filter(
-                        PipelineRunModel.pipeline_id == pipeline_id,
-                        PipelineRunModel.run_type == 'CDC',
-                        PipelineRunModel.status.in_(['failed', 'error'])
-                    ).scalar() or 0
+                    event_summary = summarize_event_rollups(db, pipeline_id=pipeline_id)
                 
-                    if time.time() - start_time > query_timeout:
-                        raise TimeoutError("Query timeout")
-                    
-                    # Get latest event time
-                    latest_event = db.query(PipelineRunModel).filter(
-                        PipelineRunModel.pipeline_id == pipeline_id,
-                        PipelineRunModel.run_type == 'CDC'
-                    ).order_by(PipelineRunModel.started_at.desc()).first()
-                
-                    cdc_info["events_captured"] = total_events
-                    cdc_info["events_applied"] = applied_events
-                    cdc_info["events_failed"] = failed_events
-                    if latest_event:
-                        cdc_info["last_event_time"] = latest_event.started_at.isoformat() if latest_event.started_at else None
+                    cdc_info["events_captured"] = event_summary["total"]
+                    cdc_info["events_applied"] = event_summary["applied"]
+                    cdc_info["events_failed"] = event_summary["failed"]
+                    if event_summary["last_event_at"]:
+                        cdc_info["last_event_time"] = event_summary["last_event_at"].isoformat()
 
                 except (TimeoutError, Exception) as query_error:
                     logger.warning(f"Query timeout or error calculating CDC event counts: {query_error}")
@@ -7774,78 +7878,34 @@ async def get_monitoring_dashboard(db: Session = Depends(get_db)) -> Dict[str, A
 
         
 
-        # CRITICAL FIX: Calculate event statistics from pipeline runs with proper aggregation
-        # Use SQL aggregation instead of frontend filtering for performance and accuracy
+        # Event statistics from the per-minute CDC event rollups (not the raw pipeline_runs rows)
+        from ingestion.event_rollups import summarize_event_rollups
         seven_days_ago = datetime.utcnow() - timedelta(days=7)
-
-        
-
-        # Base query for CDC events
-        base_query = db.query(PipelineRunModel).filter(
-            PipelineRunModel.run_type == 'CDC',
-            PipelineRunModel.started_at >= seven_days_ago
-
-        )
-        
-        # Count total CDC events
-        total_events = base_query.count() or 0
-        
-        # Count failed CDC events (status-based)
-        failed_events = base_query.filter(
-            PipelineRunModel.status.in_(['failed', 'error'])
-        ).count() or 0
         
-        # Count successful CDC events (status-based)
-        success_events = base_query.filter(
-            PipelineRunModel.status.in_(['applied', 'success', 'completed'])
-        ).count() or 0
-        
-        # CRITICAL: Aggregate event types from run_metadata using SQL
-        # This is more efficient than frontend filtering
-        from sqlalchemy import case, cast, String
-        from sqlalchemy.dialects.postgresql import JSONB
-        
-        # Count events by type using SQL aggregation
-        # Extract event_type from run_metadata JSONB column
         try:
-            event_type_counts = db.query(
-                func.coalesce(
-                    cast(PipelineRunModel.run_metadata['event_type'].astext, String),
-                    'unknown'
-                ).label('event_type'),
-                func.count(PipelineRunModel.id).label('count')
-            ).filter(
-                PipelineRunModel.run_type == 'CDC',
-                PipelineRunModel.started_at >= seven_days_ago
-            ).group_by(
-                func.coalesce(
-                    cast(PipelineRunModel.run_metadata['event_type'].astext, String),
-                    'unknown'
-                )
-            ).all()
-            
-            # Normalize and sum event type counts
-            insert_count = 0
-            update_count = 0
-            delete_count = 0
-            
-            for event_type_str, count in event_type_counts:
-                event_type_normalized = str(event_type_str).lower().strip() if event_type_str else 'unknown'
-                # Normalize Debezium op codes
-                if event_type_normalized in ['insert', 'i', 'c', 'create', 'r']:
-                    insert_count += count
-                elif event_type_normalized in ['update', 'u']:
-                    update_count += count
-                elif event_type_normalized in ['delete', 'd', 'remove']:
-                    delete_count += count
-                # Unknown types are not counted in insert/update/delete
+            event_summary = summarize_event_rollups(db, since=seven_days_ago)
         except Exception as e:
-            logger.warning(f"Failed to aggregate event types: {e}. Using fallback calculation.")
-            # Fallback: Get all runs and count in Python (less efficient but works)
-            recent_runs = base_query.limit(10000).all()
-            insert_count = sum(1 for r in recent_runs if r.run_metadata and isinstance(r.run_metadata, dict) and str(r.run_metadata.get('event_type', '')).lower().strip() in ['insert', 'i', 'c', 'create', 'r'])
-            update_count = sum(1 for r in recent_runs if r.run_metadata and isinstance(r.run_metadata, dict) and str(r.run_metadata.get('event_type', '')).lower().strip() in ['update', 'u'])
-            delete_count = sum(1 for r in recent_runs if r.run_metadata and isinstance(r.run_metadata, dict) and str(r.run_metadata.get('event_type', '')).lower().strip() in ['delete', 'd', 'remove'])
+            logger.warning(f"Failed to read CDC event rollups: {e}")
+            db.rollback()
+            event_summary = {"total": 0, "applied": 0, "failed": 0, "by_event_type": {}}
+        
+        total_events = event_summary["total"]
+        failed_events = event_summary["failed"]
+        success_events = event_summary["applied"]
+        
+        # Normalize Debezium op codes of older events
+        insert_count = 0
+        update_count = 0
+        delete_count = 0
+        for event_type_str, count in event_summary["by_event_type"].items():
+            event_type_normalized = str(event_type_str).lower().strip() if event_type_str else 'unknown'
+            if event_type_normalized in ['insert', 'i', 'c', 'create', 'r']:
+                insert_count += count
+            elif event_type_normalized in ['update', 'u']:
+                update_count += count
+            elif event_type_normalized in ['delete', 'd', 'remove']:
+                delete_count += count
+            # Unknown types are not counted in insert/update/delete
         
         logger.info(
             f"Dashboard event counts (last 7 days): "
@@ -7856,36 +7916,6 @@ async def get_monitoring_dashboard(db: Session = Depends(get_db)) -> Dict[str, A
             f"Update: {update_count}, "
             f"Delete: {delete_count}"
         )
-        
-        # Get all pipeline runs from last 7 days - limit query for performance (for backward compatibility)
-        recent_runs = base_query.limit(1000).all()  # Limit to 1000 most recent runs
-        
-
-        # Count events by status from pipeline runs
-
-        total_runs = len(recent_runs)
-
-        # Normalize status values for counting - be more flexible with status matching
-
-        failed_runs = len([r for r in recent_runs if r.status and (
-
-            r.status.lower() in ['failed', 'error'] or 
-
-            'fail' in r.status.lower() or 
-
-            'error' in r.status.lower()
-
-        )])
-
-        success_runs = len([r for r in recent_runs if r.status and (
-
-            r.status.lower() in ['success', 'completed', 'applied'] or
-
-            'success' in r.status.lower() or
-
-            'complete' in r.status.lower()
-
-        )])
 
         
 
@@ -8854,16 +8884,13 @@ async def get_replication_events(
                 logger.warning(f"   Available pipeline_ids in database: {pipeline_ids_in_db}")
                 
                 # Check total CDC events count
-                total_cdc_events = db.query(func.count(PipelineRunModel.id)).filter(
-                    PipelineRunModel.run_type == 'CDC'
-                ).scalar() or 0
+                from ingestion.event_rollups import summarize_event_rollups
+                total_cdc_events = summarize_event_rollups(db)["total"]
                 logger.warning(f"   Total CDC events in database: {total_cdc_events}")
                 
-                # Check if pipeline_id exists at all (even with wrong run_type)
-                pipeline_exists = db.query(func.count(PipelineRunModel.id)).filter(
-                    PipelineRunModel.pipeline_id == pipeline_id
-                ).scalar() or 0
-                logger.warning(f"   Total events for this pipeline_id (any run_type): {pipeline_exists}")
+                # Check if pipeline_id has events at all (raw rows may be sampled)
+                pipeline_events = summarize_event_rollups(db, pipeline_id=pipeline_id)["total"]
+                logger.warning(f"   Total CDC events for this pipeline_id: {pipeline_events}")
             except Exception as diag_error:
                 logger.error(f"Error in diagnostic query: {diag_error}")
         
@@ -9925,6 +9952,71 @@ async def get_replication_events(
 
 
 
+@app.get("/api/v1/monitoring/replication-events/trend")
+@app.get("/api/monitoring/replication-events/trend")
+async def get_replication_event_trend(
+    pipeline_id: Optional[str] = None,
+    hours: int = 24,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    table_name: Optional[str] = None,
+    db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """Get per-minute CDC event counts from the event rollups.
+    
+    Args:
+        pipeline_id: Optional pipeline ID to filter events
+        hours: Hours of history when no start_date is given (default 24, max 7 days)
+        start_date: Optional start date filter (ISO format)
+        end_date: Optional end date filter (ISO format)
+        table_name: Optional table name filter
+        db: Database session
+        
+    Returns:
+        Dictionary with the trend (one point per minute with events) and its totals
+    """
+    if db is None:
+        logger.warning("Database unavailable, returning empty event trend")
+        return {"pipeline_id": pipeline_id, "trend": [], "summary": None}
+    
+    try:
+        from datetime import timedelta
+        from ingestion.event_rollups import event_rollup_trend, summarize_event_rollups
+        
+        since = datetime.utcnow() - timedelta(hours=min(max(hours, 1), 24 * 7))
+        until = None
+        try:
+            if start_date:
+                since = datetime.fromisoformat(start_date.replace('Z', '+00:00')).replace(tzinfo=None)
+            if end_date:
+                until = datetime.fromisoformat(end_date.replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid date format: start_date={start_date}, end_date={end_date}"
+            )
+        
+        trend = event_rollup_trend(db, since, pipeline_id=pipeline_id, until=until, table_name=table_name)
+        summary = summarize_event_rollups(db, pipeline_id=pipeline_id, since=since, until=until, table_name=table_name)
+        if summary["last_event_at"]:
+            summary["last_event_at"] = summary["last_event_at"].isoformat()
+        
+        return {
+            "pipeline_id": pipeline_id,
+            "table_name": table_name,
+            "start": since.isoformat(),
+            "end": until.isoformat() if until else None,
+            "trend": trend,
+            "summary": summary,
+            "count": len(trend)
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get replication event trend: {e}", exc_info=True)
+        return {"pipeline_id": pipeline_id, "trend": [], "summary": None}
+
+
 @app.get("/api/v1/monitoring/event-logger-status")
 @app.get("/api/monitoring/event-logger-status")
 async def get_event_logger_status(db: Session = Depends(get_db)) -> Dict[str, Any]:
@@ -9968,7 +10060,7 @@ async def get_event_logger_status(db: Session = Depends(get_db)) -> Dict[str, An
         # Get logger state
         is_running = event_logger._running if hasattr(event_logger, '_running') else False
         subscribed_topics = list(event_logger._subscribed_topics) if hasattr(event_logger, '_subscribed_topics') else []
-        pipeline_mapping = dict(event_logger._pipeline_topic_mapping) if hasattr(event_logger, '_pipeline_topic_mapping') else {}
+        pipeline_mapping = event_logger.get_topic_mapping() if hasattr(event_logger, 'get_topic_mapping') else {}
         
         # Check if consumer is active
         consumer_active = event_logger._consumer is not None if hasattr(event_logger, '_consumer') else False
@@ -0,0 +1,173 @@
+"""Adaptive batch sizing for full loads."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Rows of a batch sampled to estimate the row size
+ROW_SAMPLE_SIZE = 50
+
+# Assumed size of LOB values, whose length is unknown until they are read
+LOB_ESTIMATE_BYTES = 64 * 1024
+
+# Weight of the newest observation in the row size and throughput averages
+SMOOTHING = 0.3
+
+
+def estimate_value_bytes(value: Any) -> int:
+    """Estimate the in-flight size of one column value."""
+    if value is None or isinstance(value, bool):
+        return 1
+    if isinstance(value, (int, float)):
+        return 8
+    if isinstance(value, (str, bytes, bytearray, memoryview)):
+        return len(value)
+    if isinstance(value, (Decimal, datetime, date, dt_time)):
+        return 16
+    if hasattr(value, "read"):
+        return LOB_ESTIMATE_BYTES
+    return len(str(value))
+
+
+def estimate_row_bytes(row: Sequence[Any]) -> int:
+    """Estimate the in-flight size of one row."""
+    return sum(estimate_value_bytes(value) for value in row)
+
+
+def estimate_batch_bytes(rows: Sequence[Sequence[Any]]) -> int:
+    """Estimate the in-flight size of a batch from a sample of its rows."""
+    if not rows:
+        return 0
+    step = max(1, len(rows) // ROW_SAMPLE_SIZE)
+    sample = rows[::step][:ROW_SAMPLE_SIZE]
+    return int(sum(estimate_row_bytes(row) for row in sample) * len(rows) / len(sample))
+
+
+class AdaptiveBatchSizer:
+    """Chooses the number of rows per batch from row width and write latency.
+
+    The batch size is the smaller of the number of rows that fit in
+    ``target_bytes`` (from a running estimate of the row size, sampled from
+    the batches read) and the number of rows the target writes in
+    ``target_seconds`` (from a running estimate of the write throughput),
+    kept within ``min_size`` and ``max_size``. It moves by at most a factor
+    of two per observation, so one slow batch does not collapse it.
+
+    Readers take ``batch_size`` before every fetch; the copy reports the
+    rows it read with ``observe_rows`` and each write with
+    ``observe_write``. A sizer may be shared by the workers of one table.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 10000,
+        min_size: int = 500,
+        max_size: int = 100000,
+        target_bytes: int = 8 * 1024 * 1024,
+        target_seconds: float = 2.0,
+        adaptive: bool = True
+    ):
+        """Initialize batch sizer.
+
+        Args:
+            initial_size: Batch size until the first batches are observed
+            min_size: Smallest batch size
+            max_size: Largest batch size
+            target_bytes: Target (estimated) size of a batch in bytes
+            target_seconds: Target time to write one batch
+            adaptive: False keeps ``initial_size`` for every batch
+        """
+        self.min_size = max(1, int(min_size))
+        self.max_size = max(self.min_size, int(max_size))
+        self.target_bytes = max(1, int(target_bytes))
+        self.target_seconds = max(0.001, float(target_seconds))
+        self.adaptive = adaptive
+        self.row_bytes: Optional[float] = None
+        self.rows_per_second: Optional[float] = None
+        self._size = int(initial_size) if not adaptive else self._clamp(initial_size)
+        self._lock = threading.Lock()
+
+    @property
+    def batch_size(self) -> int:
+        """Number of rows to read for the next batch."""
+        return self._size
+
+    def observe_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Update the row size estimate from a batch read from the source."""
+        if not self.adaptive or not rows:
+            return
+        self.observe_row_bytes(estimate_batch_bytes(rows) / len(rows))
+
+    def observe_row_bytes(self, row_bytes: float) -> None:
+        """Update the row size estimate from a measured average row size (e.g. of an Arrow batch)."""
+        if not self.adaptive or row_bytes <= 0:
+            return
+        row_bytes = max(1.0, float(row_bytes))
+        with self._lock:
+            self.row_bytes = row_bytes if self.row_bytes is None else self._smooth(self.row_bytes, row_bytes)
+            self._adjust()
+
+    def observe_write(self, row_count: int, seconds: float) -> None:
+        """Update the write throughput estimate from one written batch."""
+        if not self.adaptive or row_count <= 0 or seconds <= 0.001:
+            return
+        rows_per_second = row_count / seconds
+        with self._lock:
+            self.rows_per_second = (
+                rows_per_second if self.rows_per_second is None
+                else self._smooth(self.rows_per_second, rows_per_second)
+            )
+            self._adjust()
+
+    def _smooth(self, current: float, observed: float) -> float:
+        return (1 - SMOOTHING) * current + SMOOTHING * observed
+
+    def _clamp(self, size: float) -> int:
+        return int(max(self.min_size, min(self.max_size, size)))
+
+    def _adjust(self) -> None:
+        desired = float(self.max_size)
+        if self.row_bytes:
+            desired = min(desired, self.target_bytes / self.row_bytes)
+        if self.rows_per_second:
+            desired = min(desired, self.rows_per_second * self.target_seconds)
+        desired = max(self._size / 2, min(self._size * 2, desired))
+        size = self._clamp(desired)
+        if size != self._size:
+            logger.debug(
+                f"Batch size {self._size} -> {size} (row size ~{int(self.row_bytes or 0)} bytes, "
+                f"~{int(self.rows_per_second or 0)} rows/s written)"
+            )
+            self._size = size
+
+
+def create_batch_sizer(options: Optional[Dict[str, Any]] = None, batch_size: int = 10000) -> AdaptiveBatchSizer:
+    """Create the batch sizer of a full load.
+
+    Args:
+        options: Pipeline full_load_config; recognised keys:
+            - batch_size: initial (or, when not adaptive, fixed) batch size (default: ``batch_size``)
+            - adaptive_batch_size: adapt the batch size while loading (default: True)
+            - min_batch_size / max_batch_size: batch size bounds (default: 500 / 100000)
+            - target_batch_bytes: target batch size in bytes (default: 8 MB)
+            - target_batch_seconds: target time to write one batch (default: 2.0)
+        batch_size: Initial batch size when the options do not set one
+
+    Returns:
+        AdaptiveBatchSizer instance
+    """
+    options = options or {}
+    return AdaptiveBatchSizer(
+        initial_size=int(options.get("batch_size", batch_size)),
+        min_size=int(options.get("min_batch_size", 500)),
+        max_size=int(options.get("max_batch_size", 100000)),
+        target_bytes=int(options.get("target_batch_bytes", 8 * 1024 * 1024)),
+        target_seconds=float(options.get("target_batch_seconds", 2.0)),
+        adaptive=bool(options.get("adaptive_batch_size", True))
+    )
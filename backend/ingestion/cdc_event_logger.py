@@ -1,11 +1,13 @@
 """CDC Event Logger - Consumes Kafka messages and logs CDC events to database.
 
 This service listens to Kafka topics and logs individual CDC events (insert/update/delete)
-to the pipeline_runs table for monitoring purposes.
+to the pipeline_runs table for monitoring purposes, and per-minute counts of them to the
+cdc_event_rollups table.
 """
 
-import json
 import logging
+import os
+import random
 import threading
 import time
 import uuid
@@ -14,6 +16,12 @@ from typing import Any, Dict, List, Optional, Set
 from contextlib import contextmanager
 import socket
 
+from ingestion.event_decoding import decode_debezium_value
+from ingestion.event_rollups import aggregate_events, upsert_rollups
+from ingestion.event_workers import PartitionWorkerPool
+from ingestion.event_writer import CDCEventWriter
+from ingestion.topic_resolver import TopicResolver
+
 logger = logging.getLogger(__name__)
 
 # CRITICAL: Monkeypatch socket.getaddrinfo to resolve 'kafka' hostname to the bootstrap IP
@@ -37,17 +45,51 @@ logger.info("✅ Applied DNS patch for 'kafka' hostname resolution")
 
 # Import Kafka consumer
 try:
-    from kafka import KafkaConsumer
+    from kafka import ConsumerRebalanceListener, KafkaConsumer
     from kafka.errors import KafkaError, NoBrokersAvailable
+    from kafka.structs import OffsetAndMetadata
     KAFKA_AVAILABLE = True
 except ImportError:
     logger.warning("kafka-python not installed. CDC event logging will be disabled.")
     KAFKA_AVAILABLE = False
     KafkaConsumer = None
+    ConsumerRebalanceListener = object
+    OffsetAndMetadata = None
     KafkaError = Exception
     NoBrokersAvailable = Exception
 
 
+class _WorkerPoolRebalanceListener(ConsumerRebalanceListener):
+    """Hands partitions revoked in a rebalance back from the worker pool.
+
+    Runs on the consumer thread inside poll(), before the partitions are
+    reassigned: the events of the revoked partitions the workers persisted
+    are committed while this member still owns them, and nothing more of
+    them is committed afterwards, so their new owner neither logs those
+    events again nor has its offsets overwritten.
+    """
+
+    def __init__(self, event_logger: "CDCEventLogger", pool: PartitionWorkerPool, pending_offsets: Dict[Any, int]):
+        self.event_logger = event_logger
+        self.pool = pool
+        self.pending_offsets = pending_offsets
+
+    def on_partitions_revoked(self, revoked):
+        revoked = set(revoked)
+        if not revoked:
+            return
+        self.pool.revoke(revoked)
+        self.pending_offsets.update(self.pool.persisted_offsets())
+        revoked_offsets = {tp: offset for tp, offset in self.pending_offsets.items() if tp in revoked}
+        if revoked_offsets:
+            self.event_logger._commit_offsets(revoked_offsets)
+        for topic_partition in revoked:
+            self.pending_offsets.pop(topic_partition, None)
+
+    def on_partitions_assigned(self, assigned):
+        logger.info(f"CDC event logger assigned {len(assigned)} partitions")
+
+
 class CDCEventLogger:
     """Logs CDC events from Kafka topics to the database.
     
@@ -60,8 +102,14 @@ class CDCEventLogger:
         kafka_bootstrap_servers: str = "72.61.233.209:9092",
         consumer_group_id: str = "cdc-event-logger",
         db_session_factory = None,
-        max_batch_size: int = 50,
-        batch_timeout_seconds: float = 1.0
+        max_batch_size: int = 5000,
+        batch_timeout_seconds: float = 1.0,
+        write_method: str = "auto",
+        raw_event_sample_rate: float = 1.0,
+        lazy_decoding: bool = True,
+        store_raw_values: bool = False,
+        num_workers: int = 1,
+        max_poll_records: int = 500
     ):
         """Initialize the CDC Event Logger.
         
@@ -71,18 +119,42 @@ class CDCEventLogger:
             db_session_factory: SQLAlchemy session factory function
             max_batch_size: Maximum events to batch before committing
             batch_timeout_seconds: Max time to wait before committing a batch
+            write_method: How batches are written to pipeline_runs: "copy"
+                (PostgreSQL COPY), "insert" (multi-row INSERT) or "auto"
+                (COPY on PostgreSQL); see ingestion.event_writer
+            raw_event_sample_rate: Fraction of events also written as raw
+                pipeline_runs rows (1.0 = all, 0 = none); every event is
+                counted in cdc_event_rollups
+            lazy_decoding: Decode only the payload of JSON converter
+                messages, skipping their schema block (see
+                ingestion.event_decoding)
+            store_raw_values: Keep the raw message value in the event's
+                run_metadata (raw_value)
+            num_workers: Worker threads parsing and persisting events, each
+                owning a share of the partitions (1 = consumer thread only;
+                see ingestion.event_workers)
+            max_poll_records: Maximum messages returned by one Kafka poll
         """
         self.kafka_bootstrap_servers = kafka_bootstrap_servers
         self.consumer_group_id = consumer_group_id
         self.db_session_factory = db_session_factory
         self.max_batch_size = max_batch_size
         self.batch_timeout_seconds = batch_timeout_seconds
+        self._writer = CDCEventWriter(write_method)
+        self.raw_event_sample_rate = min(max(raw_event_sample_rate, 0.0), 1.0)
+        self.lazy_decoding = lazy_decoding
+        self.store_raw_values = store_raw_values
+        self.num_workers = max(num_workers, 1)
+        self.max_poll_records = max_poll_records
         
         self._consumer: Optional[KafkaConsumer] = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._subscribed_topics: Set[str] = set()
-        self._pipeline_topic_mapping: Dict[str, str] = {}  # topic -> pipeline_id
+        self._rebalance_listener: Optional[_WorkerPoolRebalanceListener] = None
+        self._topic_resolver = TopicResolver(
+            loader=self._load_topic_mapping if db_session_factory else None
+        )
         self._lock = threading.Lock()
         
     def start(self, topics: Optional[List[str]] = None, pipeline_mapping: Optional[Dict[str, str]] = None):
@@ -103,7 +175,7 @@ class CDCEventLogger:
         if topics:
             self._subscribed_topics = set(topics)
         if pipeline_mapping:
-            self._pipeline_topic_mapping = pipeline_mapping
+            self._topic_resolver.set_mapping(pipeline_mapping)
             
         self._running = True
         self._thread = threading.Thread(target=self._run_consumer, daemon=True)
@@ -111,6 +183,31 @@ class CDCEventLogger:
         logger.info(f"CDC Event Logger started for topics: {self._subscribed_topics}")
         return True
         
+    def get_topic_mapping(self) -> Dict[str, str]:
+        """Get the registered topic to pipeline ID mapping."""
+        return self._topic_resolver.mapping()
+        
+    def _load_topic_mapping(self) -> Dict[str, str]:
+        """Load the topic to pipeline ID mapping of all pipelines from the database."""
+        from ingestion.database.models_db import PipelineModel
+        
+        db = self.db_session_factory()
+        try:
+            pipelines = db.query(PipelineModel.id, PipelineModel.kafka_topics).filter(
+                PipelineModel.deleted_at.is_(None),
+                PipelineModel.kafka_topics.isnot(None)
+            ).all()
+        finally:
+            db.close()
+        
+        mapping = {}
+        for pipeline_id, kafka_topics in pipelines:
+            # Handle both list and JSON formats
+            for topic in (kafka_topics if isinstance(kafka_topics, list) else []):
+                if topic:
+                    mapping.setdefault(topic, str(pipeline_id))
+        return mapping
+        
     def stop(self):
         """Stop the event logger."""
         self._running = False
@@ -135,13 +232,13 @@ class CDCEventLogger:
         
         with self._lock:
             self._subscribed_topics.add(topic)
-            self._pipeline_topic_mapping[topic] = pipeline_id_str
+            self._topic_resolver.add(topic, pipeline_id_str)
             logger.info(f"✅ Added topic mapping: {topic} → {pipeline_id_str} (total topics: {len(self._subscribed_topics)})")
             
         # If consumer is running, update subscription
         if self._consumer and self._running:
             try:
-                self._consumer.subscribe(list(self._subscribed_topics))
+                self._subscribe(list(self._subscribed_topics))
                 logger.info(f"✅ Updated consumer subscription to include topic {topic} (total: {len(self._subscribed_topics)})")
             except Exception as e:
                 logger.warning(f"Failed to update subscription with new topic {topic}: {e}")
@@ -158,16 +255,23 @@ class CDCEventLogger:
         """
         with self._lock:
             self._subscribed_topics.discard(topic)
-            self._pipeline_topic_mapping.pop(topic, None)
+            self._topic_resolver.remove(topic)
             
         # If consumer is running, update subscription
         if self._consumer and self._running and self._subscribed_topics:
             try:
-                self._consumer.subscribe(list(self._subscribed_topics))
+                self._subscribe(list(self._subscribed_topics))
                 logger.info(f"Removed topic {topic} from CDC event logger")
             except Exception as e:
                 logger.warning(f"Failed to update subscription after removing topic {topic}: {e}")
     
+    def _subscribe(self, topics: List[str]):
+        """Subscribe the consumer to topics, with the rebalance listener of the worker pool if any."""
+        if self._rebalance_listener is not None:
+            self._consumer.subscribe(topics, listener=self._rebalance_listener)
+        else:
+            self._consumer.subscribe(topics)
+            
     def _run_consumer(self):
         """Main consumer loop (runs in background thread)."""
         retry_count = 0
@@ -184,10 +288,10 @@ class CDCEventLogger:
                     auto_offset_reset='earliest',
   # Start from earliest if no offset exists, then use committed offsets
                     enable_auto_commit=False,
-                    value_deserializer=lambda m: json.loads(m.decode('utf-8')) if m else None,
-                    key_deserializer=lambda m: json.loads(m.decode('utf-8')) if m else None,
+                    # Values stay raw bytes until _parse_debezium_message decodes their payload;
+                    # keys are never needed
                     consumer_timeout_ms=1000,  # 1 second timeout for poll
-                    max_poll_records=100,
+                    max_poll_records=self.max_poll_records,
                     session_timeout_ms=30000,
                     heartbeat_interval_ms=10000
                 )
@@ -198,7 +302,7 @@ class CDCEventLogger:
                     topics = list(self._subscribed_topics)
                     
                 if topics:
-                    self._consumer.subscribe(topics)
+                    self._subscribe(topics)
                     logger.info(f"CDC Event Logger subscribed to topics: {topics}")
                 else:
                     logger.info("CDC Event Logger waiting for topics to be added...")
@@ -206,7 +310,10 @@ class CDCEventLogger:
                 retry_count = 0  # Reset retry count on successful connection
                 
                 # Main processing loop
-                self._process_messages()
+                if self.num_workers > 1:
+                    self._process_messages_parallel()
+                else:
+                    self._process_messages()
                 
             except NoBrokersAvailable as e:
                 retry_count += 1
@@ -235,7 +342,7 @@ class CDCEventLogger:
                     current_topics = list(self._subscribed_topics)
                     
                 if current_topics and self._consumer.subscription() != set(current_topics):
-                    self._consumer.subscribe(current_topics)
+                    self._subscribe(current_topics)
                     logger.info(f"Updated subscription to: {current_topics}")
                     
                 # Poll for messages
@@ -272,9 +379,14 @@ class CDCEventLogger:
                 current_time = time.time()
                 if batch and (len(batch) >= self.max_batch_size or 
                               current_time - batch_start_time >= self.batch_timeout_seconds):
-                    self._commit_batch(batch)
-                    self._consumer.commit()
-                    batch = []
+                    # Offsets are committed only once the batch is persisted; a failed batch is
+                    # retried with fetching paused, so it does not grow meanwhile
+                    if self._commit_batch(batch):
+                        self._consumer.commit()
+                        batch = []
+                        self._pause_partitions(set())
+                    else:
+                        self._pause_partitions(self._consumer.assignment())
                     batch_start_time = current_time
                     
             except Exception as e:
@@ -282,22 +394,128 @@ class CDCEventLogger:
                 # Commit any pending events before continuing
                 if batch:
                     try:
-                        self._commit_batch(batch)
-                        self._consumer.commit()
+                        if self._commit_batch(batch):
+                            self._consumer.commit()
+                            batch = []
+                            self._pause_partitions(set())
+                        else:
+                            self._pause_partitions(self._consumer.assignment())
                     except Exception as commit_error:
                         logger.error(f"Failed to commit batch after error: {commit_error}")
-                    batch = []
                     batch_start_time = time.time()
                 time.sleep(1)  # Brief pause before retrying
                 
         # Final commit
-        if batch:
-            self._commit_batch(batch)
+        if batch and self._commit_batch(batch):
             try:
                 self._consumer.commit()
             except Exception:
                 pass
                 
+    def _process_messages_parallel(self):
+        """Process messages from Kafka on a pool of partition workers.
+        
+        Partitions revoked in a rebalance are released from the pool by a
+        rebalance listener (_WorkerPoolRebalanceListener).
+        """
+        pool = PartitionWorkerPool(
+            num_workers=self.num_workers,
+            parse=self._parse_debezium_message,
+            persist=self._commit_batch,
+            max_batch_size=self.max_batch_size,
+            batch_timeout_seconds=self.batch_timeout_seconds
+        )
+        pool.start()
+        pending_offsets = {}
+        # Release revoked partitions from the pool on rebalance; re-subscribe to register the listener
+        self._rebalance_listener = _WorkerPoolRebalanceListener(self, pool, pending_offsets)
+        if self._consumer.subscription():
+            self._subscribe(list(self._consumer.subscription()))
+        
+        try:
+            while self._running:
+                try:
+                    # Check if topics need to be updated
+                    with self._lock:
+                        current_topics = list(self._subscribed_topics)
+                        
+                    if current_topics and self._consumer.subscription() != set(current_topics):
+                        self._subscribe(current_topics)
+                        logger.info(f"Updated subscription to: {current_topics}")
+                        
+                    # Pause the partitions of workers that are behind or retrying a failed batch
+                    self._pause_partitions(pool.saturated_partitions())
+                    
+                    # Poll for messages and hand each partition's messages to its worker
+                    message_batch = self._consumer.poll(timeout_ms=1000)
+                    for topic_partition, messages in message_batch.items():
+                        logger.debug(f"Dispatching {len(messages)} messages from topic {topic_partition.topic}, partition {topic_partition.partition}")
+                        pool.submit(topic_partition, messages)
+                    
+                    # Commit the offsets of the partitions whose events the workers persisted
+                    pending_offsets.update(pool.persisted_offsets())
+                    if pending_offsets and self._commit_offsets(pending_offsets):
+                        pending_offsets.clear()
+                        
+                except Exception as e:
+                    logger.error(f"Error processing Kafka messages: {e}", exc_info=True)
+                    time.sleep(1)  # Brief pause before retrying
+        finally:
+            pool.stop()
+            pending_offsets.update(pool.persisted_offsets())
+            if pending_offsets:
+                self._commit_offsets(pending_offsets)
+            self._rebalance_listener = None
+                
+    def _pause_partitions(self, partitions: Set[Any]):
+        """Pause fetching the given assigned partitions and resume all others.
+        
+        Polling continues while partitions are paused, keeping the consumer
+        in its group.
+        
+        Args:
+            partitions: TopicPartitions to pause
+        """
+        assigned = self._consumer.assignment()
+        partitions = set(partitions) & assigned
+        paused = set(self._consumer.paused()) & assigned
+        if partitions - paused:
+            self._consumer.pause(*(partitions - paused))
+            logger.warning(f"Paused fetching {len(partitions - paused)} partitions until their events are persisted")
+        if paused - partitions:
+            self._consumer.resume(*(paused - partitions))
+            logger.info(f"Resumed fetching {len(paused - partitions)} partitions")
+            
+    def _commit_offsets(self, offsets: Dict[Any, int]) -> bool:
+        """Commit persisted offsets of partitions.
+        
+        Offsets of partitions no longer assigned to the consumer are not
+        committed; they belong to the partitions' new owner.
+        
+        Args:
+            offsets: TopicPartition to the next offset to consume
+            
+        Returns:
+            True if committed
+        """
+        assigned = self._consumer.assignment()
+        unassigned = [topic_partition for topic_partition in offsets if topic_partition not in assigned]
+        if unassigned:
+            logger.info(f"Not committing offsets of {len(unassigned)} partitions no longer assigned")
+        offsets = {topic_partition: offset for topic_partition, offset in offsets.items() if topic_partition in assigned}
+        if not offsets:
+            return True
+        try:
+            self._consumer.commit(offsets={
+                topic_partition: OffsetAndMetadata(offset, "", -1)
+                for topic_partition, offset in offsets.items()
+            })
+            return True
+        except Exception as e:
+            # Partitions revoked in a rebalance cannot be committed; their events are consumed again
+            logger.warning(f"Failed to commit offsets of {len(offsets)} partitions: {e}")
+            return False
+                
     def _parse_debezium_message(self, message) -> Optional[Dict[str, Any]]:
         """Parse a Debezium message and extract CDC event information.
         
@@ -309,125 +527,28 @@ class CDCEventLogger:
         """
         try:
             topic = message.topic
-            value = message.value
+            raw_value = message.value
             
-            if not value:
+            if not raw_value:
                 logger.debug(f"Message from topic {topic} has no value")
                 return None
-            
-            # Log raw message structure for debugging
-            if isinstance(value, dict):
-                logger.debug(f"Message from topic {topic} has keys: {list(value.keys())}")
-            else:
-                logger.debug(f"Message from topic {topic} value type: {type(value)}")
                 
-            # Get pipeline ID from topic mapping
-            pipeline_id = self._pipeline_topic_mapping.get(topic)
+            # Get pipeline ID from topic mapping (no database access per message)
+            pipeline_id = self._topic_resolver.resolve(topic)
             if not pipeline_id:
-                # Try to find pipeline by topic prefix or partial match
-                for mapped_topic, pid in self._pipeline_topic_mapping.items():
-                    # Try exact match first
-                    if topic == mapped_topic:
-                        pipeline_id = pid
-                        break
-                    # Try prefix match
-                    topic_parts = topic.split('.')
-                    mapped_parts = mapped_topic.split('.')
-                    if len(topic_parts) > 0 and len(mapped_parts) > 0:
-                        if topic_parts[0] == mapped_parts[0] or topic.startswith(mapped_parts[0]):
-                            pipeline_id = pid
-                            logger.info(f"Matched topic {topic} to pipeline {pid} via prefix {mapped_parts[0]}")
-                            break
-                        
-            if not pipeline_id:
-                logger.warning(f"⚠️  No pipeline mapping found for topic {topic}. Available mappings: {list(self._pipeline_topic_mapping.keys())}")
-                
-                # CRITICAL FIX: Try to lookup pipeline_id from database using topic name
-                # This is a fallback if topic mapping wasn't set up correctly
-                try:
-                    if self.db_session_factory:
-                        from ingestion.database.models_db import PipelineModel
-                        from sqlalchemy import text
-                        db = self.db_session_factory()
-                        try:
-                            # CRITICAL FIX: Query pipeline by kafka_topics JSONB array containing this topic
-                            # PostgreSQL JSONB array query: check if topic exists in the array
-                            # Works for both JSON and JSONB columns
-                            # CRITICAL FIX: Query pipeline by kafka_topics JSON/JSONB array containing this topic
-                            # Try PostgreSQL JSONB operator first (if using JSONB column)
-                            pipeline = None
-                            try:
-                                # PostgreSQL JSONB contains operator: @> checks if array contains value
-                                topic_json = json.dumps([topic])
-                                pipeline = db.query(PipelineModel).filter(
-                                    PipelineModel.deleted_at.is_(None),
-                                    text("kafka_topics::jsonb @> :topic_json").bindparam(topic_json=topic_json)
-                                ).first()
-                            except Exception as jsonb_error:
-                                # Fallback: Python-side filtering (works for JSON and JSONB)
-                                logger.debug(f"JSONB query failed, using Python-side filtering: {jsonb_error}")
-                            
-                            # Fallback: If JSONB query doesn't work or returned None, try Python-side filtering
-                            if not pipeline:
-                                all_pipelines = db.query(PipelineModel).filter(
-                                    PipelineModel.deleted_at.is_(None),
-                                    PipelineModel.kafka_topics.isnot(None)
-                                ).all()
-                                
-                                for p in all_pipelines:
-                                    if p.kafka_topics:
-                                        # Handle both list and JSON formats
-                                        topics_list = p.kafka_topics if isinstance(p.kafka_topics, list) else []
-                                        if topic in topics_list:
-                                            pipeline = p
-                                            break
-                            
-                            if pipeline:
-                                pipeline_id = str(pipeline.id)
-                                logger.info(f"✅ Found pipeline_id {pipeline_id} for topic {topic} via database lookup")
-                                # Cache it for future messages
-                                self._pipeline_topic_mapping[topic] = pipeline_id
-                            else:
-                                logger.error(f"❌ CRITICAL: No pipeline found in database for topic {topic}. Event will be skipped!")
-                                logger.error(f"   This means events from this topic will NOT be saved to database.")
-                                logger.error(f"   Available topics in database:")
-                                # Log available topics for debugging
-                                try:
-                                    all_pipelines = db.query(PipelineModel).filter(
-                                        PipelineModel.deleted_at.is_(None),
-                                        PipelineModel.kafka_topics.isnot(None)
-                                    ).all()
-                                    for p in all_pipelines:
-                                        if p.kafka_topics:
-                                            topics_list = p.kafka_topics if isinstance(p.kafka_topics, list) else []
-                                            logger.error(f"   Pipeline {p.id}: {topics_list}")
-                                except:
-                                    pass
-                                logger.error(f"   Please ensure topics are registered with Event Logger when pipeline starts.")
-                                return None
-                        finally:
-                            db.close()
-                    else:
-                        logger.error(f"❌ CRITICAL: No database session factory available. Cannot lookup pipeline_id for topic {topic}")
-                        return None
-                except Exception as db_error:
-                    logger.error(f"❌ Error looking up pipeline_id from database for topic {topic}: {db_error}")
-                    return None
+                return None
                 
             # Parse Debezium message format
             # Debezium messages have structure: {"schema": ..., "payload": {"before": ..., "after": ..., "source": ..., "op": ...}}
-            # Handle both wrapped and unwrapped formats
-            if isinstance(value, dict):
-                payload = value.get('payload', value)
-            else:
-                # If value is not a dict, try to parse as JSON string
-                try:
-                    if isinstance(value, str):
-                        value = json.loads(value)
-                    payload = value.get('payload', value) if isinstance(value, dict) else value
-                except (json.JSONDecodeError, AttributeError):
-                    logger.warning(f"Could not parse message value from topic {topic}: {type(value)}")
-                    return None
+            # Handle both wrapped and unwrapped formats; only the payload is decoded
+            try:
+                payload = decode_debezium_value(raw_value, lazy=self.lazy_decoding)
+            except ValueError:
+                logger.warning(f"Could not parse message value from topic {topic} at offset {message.offset}")
+                return None
+            if payload is None:
+                logger.debug(f"Message from topic {topic} has no payload")
+                return None
             
             # Get operation type - check multiple possible locations
             op = None
@@ -511,6 +632,11 @@ class CDCEventLogger:
             else:
                 event_time = datetime.utcnow()
             
+            # Source commit to event logger, for the rollups
+            latency_ms = None
+            if ts_ms:
+                latency_ms = max(int((datetime.utcnow() - event_time).total_seconds() * 1000), 0)
+            
             # Create event record
             event = {
                 'id': str(uuid.uuid4()),
@@ -532,27 +658,37 @@ class CDCEventLogger:
                     'partition': message.partition,
                     'offset': message.offset,
                     'source_ts_ms': ts_ms
-                }
+                },
+                # Rolled up only, not pipeline_runs columns
+                'event_bytes': len(raw_value),
+                'latency_ms': latency_ms
             }
             
+            if self.store_raw_values:
+                event['run_metadata']['raw_value'] = bytes(raw_value).decode('utf-8', errors='replace')
+            
             return event
             
         except Exception as e:
             logger.debug(f"Failed to parse Debezium message: {e}")
             return None
             
-    def _commit_batch(self, events: List[Dict[str, Any]]):
+    def _commit_batch(self, events: List[Dict[str, Any]]) -> bool:
         """Commit a batch of events to the database.
         
         Args:
             events: List of event dictionaries
+            
+        Returns:
+            False if the events could not be written (their offsets must not
+            be committed), True otherwise
         """
         if not events:
-            return
+            return True
             
         if not self.db_session_factory:
             logger.warning("No database session factory configured, cannot commit events")
-            return
+            return True
             
         # CRITICAL: Validate events before committing
         valid_events = []
@@ -573,56 +709,49 @@ class CDCEventLogger:
             
         if not valid_events:
             logger.warning("No valid events to commit (all events missing pipeline_id)")
-            return
+            return True
             
         try:
-            from ingestion.database.models_db import PipelineRunModel
+            if self.raw_event_sample_rate >= 1.0:
+                raw_events = valid_events
+            else:
+                raw_events = [event for event in valid_events if random.random() < self.raw_event_sample_rate]
+            rollups = aggregate_events(valid_events)
             
             session = self.db_session_factory()
             try:
-                # Group events by pipeline_id for logging
-                pipeline_counts = {}
-                for event in valid_events:
-                    pid = event['pipeline_id']
-                    pipeline_counts[pid] = pipeline_counts.get(pid, 0) + 1
-                
-                for event in valid_events:
-                    run = PipelineRunModel(
-                        id=event['id'],
-                        pipeline_id=event['pipeline_id'],
-                        run_type=event['run_type'],
-                        status=event['status'],
-                        started_at=event['started_at'],
-                        completed_at=event['completed_at'],
-                        rows_processed=event['rows_processed'],
-                        errors_count=event['errors_count'],
-                        run_metadata=event['run_metadata']
-                    )
-                    session.add(run)
-                    
+                # Raw events go out in one COPY or multi-row INSERT (before the
+                # rollups: a failed COPY rolls back the transaction)
+                written = self._writer.write(session, raw_events)
+                upsert_rollups(session, rollups)
                 session.commit()
-                logger.info(f"✅ Committed {len(valid_events)} CDC events to database (PipelineRunModel)")
-                logger.info(f"   Events by pipeline: {pipeline_counts}")
                 
                 # Log event type breakdown
                 event_counts = {}
                 pipeline_counts = {}
-                for event in events:
+                for event in valid_events:
                     et = event['run_metadata'].get('event_type', 'unknown')
                     event_counts[et] = event_counts.get(et, 0) + 1
-                    pid = event.get('pipeline_id', 'unknown')
+                    pid = event['pipeline_id']
                     pipeline_counts[pid] = pipeline_counts.get(pid, 0) + 1
+                logger.info(
+                    f"✅ Committed {len(valid_events)} CDC events to database "
+                    f"({written} to pipeline_runs, {len(rollups)} cdc_event_rollups rows)"
+                )
                 logger.info(f"Event breakdown by type: {event_counts}")
                 logger.info(f"Event breakdown by pipeline: {pipeline_counts}")
+                return True
                 
             except Exception as e:
                 session.rollback()
                 logger.error(f"Failed to commit events to database: {e}", exc_info=True)
+                return False
             finally:
                 session.close()
                 
         except Exception as e:
             logger.error(f"Database error in CDC event logger: {e}", exc_info=True)
+            return False
 
 
 # Global event logger instance
@@ -644,6 +773,11 @@ def initialize_event_logger(
         kafka_bootstrap_servers: Kafka bootstrap servers
         db_session_factory: SQLAlchemy session factory
         
+    The fraction of events kept as raw pipeline_runs rows is read from the
+    CDC_EVENT_RAW_SAMPLE_RATE environment variable (default 1.0, all), the
+    number of partition workers from CDC_EVENT_LOGGER_WORKERS (default 1)
+    and the poll size from CDC_EVENT_LOGGER_MAX_POLL_RECORDS (default 500).
+    
     Returns:
         CDCEventLogger instance or None if Kafka not available
     """
@@ -659,7 +793,10 @@ def initialize_event_logger(
         
     _event_logger = CDCEventLogger(
         kafka_bootstrap_servers=kafka_bootstrap_servers,
-        db_session_factory=db_session_factory
+        db_session_factory=db_session_factory,
+        raw_event_sample_rate=float(os.getenv("CDC_EVENT_RAW_SAMPLE_RATE", "1.0")),
+        num_workers=int(os.getenv("CDC_EVENT_LOGGER_WORKERS", "1")),
+        max_poll_records=int(os.getenv("CDC_EVENT_LOGGER_MAX_POLL_RECORDS", "500"))
     )
     
     return _event_logger
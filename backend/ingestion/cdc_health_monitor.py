@@ -581,6 +581,7 @@ class CDCHealthMonitor:
             kafka_topics=pipeline_model.kafka_topics,
             debezium_config=pipeline_model.debezium_config,
             sink_config=pipeline_model.sink_config,
+            full_load_config=pipeline_model.full_load_config,
             status=pipeline_model.status.value if hasattr(pipeline_model.status, 'value') else str(pipeline_model.status),
             created_at=pipeline_model.created_at,
             updated_at=pipeline_model.updated_at
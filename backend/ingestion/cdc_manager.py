@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
@@ -14,12 +15,20 @@ from ingestion.models import Connection, Pipeline, PipelineStatus, FullLoadStatu
 from ingestion.kafka_connect_client import KafkaConnectClient
 from ingestion.debezium_config import DebeziumConfigGenerator
 from ingestion.sink_config import SinkConfigGenerator
-from ingestion.transfer import DataTransfer
+from ingestion.batching import AdaptiveBatchSizer, create_batch_sizer, estimate_batch_bytes
+from ingestion.checkpoints import FullLoadCheckpointStore
+from ingestion.columnar import columnar_enabled
+from ingestion.progress import PERSIST_INTERVAL_SECONDS, FullLoadProgress, progress_registry
+from ingestion.transfer import DataTransfer, clone_connector, run_table_workers
+from ingestion.loaders import S3TableWriter, SnowflakeStageLoader
 from ingestion.connectors import SQLServerConnector, PostgreSQLConnector
 from ingestion.connectors.base_connector import BaseConnector
 from ingestion.schema_service import SchemaService
+from ingestion.table_stats import TableStatsCache, estimate_table_rows
 from ingestion.exceptions import FullLoadError, ValidationError
+from ingestion.reconciliation import reconcile_table
 from ingestion.validation import validate_source_data, validate_target_row_count
+from ingestion.watermarks import WatermarkStore
 
 logger = logging.getLogger(__name__)
 
@@ -162,6 +171,7 @@ class CDCManager:
                 pipeline_model.kafka_topics = pipeline.kafka_topics or []
                 pipeline_model.debezium_config = pipeline.debezium_config or {}
                 pipeline_model.sink_config = pipeline.sink_config or {}
+                pipeline_model.full_load_config = pipeline.full_load_config or {}
                 pipeline_model.updated_at = datetime.utcnow()
                 
                 # Set full_load_completed_at if full load is completed
@@ -349,11 +359,26 @@ class CDCManager:
                     self._persist_pipeline_status(pipeline)
                     logger.info("Step 1: Full load status set to IN_PROGRESS and persisted to database")
                     
-                    full_load_result = self._run_full_load(
-                        pipeline=pipeline,
-                        source_connection=source_connection,
-                        target_connection=target_connection
+                    # Live per-table progress for the progress endpoint, snapshotted to the metadata database
+                    progress = progress_registry.start(
+                        pipeline.id,
+                        tables=pipeline.source_tables,
+                        session_factory=_db_session_factory,
+                        persist_interval=float(
+                            (pipeline.full_load_config or {}).get("progress_persist_seconds", PERSIST_INTERVAL_SECONDS)
+                        )
                     )
+                    try:
+                        full_load_result = self._run_full_load(
+                            pipeline=pipeline,
+                            source_connection=source_connection,
+                            target_connection=target_connection,
+                            progress=progress
+                        )
+                    except Exception:
+                        progress.finish(success=False)
+                        raise
+                    progress.finish(success=full_load_result.get("success") is True)
                     
                     result["full_load"] = full_load_result
                     
@@ -395,6 +420,46 @@ class CDCManager:
                             rows_transferred=full_load_result.get('total_rows', 0)
                         )
             
+            # Incremental reload: copy the rows changed since the last run, CDC is not used
+            if mode == PipelineMode.INCREMENTAL_RELOAD:
+                logger.info(f"Step 1: Starting incremental reload for pipeline: {pipeline.name}")
+                pipeline.full_load_status = FullLoadStatus.IN_PROGRESS
+                self._persist_pipeline_status(pipeline)
+                progress = progress_registry.start(
+                    pipeline.id,
+                    tables=pipeline.source_tables,
+                    session_factory=_db_session_factory,
+                    persist_interval=float(
+                        (pipeline.full_load_config or {}).get("progress_persist_seconds", PERSIST_INTERVAL_SECONDS)
+                    )
+                )
+                try:
+                    reload_result = self._run_incremental_reload(
+                        pipeline=pipeline,
+                        source_connection=source_connection,
+                        target_connection=target_connection,
+                        progress=progress
+                    )
+                except Exception:
+                    progress.finish(success=False)
+                    pipeline.full_load_status = FullLoadStatus.FAILED
+                    self._persist_pipeline_status(pipeline)
+                    raise
+                progress.finish(success=True)
+                
+                result["full_load"] = reload_result
+                pipeline.full_load_status = FullLoadStatus.COMPLETED
+                pipeline.cdc_status = CDCStatus.NOT_STARTED
+                pipeline.status = PipelineStatus.RUNNING
+                result["status"] = "RUNNING"
+                result["message"] = (
+                    f"Incremental reload completed: {reload_result['total_rows']} rows copied. "
+                    f"CDC is disabled for this pipeline."
+                )
+                self._persist_pipeline_status(pipeline)
+                logger.info("Step 2: Pipeline running in INCREMENTAL_RELOAD mode (CDC disabled)")
+                return result
+            
             # If mode is FULL_LOAD_ONLY, skip CDC setup
             if mode == PipelineMode.FULL_LOAD_ONLY:
                 logger.info(f"Step 2: Pipeline mode is FULL_LOAD_ONLY, skipping CDC setup")
@@ -959,21 +1024,7 @@ class CDCManager:
                 logger.warning(f"Topic discovery incomplete (found {len(kafka_topics)} topics, expected {len(pipeline.source_tables)}), generating topic names as fallback...")
                 generated_topics = []
                 for table in pipeline.source_tables:
-                    # For Oracle, use UPPERCASE schema/table names (Debezium Oracle creates uppercase topics)
-                    if source_connection.database_type == "oracle":
-                        schema_upper = (pipeline.source_schema or "public").upper()
-                        table_upper = table.upper()
-                        topic_name = f"{pipeline.name}.{schema_upper}.{table_upper}"
-                    else:
-                        # SQL Server Debezium uses {topic.prefix}.{database}.{schema}.{table}; pass database
-                        source_db = pipeline.source_database or source_connection.database
-                        topic_name = DebeziumConfigGenerator.get_topic_name(
-                            pipeline_name=pipeline.name,
-                            schema=pipeline.source_schema or "public",
-                            table=table,
-                            database=source_db if source_connection.database_type in ("sqlserver", "mssql") else None
-                        )
-                    generated_topics.append(topic_name)
+                    generated_topics.append(self._get_table_topic_name(pipeline, source_connection, table))
                 
                 # Merge discovered topics with generated ones (avoid duplicates)
                 all_topics = list(kafka_topics)
@@ -993,19 +1044,7 @@ class CDCManager:
             if not kafka_topics:
                 logger.warning("⚠️  No Kafka topics available - generating from table list as last resort...")
                 for table in pipeline.source_tables:
-                    if source_connection.database_type == "oracle":
-                        schema_upper = (pipeline.source_schema or "public").upper()
-                        table_upper = table.upper()
-                        topic_name = f"{pipeline.name}.{schema_upper}.{table_upper}"
-                    else:
-                        source_db = pipeline.source_database or source_connection.database
-                        topic_name = DebeziumConfigGenerator.get_topic_name(
-                            pipeline_name=pipeline.name,
-                            schema=pipeline.source_schema or "public",
-                            table=table,
-                            database=source_db if source_connection.database_type in ("sqlserver", "mssql") else None
-                        )
-                    kafka_topics.append(topic_name)
+                    kafka_topics.append(self._get_table_topic_name(pipeline, source_connection, table))
                 pipeline.kafka_topics = kafka_topics
                 result["kafka_topics"] = kafka_topics
                 logger.warning(f"⚠️  Using generated topic names (topics may not exist yet in Kafka): {kafka_topics}")
@@ -1293,7 +1332,8 @@ class CDCManager:
         self,
         pipeline: Pipeline,
         source_connection: Connection,
-        target_connection: Connection
+        target_connection: Connection,
+        progress: Optional[FullLoadProgress] = None
     ) -> Dict[str, Any]:
         """Run full load for pipeline.
         
@@ -1301,28 +1341,19 @@ class CDCManager:
             pipeline: Pipeline object
             source_connection: Source connection
             target_connection: Target connection
+            progress: Full load progress tables report to (optional)
             
         Returns:
             Full load result dictionary
         """
+        source_connector = None
         try:
             # Initialize connectors
-            source_config = source_connection.get_connection_config()
             target_config = target_connection.get_connection_config()
+            source_connector = self._create_source_connector(source_connection)
             
-            if source_connection.database_type == "postgresql":
-                source_connector = PostgreSQLConnector(source_config)
-            elif source_connection.database_type in ["sqlserver", "mssql"]:
-                source_connector = SQLServerConnector(source_config)
-            elif source_connection.database_type in ["as400", "ibm_i", "db2"]:
-                # DB2 normalized to AS400 connector (same pyodbc/ODBC path); backend needs IBM i Access ODBC driver for full load
-                from ingestion.connectors.as400 import AS400Connector
-                source_connector = AS400Connector(source_config)
-            elif source_connection.database_type == "oracle":
-                from ingestion.connectors.oracle import OracleConnector
-                source_connector = OracleConnector(source_config)
-            else:
-                raise ValueError(f"Unsupported source database type: {source_connection.database_type}")
+            # With consistent_snapshot, tables are read as of one snapshot whose LSN is captured up front
+            snapshot_lsn_info = self._begin_full_load_snapshot(pipeline, source_connector)
             
             # Handle S3 target specially
             if target_connection.database_type == "s3":
@@ -1335,7 +1366,9 @@ class CDCManager:
                     source_connector=source_connector,
                     source_connection=source_connection,
                     target_connector=target_connector,
-                    target_connection=target_connection
+                    target_connection=target_connection,
+                    snapshot_lsn_info=snapshot_lsn_info,
+                    progress=progress
                 )
             
             # Handle Snowflake target - need to transfer data directly
@@ -1349,7 +1382,9 @@ class CDCManager:
                     pipeline=pipeline,
                     source_connector=source_connector,
                     target_connector=target_connector,
-                    target_connection=target_connection
+                    target_connection=target_connection,
+                    snapshot_lsn_info=snapshot_lsn_info,
+                    progress=progress
                 )
             
             if target_connection.database_type == "postgresql":
@@ -1362,6 +1397,9 @@ class CDCManager:
             else:
                 raise ValueError(f"Unsupported target database type: {target_connection.database_type}")
             
+            # Table statistics are gathered once and shared by validation, transfer and the checks below
+            table_stats = TableStatsCache(source_connector, pipeline.source_database, pipeline.source_schema)
+            
             # Verify source has data before transfer
             for table_name in pipeline.source_tables:
                 logger.info(f"Validating source data for table: {table_name}")
@@ -1370,7 +1408,8 @@ class CDCManager:
                         connector=source_connector,
                         database=pipeline.source_database,
                         schema=pipeline.source_schema,
-                        table_name=table_name
+                        table_name=table_name,
+                        stats=table_stats
                     )
                     if not validation_result.get('has_data'):
                         logger.warning(f"Source table {table_name} has no data, but continuing with transfer")
@@ -1378,13 +1417,32 @@ class CDCManager:
                     logger.warning(f"Source validation warning for {table_name}: {e}")
                     # Continue anyway - let transfer handle it
             
+            # Checkpoint committed chunks so an interrupted full load resumes instead of reloading
+            checkpoints = None
+            if _db_session_factory and (pipeline.full_load_config or {}).get("checkpoints", True):
+                checkpoints = FullLoadCheckpointStore(_db_session_factory, pipeline.id)
+                resume_lsn_info = checkpoints.get_resume_lsn_info()
+                if snapshot_lsn_info and resume_lsn_info:
+                    # Chunks copied by the interrupted run were read from its snapshot; CDC must start from there
+                    logger.info(f"Resuming full load started at LSN/offset {resume_lsn_info.get('lsn')}")
+                    snapshot_lsn_info = resume_lsn_info
+                checkpoints.lsn_info = snapshot_lsn_info
+            
             # Initialize data transfer
             logger.info("Initializing data transfer...")
-            transfer = DataTransfer(source_connector, target_connector)
+            transfer = DataTransfer(
+                source_connector, target_connector, pipeline.full_load_config, checkpoints, progress,
+                table_stats=table_stats
+            )
             
             # Transfer all tables
             logger.info(f"Transferring {len(pipeline.source_tables)} table(s): {pipeline.source_tables}")
-            logger.info(f"Transfer settings: schema=True, data=True, batch_size=10000")
+            logger.info(
+                f"Transfer settings: schema=True, data=True, "
+                f"batch_size={(pipeline.full_load_config or {}).get('batch_size', 10000)} "
+                f"(adaptive={(pipeline.full_load_config or {}).get('adaptive_batch_size', True)}), "
+                f"max_parallel_tables={self._get_max_parallel_tables(pipeline)}"
+            )
             
             # Get default schema based on database type
             default_target_schema = (
@@ -1400,7 +1458,9 @@ class CDCManager:
                 target_schema=pipeline.target_schema or target_connection.schema or default_target_schema,
                 transfer_schema=True,  # Transfer schema (create tables if needed)
                 transfer_data=True,    # Transfer data
-                batch_size=10000
+                batch_size=10000,      # Initial batch size, adapted per table (full_load_config may override)
+                max_parallel_tables=self._get_max_parallel_tables(pipeline),
+                table_options=(pipeline.full_load_config or {}).get("tables")
             )
             
             logger.info(f"Transfer completed: {transfer_result.get('tables_successful', 0)} successful, {transfer_result.get('tables_failed', 0)} failed")
@@ -1411,46 +1471,42 @@ class CDCManager:
                 if t.get("errors") or t.get("error"):
                     failed_table_names.add(t.get("table_name", ""))
             
-            # Post-transfer validation: Verify target row counts (only for tables that transferred successfully)
+            # Post-transfer validation: Verify target row counts (only for tables that transferred successfully);
+            # full_load_config "validation": "checksum" reconciles row contents instead
+            reconcile = (pipeline.full_load_config or {}).get("validation") == "checksum"
             for table_name in pipeline.source_tables:
                 if table_name in failed_table_names:
                     logger.warning(f"Skipping validation for {table_name} (transfer had errors)")
                     continue
                 target_table_name = pipeline.target_table_mapping.get(table_name, table_name) if pipeline.target_table_mapping else table_name
+                target_schema_final, target_table_final = self._resolve_target_table(pipeline, target_connection, table_name)
                 
-                # Parse target_table_name to extract schema and table if it contains a dot
-                # This prevents double schema prefix (e.g., "dbo.dbo.department")
-                default_target_schema = (
-                    "dbo" if target_connection.database_type in ("sqlserver", "mssql")
-                    else "PUBLIC" if target_connection.database_type == "snowflake"
-                    else "public"
-                )
-                target_schema_final = pipeline.target_schema or target_connection.schema or default_target_schema
-                target_table_final = target_table_name
-                
-                # If target_table_name contains schema prefix (e.g., "dbo.department"), extract just the table name
-                if '.' in target_table_name:
-                    parts = target_table_name.split('.')
-                    if len(parts) == 2:
-                        # If schema matches, use just the table name; otherwise keep as is
-                        if parts[0].lower() == target_schema_final.lower():
-                            target_table_final = parts[1]
-                        # If schema doesn't match, use the provided schema and table
-                        # But validate schema matches database type
-                        else:
-                            extracted_schema = parts[0]
-                            # If SQL Server and extracted schema is "public", override to "dbo"
-                            if target_connection.database_type in ("sqlserver", "mssql") and extracted_schema.lower() == "public":
-                                logger.warning(f"Target table '{target_table_name}' has schema 'public' for SQL Server, overriding to 'dbo'")
-                                target_schema_final = "dbo"
-                                target_table_final = parts[1]
-                            else:
-                                target_schema_final = extracted_schema
-                                target_table_final = parts[1]
-                    elif len(parts) > 2:
-                        # Handle database.schema.table format - extract schema and table
-                        target_schema_final = parts[-2]
-                        target_table_final = parts[-1]
+                if reconcile:
+                    # Compare row contents by key range instead of counting rows
+                    try:
+                        reconciliation = reconcile_table(
+                            source_connector=source_connector,
+                            target_connector=target_connector,
+                            source_database=pipeline.source_database,
+                            source_schema=pipeline.source_schema,
+                            source_table=table_name,
+                            target_database=pipeline.target_database or target_connection.database,
+                            target_schema=target_schema_final,
+                            target_table=target_table_final,
+                            **self._get_reconcile_options(pipeline)
+                        )
+                    except ValidationError as e:
+                        logger.warning(f"Skipping reconciliation of {target_table_name}: {e}")
+                        continue
+                    if not reconciliation["match"]:
+                        logger.warning(
+                            f"⚠️  Reconciliation of {target_table_name} found differences: "
+                            f"{reconciliation['missing_in_target_count']} rows missing in target, "
+                            f"{reconciliation['missing_in_source_count']} rows only in target, "
+                            f"{reconciliation['mismatched_count']} rows with different content. "
+                            f"Pipeline will continue; please verify data integrity manually."
+                        )
+                    continue
                 
                 logger.info(f"Validating target row count for table: {target_schema_final}.{target_table_final}")
                 try:
@@ -1537,21 +1593,16 @@ class CDCManager:
                 )
             
             # Check if rows were actually transferred (0 rows when tables were "successful" indicates failure)
-            # But first check if source actually has data
+            # But first check if source actually has data (counted exactly, statistics may be stale)
             source_has_data = False
-            for table_name in pipeline.source_tables:
-                try:
-                    validation_result = validate_source_data(
-                        connector=source_connector,
-                        database=pipeline.source_database,
-                        schema=pipeline.source_schema,
-                        table_name=table_name
-                    )
-                    if validation_result.get('has_data'):
-                        source_has_data = True
-                        break
-                except Exception:
-                    pass  # Ignore validation errors here
+            if transfer_result["total_rows_transferred"] == 0:
+                for table_name in pipeline.source_tables:
+                    try:
+                        if table_stats.count_rows(table_name) > 0:
+                            source_has_data = True
+                            break
+                    except Exception:
+                        pass  # Ignore validation errors here
             
             if transfer_result["total_rows_transferred"] == 0 and source_has_data:
                 error_msg = "Full load reported success but transferred 0 rows (source has data)"
@@ -1575,9 +1626,12 @@ class CDCManager:
             elif transfer_result["total_rows_transferred"] == 0:
                 logger.warning("Full load transferred 0 rows, but source tables appear to be empty (this may be OK)")
             
-            # Capture LSN after full load
-            logger.info("Capturing LSN after full load...")
-            lsn_info = source_connector.extract_lsn_offset(database=pipeline.source_database)
+            # Capture LSN after full load (unless captured at snapshot start)
+            if snapshot_lsn_info:
+                lsn_info = snapshot_lsn_info
+            else:
+                logger.info("Capturing LSN after full load...")
+                lsn_info = source_connector.extract_lsn_offset(database=pipeline.source_database)
             
             result = {
                 "success": True,
@@ -1588,6 +1642,9 @@ class CDCManager:
                 "timestamp": lsn_info.get("timestamp")
             }
             
+            if checkpoints is not None:
+                checkpoints.clear()
+            
             logger.info(f"Full load result: success=True, tables={result['tables_transferred']}, rows={result['total_rows']}, LSN={result['lsn']}")
             return result
             
@@ -1608,6 +1665,373 @@ class CDCManager:
                 rows_transferred=0,
                 error=str(e)
             )
+        finally:
+            if source_connector is not None:
+                source_connector.end_snapshot()
+    
+    def _create_source_connector(self, source_connection: Connection) -> BaseConnector:
+        """Create the connector a full load or incremental reload reads the source with.
+        
+        Args:
+            source_connection: Source connection
+            
+        Returns:
+            Source database connector
+        """
+        source_config = source_connection.get_connection_config()
+        if source_connection.database_type == "postgresql":
+            return PostgreSQLConnector(source_config)
+        if source_connection.database_type in ["sqlserver", "mssql"]:
+            return SQLServerConnector(source_config)
+        if source_connection.database_type in ["as400", "ibm_i", "db2"]:
+            # DB2 normalized to AS400 connector (same pyodbc/ODBC path); backend needs IBM i Access ODBC driver for full load
+            from ingestion.connectors.as400 import AS400Connector
+            return AS400Connector(source_config)
+        if source_connection.database_type == "oracle":
+            from ingestion.connectors.oracle import OracleConnector
+            return OracleConnector(source_config)
+        raise ValueError(f"Unsupported source database type: {source_connection.database_type}")
+    
+    def _run_incremental_reload(
+        self,
+        pipeline: Pipeline,
+        source_connection: Connection,
+        target_connection: Connection,
+        progress: Optional[FullLoadProgress] = None
+    ) -> Dict[str, Any]:
+        """Run one incremental reload for a pipeline without CDC.
+        
+        Every table is copied from its stored watermark on (see
+        DataTransfer._transfer_data_incremental): rows whose watermark column
+        is above the value stored by the previous run are upserted into the
+        target by primary key, and the first run copies the whole table.
+        
+        Args:
+            pipeline: Pipeline object (full_load_config sets "watermark_column")
+            source_connection: Source connection
+            target_connection: Target connection (PostgreSQL, SQL Server or Oracle)
+            progress: Progress tables report to (optional)
+            
+        Returns:
+            Reload result dictionary
+        """
+        try:
+            if not _db_session_factory:
+                raise FullLoadError("Incremental reload requires the metadata database to store watermarks")
+            
+            source_connector = self._create_source_connector(source_connection)
+            target_config = target_connection.get_connection_config()
+            if target_connection.database_type == "postgresql":
+                target_connector = PostgreSQLConnector(target_config)
+            elif target_connection.database_type in ["sqlserver", "mssql"]:
+                target_connector = SQLServerConnector(target_config)
+            elif target_connection.database_type == "oracle":
+                from ingestion.connectors.oracle import OracleConnector
+                target_connector = OracleConnector(target_config)
+            else:
+                raise FullLoadError(
+                    f"Incremental reload does not support {target_connection.database_type} targets "
+                    f"(rows are upserted by primary key)"
+                )
+            
+            transfer = DataTransfer(
+                source_connector, target_connector, pipeline.full_load_config, None, progress,
+                watermarks=WatermarkStore(_db_session_factory, pipeline.id)
+            )
+            default_target_schema = "dbo" if target_connection.database_type in ("sqlserver", "mssql") else "public"
+            transfer_result = transfer.transfer_tables(
+                tables=pipeline.source_tables,
+                source_database=pipeline.source_database,
+                source_schema=pipeline.source_schema,
+                target_database=pipeline.target_database or target_connection.database,
+                target_schema=pipeline.target_schema or target_connection.schema or default_target_schema,
+                transfer_schema=True,
+                transfer_data=True,
+                batch_size=10000,
+                max_parallel_tables=self._get_max_parallel_tables(pipeline),
+                table_options=(pipeline.full_load_config or {}).get("tables")
+            )
+            
+            failed_tables = [t for t in transfer_result.get("tables", []) if t.get("errors") or t.get("error")]
+            if failed_tables:
+                first_table = failed_tables[0]
+                error = first_table["errors"][0] if first_table.get("errors") else first_table.get("error")
+                raise FullLoadError(
+                    f"Incremental reload failed for {first_table.get('table_name', 'unknown')}: {error}",
+                    table_name=first_table.get("table_name"),
+                    rows_transferred=transfer_result.get("total_rows_transferred", 0)
+                )
+            
+            logger.info(
+                f"Incremental reload completed: {transfer_result['tables_successful']} tables, "
+                f"{transfer_result['total_rows_transferred']} rows"
+            )
+            return {
+                "success": True,
+                "tables_transferred": transfer_result["tables_successful"],
+                "total_rows": transfer_result["total_rows_transferred"]
+            }
+        except FullLoadError:
+            raise
+        except Exception as e:
+            logger.error(f"Incremental reload failed: {e}", exc_info=True)
+            raise FullLoadError(
+                f"Incremental reload failed: {str(e)}",
+                rows_transferred=0,
+                error=str(e)
+            )
+    
+    def _begin_full_load_snapshot(
+        self,
+        pipeline: Pipeline,
+        source_connector: BaseConnector
+    ) -> Optional[Dict[str, Any]]:
+        """Start a consistent source snapshot if the pipeline asks for one.
+        
+        Enabled with full_load_config "consistent_snapshot". The LSN/offset
+        returned is recorded as the CDC start position instead of the one
+        captured after the copy, so the source does not have to be paused.
+        
+        Args:
+            pipeline: Pipeline object
+            source_connector: Source database connector
+            
+        Returns:
+            LSN/offset dictionary of the snapshot, or None when disabled or
+            not supported by the source (LSN is then captured after the copy)
+        """
+        if not (pipeline.full_load_config or {}).get("consistent_snapshot"):
+            return None
+        try:
+            lsn_info = source_connector.begin_snapshot(database=pipeline.source_database)
+        except Exception as e:
+            logger.warning(f"Could not start consistent snapshot, capturing LSN after full load instead: {e}", exc_info=True)
+            return None
+        if not lsn_info:
+            logger.warning(
+                f"{type(source_connector).__name__} does not support consistent snapshots, "
+                f"capturing LSN after full load instead"
+            )
+            return None
+        logger.info(f"Full load reads a consistent snapshot, CDC will resume from LSN/offset {lsn_info.get('lsn')}")
+        return lsn_info
+    
+    def _write_full_load_batch(
+        self,
+        writer,
+        data_result: Dict[str, Any],
+        batch_sizer: AdaptiveBatchSizer,
+        progress: Optional[FullLoadProgress] = None,
+        table_name: Optional[str] = None
+    ) -> int:
+        """Write one batch of iter_rows or iter_record_batches to an S3 or Snowflake full load writer.
+        
+        Args:
+            writer: S3TableWriter or SnowflakeStageLoader
+            data_result: Batch with "rows", or "batch" (Arrow record batch) on the columnar path
+            batch_sizer: Batch sizer told the row size and the write time
+            progress: Full load progress the written batch is reported to (optional)
+            table_name: Source table name, for progress
+            
+        Returns:
+            Number of rows written
+        """
+        record_batch = data_result.get('batch')
+        if record_batch is not None:
+            byte_count = record_batch.nbytes
+            batch_sizer.observe_row_bytes(byte_count / max(1, record_batch.num_rows))
+            write_started = time.monotonic()
+            written = writer.write_record_batch(record_batch)
+        else:
+            rows = data_result.get('rows', [])
+            byte_count = estimate_batch_bytes(rows)
+            batch_sizer.observe_row_bytes(byte_count / max(1, len(rows)))
+            write_started = time.monotonic()
+            written = writer.write_rows(rows)
+        batch_sizer.observe_write(written, time.monotonic() - write_started)
+        if progress is not None:
+            progress.add_rows(table_name, written, byte_count)
+        return written
+    
+    def _start_table_progress(
+        self,
+        progress: Optional[FullLoadProgress],
+        connector: BaseConnector,
+        pipeline: Pipeline,
+        table_name: str
+    ) -> None:
+        """Report a table as copying, with its (estimated) source row count as the total to copy."""
+        if progress is None:
+            return
+        total_rows = None
+        try:
+            total_rows = estimate_table_rows(connector, pipeline.source_database, pipeline.source_schema, table_name)
+        except Exception as e:
+            logger.warning(f"Could not count rows of {table_name} for progress reporting: {e}")
+        progress.start_table(table_name, total_rows)
+    
+    def _resolve_target_table(
+        self,
+        pipeline: Pipeline,
+        target_connection: Connection,
+        table_name: str
+    ) -> Tuple[str, str]:
+        """Get the target schema and table a source table is copied to.
+        
+        Args:
+            pipeline: Pipeline object
+            target_connection: Target connection
+            table_name: Source table name
+            
+        Returns:
+            Tuple of (target schema, target table)
+        """
+        target_table_name = pipeline.target_table_mapping.get(table_name, table_name) if pipeline.target_table_mapping else table_name
+        
+        # Parse target_table_name to extract schema and table if it contains a dot
+        # This prevents double schema prefix (e.g., "dbo.dbo.department")
+        default_target_schema = (
+            "dbo" if target_connection.database_type in ("sqlserver", "mssql")
+            else "PUBLIC" if target_connection.database_type == "snowflake"
+            else "public"
+        )
+        target_schema_final = pipeline.target_schema or target_connection.schema or default_target_schema
+        target_table_final = target_table_name
+        
+        # If target_table_name contains schema prefix (e.g., "dbo.department"), extract just the table name
+        if '.' in target_table_name:
+            parts = target_table_name.split('.')
+            if len(parts) == 2:
+                # If schema matches, use just the table name; otherwise keep as is
+                if parts[0].lower() == target_schema_final.lower():
+                    target_table_final = parts[1]
+                # If schema doesn't match, use the provided schema and table
+                # But validate schema matches database type
+                else:
+                    extracted_schema = parts[0]
+                    # If SQL Server and extracted schema is "public", override to "dbo"
+                    if target_connection.database_type in ("sqlserver", "mssql") and extracted_schema.lower() == "public":
+                        logger.warning(f"Target table '{target_table_name}' has schema 'public' for SQL Server, overriding to 'dbo'")
+                        target_schema_final = "dbo"
+                        target_table_final = parts[1]
+                    else:
+                        target_schema_final = extracted_schema
+                        target_table_final = parts[1]
+            elif len(parts) > 2:
+                # Handle database.schema.table format - extract schema and table
+                target_schema_final = parts[-2]
+                target_table_final = parts[-1]
+        
+        return target_schema_final, target_table_final
+    
+    def _get_reconcile_options(self, pipeline: Pipeline) -> Dict[str, Any]:
+        """Get reconcile_table settings from the pipeline's full_load_config "reconciliation" object."""
+        settings = (pipeline.full_load_config or {}).get("reconciliation") or {}
+        options = {}
+        for name in ("num_ranges", "leaf_rows", "split_parts", "max_workers", "max_differences"):
+            if settings.get(name) is not None:
+                options[name] = int(settings[name])
+        return options
+    
+    def reconcile_pipeline(self, pipeline_id: str, tables: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Reconcile the source tables of a pipeline with their target copies.
+        
+        Every table is compared row by row by key ranges (see
+        ingestion.reconciliation.reconcile_table), tuned with the
+        full_load_config "reconciliation" settings.
+        
+        Args:
+            pipeline_id: Pipeline ID
+            tables: Source tables to reconcile (default: all pipeline tables)
+            
+        Returns:
+            Dictionary with match (all tables) and the result of every table
+            
+        Raises:
+            ValueError: If the pipeline or its connections are not found
+            ValidationError: If the source or target database is not supported
+        """
+        pipeline = self.pipeline_store.get(pipeline_id)
+        if not pipeline:
+            raise ValueError(f"Pipeline not found: {pipeline_id}")
+        source_connection = self.get_connection(pipeline.source_connection_id)
+        target_connection = self.get_connection(pipeline.target_connection_id)
+        if not source_connection or not target_connection:
+            raise ValueError("Source or target connection not found")
+        
+        source_connector = self._create_source_connector(source_connection)
+        target_config = target_connection.get_connection_config()
+        if target_connection.database_type == "postgresql":
+            target_connector = PostgreSQLConnector(target_config)
+        elif target_connection.database_type in ["sqlserver", "mssql"]:
+            target_connector = SQLServerConnector(target_config)
+        else:
+            raise ValidationError(
+                f"Reconciliation does not support {target_connection.database_type} targets",
+                validation_type="reconciliation"
+            )
+        
+        results = []
+        for table_name in tables or pipeline.source_tables:
+            target_schema, target_table = self._resolve_target_table(pipeline, target_connection, table_name)
+            try:
+                results.append(reconcile_table(
+                    source_connector=source_connector,
+                    target_connector=target_connector,
+                    source_database=pipeline.source_database,
+                    source_schema=pipeline.source_schema,
+                    source_table=table_name,
+                    target_database=pipeline.target_database or target_connection.database,
+                    target_schema=target_schema,
+                    target_table=target_table,
+                    **self._get_reconcile_options(pipeline)
+                ))
+            except ValidationError as e:
+                logger.warning(f"Cannot reconcile {table_name}: {e}")
+                results.append({"table": table_name, "match": None, "error": str(e)})
+        
+        return {
+            "pipeline_id": pipeline_id,
+            "match": all(result.get("match") is True for result in results),
+            "tables": results
+        }
+    
+    def _get_max_parallel_tables(self, pipeline: Pipeline) -> int:
+        """Get the number of tables a full load may process concurrently.
+        
+        Read from the pipeline's full_load_config ("max_parallel_tables"),
+        defaulting to 1 (sequential).
+        """
+        value = (pipeline.full_load_config or {}).get("max_parallel_tables", 1)
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid max_parallel_tables {value!r} for pipeline {pipeline.name}, using 1")
+            return 1
+    
+    def _get_table_topic_name(self, pipeline: Pipeline, source_connection: Connection, table: str) -> str:
+        """Get the Kafka topic name Debezium uses for a source table.
+        
+        Args:
+            pipeline: Pipeline object
+            source_connection: Source connection
+            table: Source table name
+            
+        Returns:
+            Kafka topic name
+        """
+        # For Oracle, use UPPERCASE schema/table names (Debezium Oracle creates uppercase topics)
+        if source_connection.database_type == "oracle":
+            schema_upper = (pipeline.source_schema or "public").upper()
+            return f"{pipeline.name}.{schema_upper}.{table.upper()}"
+        # SQL Server Debezium uses {topic.prefix}.{database}.{schema}.{table}; pass database
+        source_db = pipeline.source_database or source_connection.database
+        return DebeziumConfigGenerator.get_topic_name(
+            pipeline_name=pipeline.name,
+            schema=pipeline.source_schema or "public",
+            table=table,
+            database=source_db if source_connection.database_type in ("sqlserver", "mssql") else None
+        )
     
     def _run_full_load_to_s3(
         self,
@@ -1615,7 +2039,9 @@ class CDCManager:
         source_connector: BaseConnector,
         source_connection: Connection,
         target_connector: BaseConnector,
-        target_connection: Connection
+        target_connection: Connection,
+        snapshot_lsn_info: Optional[Dict[str, Any]] = None,
+        progress: Optional[FullLoadProgress] = None
     ) -> Dict[str, Any]:
         """Run full load from database to S3.
         
@@ -1624,11 +2050,12 @@ class CDCManager:
             source_connector: Source database connector
             target_connector: S3 connector
             target_connection: Target S3 connection
+            snapshot_lsn_info: LSN/offset of the consistent snapshot being read (optional)
+            progress: Full load progress tables report to (optional)
             
         Returns:
             Full load result dictionary
         """
-        import json
         from datetime import datetime
         
         try:
@@ -1640,12 +2067,26 @@ class CDCManager:
             tables_transferred = []
             total_rows = 0
             
-            # Process each table
-            for table_name in pipeline.source_tables:
+            max_parallel_tables = self._get_max_parallel_tables(pipeline)
+            parallel = max_parallel_tables > 1 and len(pipeline.source_tables) > 1
+            worker_local = threading.local()
+            full_load_config = pipeline.full_load_config or {}
+            # boto3 clients are thread-safe, so workers share one S3 client
+            s3_client = target_connector._get_s3_client()
+            
+            def load_table(table_name: str) -> int:
                 logger.info(f"Transferring table {table_name} to S3")
                 
+                # Each worker reads through its own source connector
+                table_source = source_connector
+                if parallel:
+                    table_source = getattr(worker_local, "source", None)
+                    if table_source is None:
+                        table_source = clone_connector(source_connector)
+                        worker_local.source = table_source
+                
                 # Extract schema
-                schema_result = source_connector.extract_schema(
+                schema_result = table_source.extract_schema(
                     database=pipeline.source_database,
                     schema=pipeline.source_schema,
                     table=table_name
@@ -1656,87 +2097,73 @@ class CDCManager:
                 tables = schema_result.get('tables', [])
                 if not tables:
                     logger.warning(f"Could not extract schema for {table_name}: No tables found in schema result")
-                    continue
+                    return 0
                 
                 # Get columns from the first table (should be the requested table)
                 columns = tables[0].get('columns', []) if tables else []
                 if not columns:
                     logger.warning(f"Could not extract columns for {table_name}: No columns found")
-                    continue
-                
-                # Extract data in batches
-                batch_size = 10000
-                offset = 0
-                all_rows = []
-                column_names = None
-                
-                while True:
-                    try:
-                        data_result = source_connector.extract_data(
-                            database=pipeline.source_database,
-                            schema=pipeline.source_schema,
-                            table_name=table_name,
-                            limit=batch_size,
-                            offset=offset
-                        )
-                    except Exception as e:
-                        logger.error(f"Error extracting data from {table_name}: {e}")
-                        break
-                    
-                    # PostgreSQL connector returns rows as list of lists, not dicts
-                    rows = data_result.get('rows', [])
-                    if not rows:
-                        break
-                    
-                    # Get column names on first batch
-                    if column_names is None:
-                        column_names = data_result.get('column_names', [])
-                    
-                    # Convert list of lists to list of dicts
-                    row_dicts = []
-                    for row in rows:
-                        row_dict = dict(zip(column_names, row)) if column_names else {}
-                        row_dicts.append(row_dict)
-                    
-                    all_rows.extend(row_dicts)
-                    offset += len(rows)
-                    
-                    # Check if there are more rows
-                    has_more = data_result.get('has_more', False)
-                    if not has_more:
-                        break
-                
-                if not all_rows:
-                    logger.warning(f"No data found for table {table_name}")
-                    continue
-                
-                # Format data as JSON
-                json_data = json.dumps(all_rows, indent=2, default=str)
-                
-                # Upload to S3
-                s3_key = f"{prefix}{table_name}/full_load_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json"
+                    return 0
                 
+                # Stream rows into rolling compressed files, uploaded while they are written
+                self._start_table_progress(progress, table_source, pipeline, table_name)
+                batch_sizer = create_batch_sizer(full_load_config)
+                read = table_source.iter_record_batches if columnar_enabled(full_load_config) else table_source.iter_rows
+                writer = None
                 try:
-                    s3_client = target_connector._get_s3_client()
-                    s3_client.put_object(
-                        Bucket=bucket,
-                        Key=s3_key,
-                        Body=json_data.encode('utf-8'),
-                        ContentType='application/json'
-                    )
+                    for data_result in read(
+                        database=pipeline.source_database,
+                        schema=pipeline.source_schema,
+                        table_name=table_name,
+                        fetch_size=batch_sizer.batch_size,
+                        batch_sizer=batch_sizer
+                    ):
+                        if writer is None:
+                            if not data_result.get('row_count'):
+                                continue
+                            writer = S3TableWriter(
+                                s3_client,
+                                bucket,
+                                prefix,
+                                topic=self._get_table_topic_name(pipeline, source_connection, table_name),
+                                column_names=data_result.get('column_names', []),
+                                file_format=full_load_config.get("s3_format", "json"),
+                                compression=full_load_config.get("s3_compression"),
+                                rows_per_file=int(full_load_config.get("s3_rows_per_file", 1000000)),
+                                max_file_bytes=int(full_load_config.get("s3_max_file_bytes", 256 * 1024 * 1024))
+                            )
+                        self._write_full_load_batch(writer, data_result, batch_sizer, progress, table_name)
                     
-                    logger.info(f"Uploaded {len(all_rows)} rows from {table_name} to s3://{bucket}/{s3_key}")
-                    tables_transferred.append(table_name)
-                    total_rows += len(all_rows)
+                    if writer is None:
+                        logger.warning(f"No data found for table {table_name}")
+                        return 0
                     
-                except Exception as e:
-                    logger.error(f"Error uploading {table_name} to S3: {e}")
+                    keys = writer.close()
+                    logger.info(f"Uploaded {writer.rows_written} rows from {table_name} to s3://{bucket} in {len(keys)} files")
+                    return writer.rows_written
+                except Exception:
+                    if writer is not None:
+                        writer.abort()
+                    raise
+            
+            # Process tables, several at a time when max_parallel_tables > 1
+            outcomes = run_table_workers(pipeline.source_tables, load_table, max_parallel_tables)
+            for table_name, rows_written, error in outcomes:
+                if error is not None:
+                    logger.error(f"Error transferring {table_name} to S3: {error}")
+                    if progress is not None:
+                        progress.fail_table(table_name, error)
                     continue
+                if progress is not None:
+                    progress.complete_table(table_name)
+                if rows_written:
+                    tables_transferred.append(table_name)
+                    total_rows += rows_written
             
             # Capture LSN after full load - CRITICAL for CDC to start from correct offset
             logger.info(f"Capturing LSN/offset after full load for database {pipeline.source_database}...")
             try:
-                lsn_info = source_connector.extract_lsn_offset(database=pipeline.source_database)
+                lsn_info = snapshot_lsn_info or source_connector.extract_lsn_offset(database=pipeline.source_database)
                 lsn_value = lsn_info.get("lsn") if lsn_info else None
                 
                 if lsn_value:
@@ -1781,7 +2208,9 @@ class CDCManager:
         pipeline: Pipeline,
         source_connector: BaseConnector,
         target_connector: BaseConnector,
-        target_connection: Connection
+        target_connection: Connection,
+        snapshot_lsn_info: Optional[Dict[str, Any]] = None,
+        progress: Optional[FullLoadProgress] = None
     ) -> Dict[str, Any]:
         """Run full load from database to Snowflake.
         
@@ -1790,6 +2219,8 @@ class CDCManager:
             source_connector: Source database connector
             target_connector: Snowflake connector
             target_connection: Target Snowflake connection
+            snapshot_lsn_info: LSN/offset of the consistent snapshot being read (optional)
+            progress: Full load progress tables report to (optional)
             
         Returns:
             Full load result dictionary
@@ -1806,6 +2237,13 @@ class CDCManager:
             tables_transferred = []
             total_rows = 0
             
+            max_parallel_tables = self._get_max_parallel_tables(pipeline)
+            parallel = max_parallel_tables > 1 and len(pipeline.source_tables) > 1
+            stage_file_rows = int((pipeline.full_load_config or {}).get("stage_file_rows", 250000))
+            worker_local = threading.local()
+            worker_lock = threading.Lock()
+            worker_connections = []
+            
             # Connect to Snowflake
             conn = target_connector.connect()
             cursor = conn.cursor()
@@ -1818,134 +2256,119 @@ class CDCManager:
                 cursor.execute(f"USE DATABASE {target_db_upper}")
                 cursor.execute(f"USE SCHEMA {target_schema_upper}")
                 
-                # Process each table
-                for source_table in pipeline.source_tables:
+                def get_worker_context():
+                    """Get the source connector and Snowflake cursor for the current worker."""
+                    if not parallel:
+                        return source_connector, cursor
+                    if getattr(worker_local, "cursor", None) is None:
+                        worker_conn = clone_connector(target_connector).connect()
+                        worker_cursor = worker_conn.cursor()
+                        with worker_lock:
+                            worker_connections.append((worker_conn, worker_cursor))
+                        worker_cursor.execute(f"USE DATABASE {target_db_upper}")
+                        worker_cursor.execute(f"USE SCHEMA {target_schema_upper}")
+                        worker_local.source = clone_connector(source_connector)
+                        worker_local.cursor = worker_cursor
+                    return worker_local.source, worker_local.cursor
+                
+                def load_table(source_table: str) -> Tuple[str, int]:
+                    table_source, table_cursor = get_worker_context()
+                    
                     # Get target table name from mapping
                     target_table = pipeline.target_table_mapping.get(source_table, source_table) if pipeline.target_table_mapping else source_table
                     target_table_upper = target_table.upper().strip('"\'')
                     
                     logger.info(f"Transferring table {source_table} to Snowflake table {target_table_upper}")
                     
-                    # Extract data from source in batches
-                    batch_size = 10000
-                    offset = 0
-                    column_names = None
-                    rows_inserted = 0
+                    # Stream data from source in batches over one source connection,
+                    # sized by the row width and the time each batch takes to write
+                    self._start_table_progress(progress, table_source, pipeline, source_table)
+                    batch_sizer = create_batch_sizer(pipeline.full_load_config)
+                    read = (
+                        table_source.iter_record_batches if columnar_enabled(pipeline.full_load_config)
+                        else table_source.iter_rows
+                    )
+                    batches = read(
+                        database=pipeline.source_database,
+                        schema=pipeline.source_schema,
+                        table_name=source_table,
+                        fetch_size=batch_sizer.batch_size,
+                        batch_sizer=batch_sizer
+                    )
                     
-                    while True:
-                        try:
-                            data_result = source_connector.extract_data(
-                                database=pipeline.source_database,
-                                schema=pipeline.source_schema,
-                                table_name=source_table,
-                                limit=batch_size,
-                                offset=offset
-                            )
-                        except Exception as e:
-                            logger.error(f"Error extracting data from {source_table}: {e}")
-                            break
-                        
-                        rows = data_result.get('rows', [])
-                        if not rows:
-                            break
-                        
-                        # Get column names on first batch
-                        if column_names is None:
+                    # Rows go to gzip NDJSON chunk files that are PUT to the table stage
+                    # and loaded with one COPY INTO in RECORD_CONTENT/RECORD_METADATA format,
+                    # the format the Snowflake Kafka connector uses for CDC
+                    loader = None
+                    try:
+                        for data_result in batches:
                             column_names = data_result.get('column_names', [])
                             if not column_names:
                                 logger.warning(f"No column names found for {source_table}")
                                 break
-                        
-                        # For Snowflake targets, insert data in RECORD_CONTENT/RECORD_METADATA format
-                        # This matches the format that Snowflake Kafka connector uses for CDC
-                        # RECORD_CONTENT: VARIANT column storing the record data as JSON
-                        # RECORD_METADATA: OBJECT column storing metadata
-                        
-                        # Build INSERT statement for Snowflake Kafka connector format
-                        # Use individual INSERT statements since Snowflake doesn't support PARSE_JSON in VALUES with executemany
-                        # Insert rows one by one with PARSE_JSON in the SQL
-                        rows_inserted_batch = 0
-                        for row_idx, row in enumerate(rows):
-                            try:
-                                # Create RECORD_CONTENT as JSON object with column names as keys
-                                record_content = {}
-                                for i, col_name in enumerate(column_names):
-                                    value = row[i] if i < len(row) else None
-                                    # Convert value to JSON-serializable format
-                                    if isinstance(value, (datetime,)):
-                                        value = value.isoformat()
-                                    elif hasattr(value, 'isoformat'):  # Handle other datetime-like objects
-                                        value = value.isoformat()
-                                    # Handle Oracle-specific types (LOB, etc.)
-                                    elif hasattr(value, 'read'):  # LOB types
-                                        try:
-                                            value = value.read()
-                                        except:
-                                            value = str(value)
-                                    record_content[col_name] = value
-                                
-                                # Create RECORD_METADATA as JSON object
-                                # Format similar to what Snowflake Kafka connector uses
-                                record_metadata = {
-                                    "source": {
+                            
+                            if loader is None:
+                                loader = SnowflakeStageLoader(
+                                    table_cursor,
+                                    target_table_upper,
+                                    column_names,
+                                    source={
                                         "schema": pipeline.source_schema or "",
                                         "table": source_table,
                                         "database": pipeline.source_database or ""
                                     },
-                                    "created_time": datetime.utcnow().isoformat(),
-                                    "operation": "r",  # 'r' for full load (read/reload)
-                                    "partition": 0,  # Default partition for full load
-                                    "offset": offset + row_idx  # Sequential offset for full load
-                                }
-                                
-                                # Convert to JSON strings for PARSE_JSON
-                                # Use ensure_ascii=False to preserve Unicode and default=str for any non-serializable types
-                                record_content_json = json.dumps(record_content, ensure_ascii=False, default=str)
-                                record_metadata_json = json.dumps(record_metadata, ensure_ascii=False, default=str)
-                                
-                                # Escape single quotes in JSON strings for SQL
-                                record_content_json_escaped = record_content_json.replace("'", "''")
-                                record_metadata_json_escaped = record_metadata_json.replace("'", "''")
-                                
-                                # Insert with PARSE_JSON - use string formatting since we're inserting one at a time
-                                insert_query = f'INSERT INTO "{target_table_upper}" ("RECORD_CONTENT", "RECORD_METADATA") SELECT PARSE_JSON(\'{record_content_json_escaped}\'), PARSE_JSON(\'{record_metadata_json_escaped}\')'
-                                cursor.execute(insert_query)
-                                rows_inserted_batch += 1
-                                
-                            except Exception as e:
-                                logger.error(f"Error inserting row {row_idx} into {target_table_upper}: {e}")
-                                # Log the problematic row for debugging
-                                logger.error(f"Problematic record_content: {record_content_json[:200] if 'record_content_json' in locals() else 'N/A'}")
-                                raise
-                        
-                        rows_inserted += rows_inserted_batch
-                        logger.info(f"Inserted {rows_inserted_batch} rows into {target_table_upper} in RECORD_CONTENT/RECORD_METADATA format (total: {rows_inserted})")
-                        
-                        offset += len(rows)
+                                    rows_per_file=stage_file_rows
+                                )
+                            self._write_full_load_batch(loader, data_result, batch_sizer, progress, source_table)
+                            logger.info(f"Staged {loader.rows_written} rows for {target_table_upper}")
                         
-                        # Check if there are more rows
-                        has_more = data_result.get('has_more', False)
-                        if not has_more:
-                            break
+                        rows_inserted = loader.finish() if loader is not None else 0
+                    except Exception as e:
+                        logger.error(f"Error loading {source_table} into {target_table_upper}: {e}")
+                        if loader is not None:
+                            loader.abort()
+                        raise
+                    finally:
+                        batches.close()
+                        if loader is not None:
+                            loader.close()
                     
                     if rows_inserted > 0:
                         logger.info(f"✓ Transferred {rows_inserted} rows from {source_table} to {target_table_upper}")
-                        tables_transferred.append(target_table_upper)
-                        total_rows += rows_inserted
                     else:
                         logger.warning(f"No data transferred for table {source_table}")
+                    return target_table_upper, rows_inserted
+                
+                # Process tables, several at a time when max_parallel_tables > 1
+                outcomes = run_table_workers(pipeline.source_tables, load_table, max_parallel_tables)
+                for source_table, table_outcome, error in outcomes:
+                    if error is not None:
+                        if progress is not None:
+                            progress.fail_table(source_table, error)
+                        raise error
+                    if progress is not None:
+                        progress.complete_table(source_table)
+                    target_table_upper, rows_inserted = table_outcome
+                    if rows_inserted > 0:
+                        tables_transferred.append(target_table_upper)
+                        total_rows += rows_inserted
                 
                 # Commit all inserts
+                for worker_conn, _ in worker_connections:
+                    worker_conn.commit()
                 conn.commit()
                 
             finally:
+                for worker_conn, worker_cursor in worker_connections:
+                    worker_cursor.close()
+                    worker_conn.close()
                 cursor.close()
                 conn.close()
             
             # Capture LSN after full load
             logger.info(f"Capturing LSN/offset after full load for database {pipeline.source_database}...")
             try:
-                lsn_info = source_connector.extract_lsn_offset(database=pipeline.source_database)
+                lsn_info = snapshot_lsn_info or source_connector.extract_lsn_offset(database=pipeline.source_database)
                 lsn_value = lsn_info.get("lsn") if lsn_info else None
                 
                 if lsn_value:
@@ -2252,6 +2675,7 @@ class CDCManager:
                         kafka_topics=pipeline_model.kafka_topics or [],
                         debezium_config=pipeline_model.debezium_config or {},
                         sink_config=pipeline_model.sink_config or {},
+                        full_load_config=pipeline_model.full_load_config or {},
                         status=pipeline_model.status.value if hasattr(pipeline_model.status, 'value') else str(pipeline_model.status),
                         created_at=pipeline_model.created_at,
                         updated_at=pipeline_model.updated_at
@@ -0,0 +1,269 @@
+"""Full load checkpoints for resuming interrupted full loads."""
+
+from __future__ import annotations
+
+import base64
+import logging
+import threading
+import uuid
+from datetime import date, datetime, time as dt_time
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHUNK_PENDING = "pending"
+CHUNK_STARTED = "started"
+CHUNK_COMPLETED = "completed"
+
+TABLE_IN_PROGRESS = "in_progress"
+TABLE_COMPLETED = "completed"
+
+
+def encode_key_value(value: Any) -> Any:
+    """Encode a primary key value as JSON, keeping its Python type."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Decimal):
+        return {"type": "decimal", "value": str(value)}
+    if isinstance(value, datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"type": "date", "value": value.isoformat()}
+    if isinstance(value, dt_time):
+        return {"type": "time", "value": value.isoformat()}
+    if isinstance(value, uuid.UUID):
+        return {"type": "uuid", "value": str(value)}
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return {"type": "bytes", "value": base64.b64encode(bytes(value)).decode("ascii")}
+    return str(value)
+
+
+def decode_key_value(value: Any) -> Any:
+    """Decode a primary key value encoded with encode_key_value."""
+    if not isinstance(value, dict):
+        return value
+    value_type, raw = value.get("type"), value.get("value")
+    if value_type == "decimal":
+        return Decimal(raw)
+    if value_type == "datetime":
+        return datetime.fromisoformat(raw)
+    if value_type == "date":
+        return date.fromisoformat(raw)
+    if value_type == "time":
+        return dt_time.fromisoformat(raw)
+    if value_type == "uuid":
+        return uuid.UUID(raw)
+    if value_type == "bytes":
+        return base64.b64decode(raw)
+    return raw
+
+
+def encode_key_range(key_range: Tuple[Optional[List[Any]], Optional[List[Any]]]) -> List[Any]:
+    lower_key, upper_key = key_range
+    return [
+        None if lower_key is None else [encode_key_value(v) for v in lower_key],
+        None if upper_key is None else [encode_key_value(v) for v in upper_key]
+    ]
+
+
+def decode_key_range(key_range: List[Any]) -> Tuple[Optional[List[Any]], Optional[List[Any]]]:
+    lower_key, upper_key = key_range
+    return (
+        None if lower_key is None else [decode_key_value(v) for v in lower_key],
+        None if upper_key is None else [decode_key_value(v) for v in upper_key]
+    )
+
+
+class FullLoadCheckpointStore:
+    """Persists full load progress per table in the metadata database.
+
+    A table is copied as a list of primary key ranges (chunks); each chunk
+    is marked started before it is copied and completed after its rows are
+    committed on the target. A full load that is interrupted and started
+    again skips completed chunks and re-copies the others, first deleting
+    the rows a started chunk may have committed before the interruption.
+
+    Reading a checkpoint and recording the start of a table or chunk fail
+    the full load when the metadata database is unavailable: a missing or
+    stale checkpoint would copy rows again without deleting the rows an
+    earlier run committed. Completions and clearing are best-effort; a
+    chunk left marked started is re-copied after deleting its rows.
+    """
+
+    def __init__(self, session_factory, pipeline_id: str):
+        """Initialize checkpoint store.
+
+        Args:
+            session_factory: Metadata database session factory (generator, as set from api.py)
+            pipeline_id: Pipeline ID the checkpoints belong to
+        """
+        self.session_factory = session_factory
+        self.pipeline_id = pipeline_id
+        # LSN/offset of the snapshot the current run reads, stored with new tables
+        self.lsn_info: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def get(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Get the checkpoint of a table.
+
+        Returns:
+            Dictionary with status, chunks (decoded key ranges), chunk_states,
+            rows_copied and lsn_info, or None when the table has no checkpoint
+
+        Raises:
+            Exception: If the metadata database cannot be read; a table
+                without a known checkpoint would be copied again in full
+        """
+        from ingestion.database.models_db import FullLoadCheckpointModel
+
+        db = next(self.session_factory())
+        try:
+            model = db.query(FullLoadCheckpointModel).filter(
+                FullLoadCheckpointModel.pipeline_id == self.pipeline_id,
+                FullLoadCheckpointModel.table_name == table_name
+            ).first()
+            if not model:
+                return None
+            return {
+                "status": model.status,
+                "chunks": [decode_key_range(chunk) for chunk in (model.chunks or [])],
+                "chunk_states": list(model.chunk_states or []),
+                "rows_copied": model.rows_copied or 0,
+                "lsn_info": model.lsn_info
+            }
+        finally:
+            db.close()
+
+    def get_resume_lsn_info(self) -> Optional[Dict[str, Any]]:
+        """Get the snapshot LSN/offset of the oldest unfinished run, if any."""
+        from ingestion.database.models_db import FullLoadCheckpointModel
+
+        try:
+            db = next(self.session_factory())
+            try:
+                model = db.query(FullLoadCheckpointModel).filter(
+                    FullLoadCheckpointModel.pipeline_id == self.pipeline_id,
+                    FullLoadCheckpointModel.lsn_info.isnot(None)
+                ).order_by(FullLoadCheckpointModel.created_at).first()
+                return model.lsn_info if model else None
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning(f"Could not read full load checkpoints of pipeline {self.pipeline_id}: {e}")
+            return None
+
+    def start_table(
+        self,
+        table_name: str,
+        chunks: List[Tuple[Optional[List[Any]], Optional[List[Any]]]]
+    ) -> None:
+        """Record the chunks a table is copied in, replacing any previous checkpoint.
+
+        Raises:
+            Exception: If the checkpoint cannot be written
+        """
+        from ingestion.database.models_db import FullLoadCheckpointModel
+
+        with self._lock:
+            db = next(self.session_factory())
+            try:
+                db.query(FullLoadCheckpointModel).filter(
+                    FullLoadCheckpointModel.pipeline_id == self.pipeline_id,
+                    FullLoadCheckpointModel.table_name == table_name
+                ).delete()
+                db.add(FullLoadCheckpointModel(
+                    id=str(uuid.uuid4()),
+                    pipeline_id=self.pipeline_id,
+                    table_name=table_name,
+                    status=TABLE_IN_PROGRESS,
+                    chunks=[encode_key_range(chunk) for chunk in chunks],
+                    chunk_states=[CHUNK_PENDING] * len(chunks),
+                    rows_copied=0,
+                    lsn_info=self.lsn_info
+                ))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+    def start_chunk(self, table_name: str, chunk_index: int) -> None:
+        """Mark a chunk as started, before its first row is written.
+
+        Raises:
+            Exception: If the checkpoint cannot be written; the chunk's rows
+                would not be deleted when it is resumed
+        """
+        self._update(table_name, chunk_index, CHUNK_STARTED, 0, best_effort=False)
+
+    def complete_chunk(self, table_name: str, chunk_index: int, rows: int) -> None:
+        """Mark a chunk as completed, after its rows are committed on the target."""
+        self._update(table_name, chunk_index, CHUNK_COMPLETED, rows)
+
+    def complete_table(self, table_name: str) -> None:
+        """Mark a table as completely copied."""
+        self._update(table_name, None, None, 0, status=TABLE_COMPLETED)
+
+    def clear(self) -> None:
+        """Delete all checkpoints of the pipeline (after a successful full load)."""
+        from ingestion.database.models_db import FullLoadCheckpointModel
+
+        with self._lock:
+            try:
+                db = next(self.session_factory())
+                try:
+                    db.query(FullLoadCheckpointModel).filter(
+                        FullLoadCheckpointModel.pipeline_id == self.pipeline_id
+                    ).delete()
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                finally:
+                    db.close()
+            except Exception as e:
+                logger.warning(f"Could not clear full load checkpoints of pipeline {self.pipeline_id}: {e}")
+
+    def _update(
+        self,
+        table_name: str,
+        chunk_index: Optional[int],
+        chunk_state: Optional[str],
+        rows: int,
+        status: Optional[str] = None,
+        best_effort: bool = True
+    ) -> None:
+        from ingestion.database.models_db import FullLoadCheckpointModel
+
+        # Chunks of one table complete concurrently; serialize the read-modify-write of chunk_states
+        with self._lock:
+            try:
+                db = next(self.session_factory())
+                try:
+                    model = db.query(FullLoadCheckpointModel).filter(
+                        FullLoadCheckpointModel.pipeline_id == self.pipeline_id,
+                        FullLoadCheckpointModel.table_name == table_name
+                    ).first()
+                    if not model:
+                        return
+                    if chunk_index is not None:
+                        chunk_states = list(model.chunk_states or [])
+                        chunk_states[chunk_index] = chunk_state
+                        # Reassign so the JSON column is detected as changed
+                        model.chunk_states = chunk_states
+                    if status is not None:
+                        model.status = status
+                    model.rows_copied = (model.rows_copied or 0) + rows
+                    model.updated_at = datetime.utcnow()
+                    db.commit()
+                except Exception:
+                    db.rollback()
+                    raise
+                finally:
+                    db.close()
+            except Exception as e:
+                if not best_effort:
+                    raise
+                logger.warning(f"Could not update full load checkpoint for {table_name}: {e}")
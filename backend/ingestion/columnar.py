@@ -0,0 +1,86 @@
+"""Arrow record batches for the columnar full load path."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def columnar_enabled(options: Optional[Dict[str, Any]]) -> bool:
+    """Whether a full load moves rows as Arrow record batches.
+
+    Enabled with full_load_config "columnar": true; requires pyarrow, and
+    falls back to row batches with a warning when it is not installed.
+    """
+    if not (options or {}).get("columnar", False):
+        return False
+    if not PYARROW_AVAILABLE:
+        logger.warning("Columnar full load requested but pyarrow is not installed, using row batches")
+        return False
+    return True
+
+
+def _read_lobs(values: List[Any]) -> List[Any]:
+    return [value.read() if value is not None and hasattr(value, "read") else value for value in values]
+
+
+def _to_array(values: List[Any]) -> "pa.Array":
+    first = next((value for value in values if value is not None), None)
+    if first is not None and hasattr(first, "read"):
+        # LOB columns are read once here, column by column
+        values = _read_lobs(values)
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed or unsupported Python types; keep the column as text
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
+
+
+def rows_to_record_batch(rows: Sequence[Sequence[Any]], column_names: List[str]) -> "pa.RecordBatch":
+    """Build a record batch from row tuples, transposing them once into columns.
+
+    Args:
+        rows: Rows, in ``column_names`` order
+        column_names: Column names
+
+    Returns:
+        pyarrow.RecordBatch with one array per column
+    """
+    if rows:
+        columns = [list(column) for column in zip(*rows)]
+    else:
+        columns = [[] for _ in column_names]
+    return pa.RecordBatch.from_arrays([_to_array(column) for column in columns], names=list(column_names))
+
+
+def record_batch_to_rows(batch: "pa.RecordBatch") -> List[List[Any]]:
+    """Convert a record batch back to rows, for writers without a columnar path."""
+    columns = [column.to_pylist() for column in batch.columns]
+    return [list(row) for row in zip(*columns)]
+
+
+def with_constant_columns(batch: "pa.RecordBatch", columns: Dict[str, Any]) -> "pa.RecordBatch":
+    """Append columns holding one value in every row, without per-row work.
+
+    Args:
+        batch: Record batch
+        columns: Column name -> value; None values become null string columns
+
+    Returns:
+        Record batch with the columns appended
+    """
+    arrays = list(batch.columns)
+    names = list(batch.schema.names)
+    for name, value in columns.items():
+        arrays.append(pa.nulls(batch.num_rows, pa.string()) if value is None else pa.repeat(value, batch.num_rows))
+        names.append(name)
+    return pa.RecordBatch.from_arrays(arrays, names=names)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import pyodbc
@@ -42,7 +42,14 @@ except ImportError:
             self.columns = columns or []
             self.properties = properties or {}
 
-from .base_connector import BaseConnector
+from .base_connector import (
+    BaseConnector,
+    build_key_boundary_query,
+    build_key_range_predicate,
+    build_keyset_predicate,
+    get_key_indexes,
+    key_ranges_from_boundaries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -459,6 +466,49 @@ class AS400Connector(BaseConnector):
             logger.error(f"Failed to get table columns: {e}")
             raise
 
+    def get_primary_keys(
+        self,
+        table: str,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> List[str]:
+        """Get primary key columns for a table.
+
+        Args:
+            table: Table name
+            database: Database/library name (optional)
+            schema: Schema/library name (optional)
+
+        Returns:
+            List of primary key column names
+        """
+        target_schema = schema or self.config.get("schema") or database or self.config.get("database")
+
+        if not target_schema:
+            raise ValueError("Schema/library name is required")
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute("""
+                SELECT k.COLUMN_NAME
+                FROM QSYS2.SYSCST c
+                JOIN QSYS2.SYSKEYCST k
+                    ON k.CONSTRAINT_SCHEMA = c.CONSTRAINT_SCHEMA
+                    AND k.CONSTRAINT_NAME = c.CONSTRAINT_NAME
+                WHERE c.CONSTRAINT_TYPE = 'PRIMARY KEY'
+                    AND c.TABLE_SCHEMA = ? AND c.TABLE_NAME = ?
+                ORDER BY k.ORDINAL_POSITION
+            """, (target_schema, table))
+            return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Failed to get primary keys: {e}")
+            raise
+        finally:
+            cursor.close()
+            self.disconnect(conn)
+
     def extract_schema(
         self,
         database: Optional[str] = None,
@@ -660,7 +710,9 @@ class AS400Connector(BaseConnector):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data rows from a table.
 
@@ -669,7 +721,9 @@ class AS400Connector(BaseConnector):
             schema: Schema/library name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
+            key_columns: Primary key columns for keyset pagination (optional)
+            after_key: Key values of the last row of the previous page (optional)
 
         Returns:
             Dictionary containing data extraction results
@@ -707,8 +761,20 @@ class AS400Connector(BaseConnector):
             column_list = ", ".join(column_names)
             data_query = f"SELECT {column_list} FROM {schema}.{table_name}"
 
+            key_indexes = get_key_indexes(column_names, key_columns)
+
             # Add pagination (AS400/IBM i uses FETCH FIRST ... OFFSET ...)
-            if limit is not None:
+            if key_indexes is not None:
+                # Keyset pagination: seek on the primary key instead of OFFSET, which rescans skipped rows
+                params: List[Any] = []
+                if after_key is not None:
+                    predicate, params = build_keyset_predicate(key_columns, after_key, lambda n: "?")
+                    data_query = f"{data_query} WHERE {predicate}"
+                data_query = f"{data_query} ORDER BY {', '.join(key_columns)}"
+                if limit is not None:
+                    data_query = f"{data_query} FETCH FIRST {limit} ROWS ONLY"
+                cursor.execute(data_query, params)
+            elif limit is not None:
                 data_query = f"{data_query} OFFSET {offset} ROWS FETCH FIRST {limit} ROWS ONLY"
                 cursor.execute(data_query)
             else:
@@ -720,7 +786,12 @@ class AS400Connector(BaseConnector):
 
             # Check if there are more rows
             has_more = False
-            if limit is not None:
+            last_key = None
+            if key_indexes is not None:
+                has_more = limit is not None and len(row_data) == limit
+                if row_data:
+                    last_key = [row_data[-1][i] for i in key_indexes]
+            elif limit is not None:
                 rows_extracted = len(row_data)
                 has_more = (offset + rows_extracted) < total_rows
 
@@ -734,7 +805,8 @@ class AS400Connector(BaseConnector):
                 "row_count": len(row_data),
                 "total_rows": total_rows,
                 "has_more": has_more,
-                "column_names": column_names
+                "column_names": column_names,
+                "last_key": last_key
             }
 
         except Exception as e:
@@ -744,6 +816,114 @@ class AS400Connector(BaseConnector):
             cursor.close()
             conn.close()
 
+    def iter_rows(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of a table with a single query and fetchmany.
+
+        Args:
+            database: Database/library name
+            schema: Schema/library name
+            table_name: Table name
+            fetch_size: Number of rows fetched per round trip and per batch
+            key_columns: Primary key columns the key bounds refer to (optional)
+            lower_key: Only read rows with key > lower_key (optional)
+            upper_key: Only read rows with key <= upper_key (optional)
+            connection: Open connection to read over instead of a new one;
+                it is left open for the caller (optional)
+            batch_sizer: ingestion.batching.AdaptiveBatchSizer whose current
+                batch_size replaces fetch_size before every fetch (optional)
+            lower_inclusive: Also read rows with key == lower_key
+
+        Yields:
+            Dictionary per batch with rows, row_count and column_names
+        """
+        conn = connection or self.connect()
+        cursor = conn.cursor()
+        cursor.arraysize = fetch_size
+
+        try:
+            query = f"SELECT * FROM {schema}.{table_name}"
+            params: List[Any] = []
+            if key_columns:
+                predicate, params = build_key_range_predicate(
+                    key_columns, lower_key, upper_key, lambda n: "?", lower_inclusive=lower_inclusive
+                )
+                if predicate:
+                    query = f"{query} WHERE {predicate}"
+            cursor.execute(query, params)
+            column_names = [desc[0] for desc in cursor.description]
+
+            total = 0
+            while True:
+                if batch_sizer is not None:
+                    fetch_size = cursor.arraysize = batch_sizer.batch_size
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                total += len(rows)
+                yield {
+                    "rows": [list(row) for row in rows],
+                    "row_count": len(rows),
+                    "column_names": column_names
+                }
+
+            logger.info(f"Streamed {total} rows from {schema}.{table_name}")
+
+        except Exception as e:
+            logger.error(f"Error streaming data from {schema}.{table_name}: {e}")
+            raise
+        finally:
+            cursor.close()
+            if connection is None:
+                conn.close()
+
+    def get_key_ranges(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        key_columns: List[str],
+        num_ranges: int
+    ) -> List[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+        """Split a table's primary key space into ranges using NTILE.
+
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            key_columns: Primary key columns, in key order
+            num_ranges: Desired number of ranges
+
+        Returns:
+            List of (lower_key, upper_key) tuples in key order
+        """
+        if num_ranges <= 1 or not key_columns:
+            return [(None, None)]
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        try:
+            cursor.execute(build_key_boundary_query(key_columns, f"{schema}.{table_name}", num_ranges))
+            boundaries = [list(row) for row in cursor.fetchall()]
+            ranges = key_ranges_from_boundaries(boundaries)
+            logger.info(f"Split {schema}.{table_name} into {len(ranges)} key ranges on {key_columns}")
+            return ranges
+        finally:
+            cursor.close()
+            conn.close()
+
     def extract_lsn_offset(
         self,
         database: Optional[str] = None
@@ -4,11 +4,136 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def build_keyset_predicate(
+    quoted_keys: List[str],
+    after_key: List[Any],
+    placeholder: Callable[[int], str],
+    operator: str = ">",
+    param_offset: int = 0
+) -> Tuple[str, List[Any]]:
+    """Build a WHERE fragment comparing the key columns with ``after_key``.
+
+    Row-value comparison ``(a, b) > (x, y)`` is not available on SQL Server or
+    Oracle, so the predicate is expanded to ``a > x OR (a = x AND b > y)``,
+    which every supported dialect can evaluate against the primary key index.
+
+    Args:
+        quoted_keys: Key column names, already quoted for the target dialect
+        after_key: Key values to compare against
+        placeholder: Returns the bind placeholder for the n-th parameter (1-based)
+        operator: Row comparison to expand: ">" (rows after the key), ">="
+            (rows from the key on) or "<=" (rows up to and including the key)
+        param_offset: Number of parameters already bound before this fragment
+
+    Returns:
+        Tuple of (SQL fragment, parameters in placeholder order)
+    """
+    strict = operator.rstrip("=")
+    clauses = []
+    params: List[Any] = []
+    for i, key in enumerate(quoted_keys):
+        parts = []
+        for j in range(i):
+            params.append(after_key[j])
+            parts.append(f"{quoted_keys[j]} = {placeholder(param_offset + len(params))}")
+        params.append(after_key[i])
+        parts.append(f"{key} {strict} {placeholder(param_offset + len(params))}")
+        clauses.append("(" + " AND ".join(parts) + ")")
+    if operator.endswith("="):
+        parts = []
+        for key, value in zip(quoted_keys, after_key):
+            params.append(value)
+            parts.append(f"{key} = {placeholder(param_offset + len(params))}")
+        clauses.append("(" + " AND ".join(parts) + ")")
+    return "(" + " OR ".join(clauses) + ")", params
+
+
+def build_key_range_predicate(
+    quoted_keys: List[str],
+    lower_key: Optional[List[Any]],
+    upper_key: Optional[List[Any]],
+    placeholder: Callable[[int], str],
+    lower_inclusive: bool = False
+) -> Tuple[Optional[str], List[Any]]:
+    """Build a WHERE fragment selecting keys in ``(lower_key, upper_key]``.
+
+    Either bound may be None (unbounded). Returns (None, []) when both are.
+    With ``lower_inclusive`` the range is ``[lower_key, upper_key]``.
+    """
+    predicates = []
+    params: List[Any] = []
+    if lower_key is not None:
+        lower_operator = ">=" if lower_inclusive else ">"
+        predicate, lower_params = build_keyset_predicate(quoted_keys, lower_key, placeholder, lower_operator, len(params))
+        predicates.append(predicate)
+        params.extend(lower_params)
+    if upper_key is not None:
+        predicate, upper_params = build_keyset_predicate(quoted_keys, upper_key, placeholder, "<=", len(params))
+        predicates.append(predicate)
+        params.extend(upper_params)
+    if not predicates:
+        return None, []
+    return " AND ".join(predicates), params
+
+
+def build_key_boundary_query(quoted_keys: List[str], table_ref: str, num_ranges: int) -> str:
+    """Build a query returning the last key of each of ``num_ranges`` equal-sized key ranges.
+
+    NTILE buckets the primary key in key order; a row is a boundary when the
+    next row falls into a different bucket. Uses only window functions
+    available on PostgreSQL, SQL Server, Oracle and Db2 for i.
+    """
+    key_list = ", ".join(quoted_keys)
+    return (
+        f"SELECT {key_list} FROM ("
+        f"SELECT {key_list}, chunk_id, LEAD(chunk_id) OVER (ORDER BY {key_list}) AS next_chunk_id "
+        f"FROM (SELECT {key_list}, NTILE({int(num_ranges)}) OVER (ORDER BY {key_list}) AS chunk_id "
+        f"FROM {table_ref}) tiles"
+        f") boundaries "
+        f"WHERE next_chunk_id IS NULL OR next_chunk_id <> chunk_id "
+        f"ORDER BY {key_list}"
+    )
+
+
+def key_ranges_from_boundaries(
+    boundaries: List[List[Any]]
+) -> List[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+    """Turn the last key of each range into ``(lower_exclusive, upper_inclusive)`` pairs.
+
+    The first range has no lower bound and the last no upper bound, so rows
+    outside the sampled key space are still covered.
+    """
+    if not boundaries:
+        return [(None, None)]
+    ranges: List[Tuple[Optional[List[Any]], Optional[List[Any]]]] = []
+    lower: Optional[List[Any]] = None
+    for boundary in boundaries[:-1]:
+        ranges.append((lower, list(boundary)))
+        lower = list(boundary)
+    ranges.append((lower, None))
+    return ranges
+
+
+def get_key_indexes(column_names: List[str], key_columns: Optional[List[str]]) -> Optional[List[int]]:
+    """Return positions of ``key_columns`` in ``column_names``.
+
+    Returns None when no keys are given or a key column is not part of the
+    selected columns, in which case callers fall back to OFFSET pagination.
+    """
+    if not key_columns:
+        return None
+    try:
+        return [column_names.index(key) for key in key_columns]
+    except ValueError:
+        logger.warning(f"Key columns {key_columns} not found in {column_names}, falling back to OFFSET pagination")
+        return None
+
+
 class BaseConnector(ABC):
     """Abstract base class for all database connectors.
     
@@ -25,6 +150,9 @@ class BaseConnector(ABC):
                 Credentials and connection details are provided dynamically.
         """
         self.config = connection_config.copy()
+        # Read-side state of a consistent snapshot started with begin_snapshot;
+        # iter_rows reads as of the snapshot while it is set
+        self.snapshot: Optional[Dict[str, Any]] = None
         self._validate_config()
 
     @abstractmethod
@@ -84,16 +212,25 @@ class BaseConnector(ABC):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data rows from a table.
         
+        When ``key_columns`` is given, rows are paged by key
+        (``WHERE key > after_key ORDER BY key``) instead of by ``offset``, so
+        every page costs the same regardless of how deep into the table it is.
+        
         Args:
             database: Database name
             schema: Schema name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
+            key_columns: Primary key columns to page by (keyset pagination)
+            after_key: Key values of the last row of the previous page
+                (None for the first page)
             
         Returns:
             Dictionary containing:
@@ -102,11 +239,254 @@ class BaseConnector(ABC):
                 "row_count": int (number of rows extracted),
                 "total_rows": int (total rows in table),
                 "has_more": bool (whether more rows exist),
-                "column_names": List[str] (column names in order)
+                "column_names": List[str] (column names in order),
+                "last_key": Optional[List] (key values of the last row, keyset mode only)
             }
         """
         pass
 
+    def iter_rows(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of a table in batches over a single connection.
+        
+        Unlike extract_data, no COUNT(*) or catalog lookup is issued per batch
+        and the table is read in one pass, so memory stays bounded by
+        ``fetch_size`` regardless of table size. Connectors override this with
+        a server-side cursor; this default pages through extract_data by
+        primary key (keyset) and is only used by connectors without one.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            fetch_size: Maximum number of rows per yielded batch
+            key_columns: Primary key columns the key bounds refer to (optional)
+            lower_key: Only read rows with key > lower_key (optional)
+            upper_key: Only read rows with key <= upper_key (optional)
+            connection: Open connection to read over instead of a new one;
+                it is left open for the caller (optional; unused by this
+                default, which reads through extract_data)
+            batch_sizer: ingestion.batching.AdaptiveBatchSizer whose current
+                batch_size replaces fetch_size before every fetch (optional)
+            lower_inclusive: Also read rows with key == lower_key
+            
+        Yields:
+            Dictionary per batch:
+            {
+                "rows": List[Sequence] (row data),
+                "row_count": int (number of rows in this batch),
+                "column_names": List[str] (column names in order)
+            }
+        """
+        if not key_columns:
+            try:
+                key_columns = self.get_primary_keys(table_name, database=database, schema=schema) or None
+            except Exception as e:
+                logger.warning(f"Could not get primary keys for {table_name}, using OFFSET pagination: {e}")
+                key_columns = None
+        
+        offset = 0
+        after_key = lower_key
+        # extract_data only reads rows after a key; for an inclusive lower bound
+        # page from the start and skip the rows below lower_key
+        skip_below = lower_key if lower_inclusive and lower_key is not None else None
+        if skip_below is not None:
+            after_key = None
+        while True:
+            if batch_sizer is not None:
+                fetch_size = batch_sizer.batch_size
+            data = self.extract_data(
+                database=database,
+                schema=schema,
+                table_name=table_name,
+                limit=fetch_size,
+                offset=offset,
+                key_columns=key_columns,
+                after_key=after_key
+            )
+            rows = data.get("rows") or []
+            fetched = len(rows)
+            if skip_below is not None and rows:
+                key_indexes = get_key_indexes(data.get("column_names", []), key_columns)
+                if key_indexes is not None:
+                    rows = [row for row in rows if [row[i] for i in key_indexes] >= list(skip_below)]
+                    if rows:
+                        skip_below = None
+            if upper_key is not None and rows:
+                key_indexes = get_key_indexes(data.get("column_names", []), key_columns)
+                if key_indexes is not None:
+                    in_range = [row for row in rows if [row[i] for i in key_indexes] <= list(upper_key)]
+                    if len(in_range) < len(rows):
+                        rows = in_range
+                        data["has_more"] = False
+            if not fetched:
+                break
+            if rows:
+                yield {
+                    "rows": rows,
+                    "row_count": len(rows),
+                    "column_names": data.get("column_names", [])
+                }
+            offset += fetched
+            after_key = data.get("last_key")
+            if not data.get("has_more", False):
+                break
+
+    def iter_record_batches(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of a table as Arrow record batches (requires pyarrow).
+        
+        Same arguments as iter_rows. This default transposes each fetched
+        batch into columns once; connectors whose driver returns Arrow data
+        can override it to skip the row tuples entirely.
+        
+        Yields:
+            Dictionary per batch:
+            {
+                "batch": pyarrow.RecordBatch,
+                "row_count": int (number of rows in this batch),
+                "column_names": List[str] (column names in order)
+            }
+        """
+        from ingestion.columnar import rows_to_record_batch
+        
+        batches = self.iter_rows(
+            database=database,
+            schema=schema,
+            table_name=table_name,
+            fetch_size=fetch_size,
+            key_columns=key_columns,
+            lower_key=lower_key,
+            upper_key=upper_key,
+            connection=connection,
+            batch_sizer=batch_sizer,
+            lower_inclusive=lower_inclusive
+        )
+        try:
+            for data in batches:
+                column_names = data.get("column_names", [])
+                yield {
+                    "batch": rows_to_record_batch(data["rows"], column_names),
+                    "row_count": data["row_count"],
+                    "column_names": column_names
+                }
+        finally:
+            batches.close()
+
+    def get_key_ranges(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        key_columns: List[str],
+        num_ranges: int
+    ) -> List[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+        """Split a table's primary key space into roughly equal ranges.
+        
+        Used to copy one large table with several concurrent readers. Each
+        range is ``(lower_key, upper_key)`` with an exclusive lower and an
+        inclusive upper bound, suitable for iter_rows; None means unbounded.
+        The default returns a single range covering the whole table.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            key_columns: Primary key columns, in key order
+            num_ranges: Desired number of ranges
+            
+        Returns:
+            List of (lower_key, upper_key) tuples in key order
+        """
+        return [(None, None)]
+
+    def get_primary_keys(
+        self,
+        table: str,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> List[str]:
+        """Get primary key columns for a table.
+        
+        Connectors without key metadata return an empty list, which makes
+        callers fall back to OFFSET pagination.
+        
+        Args:
+            table: Table name
+            database: Database name (optional)
+            schema: Schema name (optional)
+            
+        Returns:
+            List of primary key column names in key order
+        """
+        return []
+
+    def estimate_row_count(
+        self,
+        table: str,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Optional[int]:
+        """Estimate a table's row count from catalog statistics, without scanning it.
+        
+        The estimate is as current as the database's statistics. The default
+        returns None: the connector has no statistics to read.
+        
+        Args:
+            table: Table name
+            database: Database name (optional)
+            schema: Schema name (optional)
+            
+        Returns:
+            Estimated row count, or None when no statistics are available
+        """
+        return None
+
+    def begin_snapshot(self, database: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Start a consistent snapshot for a full load.
+        
+        While the snapshot is active, iter_rows on this connector (and on
+        connectors cloned from it) reads the tables as of the snapshot, so
+        changes committed during the copy are left to CDC. The returned
+        LSN/offset is taken no later than the snapshot point, so CDC resuming
+        from it never misses a change that is not in the snapshot. The
+        default returns None: the connector cannot take consistent snapshots.
+        
+        Args:
+            database: Database name (optional, uses config default if not provided)
+            
+        Returns:
+            LSN/offset dictionary (as returned by extract_lsn_offset) of the
+            snapshot, or None when snapshots are not supported
+        """
+        return None
+
+    def end_snapshot(self) -> None:
+        """End the consistent snapshot started with begin_snapshot."""
+        self.snapshot = None
+
     @abstractmethod
     def extract_lsn_offset(
         self,
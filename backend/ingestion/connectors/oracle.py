@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import oracledb
@@ -48,7 +48,14 @@ except ImportError:
             self.columns = columns or []
             self.properties = properties or {}
 
-from .base_connector import BaseConnector
+from .base_connector import (
+    BaseConnector,
+    build_key_boundary_query,
+    build_key_range_predicate,
+    build_keyset_predicate,
+    get_key_indexes,
+    key_ranges_from_boundaries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -200,6 +207,25 @@ class OracleConnector(BaseConnector):
             except Exception as e:
                 logger.warning(f"Error closing Oracle connection: {e}")
 
+    def begin_snapshot(self, database: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Read full load tables as of the current SCN (flashback query).
+        
+        Every reader queries ``AS OF SCN`` the same SCN that is returned, so
+        the snapshot and the CDC start position are exactly the same point.
+        The SCN must stay within the undo retention for the whole copy.
+        
+        Args:
+            database: Database name (optional, uses config default if not provided)
+            
+        Returns:
+            SCN/offset dictionary of the snapshot, or None when the SCN could not be read
+        """
+        lsn_info = self.extract_lsn_offset(database=database)
+        if not lsn_info.get("scn"):
+            return None
+        self.snapshot = {"scn": lsn_info["scn"]}
+        return lsn_info
+
     def extract_lsn_offset(
         self,
         database: Optional[str] = None
@@ -641,7 +667,9 @@ class OracleConnector(BaseConnector):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data from an Oracle table.
         
@@ -650,7 +678,9 @@ class OracleConnector(BaseConnector):
             schema: Schema name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
+            key_columns: Primary key columns for keyset pagination (optional)
+            after_key: Key values of the last row of the previous page (optional)
             
         Returns:
             Dictionary containing extracted data
@@ -724,14 +754,27 @@ class OracleConnector(BaseConnector):
                 column_list = ", ".join([col for col in column_names])
                 base_query = f'SELECT {column_list} FROM {schema_upper}.{table_upper}'
             
+            key_indexes = get_key_indexes(column_names, key_columns)
+            params: List[Any] = []
+            
+            if key_indexes is not None:
+                # Keyset pagination: seek on the primary key instead of OFFSET, which rescans skipped rows
+                quoted_keys = [f'"{col}"' if use_quotes else col for col in key_columns]
+                data_query = base_query
+                if after_key is not None:
+                    predicate, params = build_keyset_predicate(quoted_keys, after_key, lambda n: f":{n}")
+                    data_query = f"{data_query} WHERE {predicate}"
+                data_query = f"{data_query} ORDER BY {', '.join(quoted_keys)}"
+                if limit is not None:
+                    data_query = f"{data_query} FETCH NEXT {limit} ROWS ONLY"
             # Add pagination using OFFSET/FETCH (Oracle 12c+) or ROWNUM (Oracle 11g and earlier)
-            if limit is not None:
+            elif limit is not None:
                 # Use modern OFFSET/FETCH syntax (Oracle 12c+)
                 data_query = f"{base_query} OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
             else:
                 data_query = base_query
             
-            cursor.execute(data_query)
+            cursor.execute(data_query, params)
             rows = cursor.fetchall()
             
             # Convert rows to list of lists
@@ -740,18 +783,168 @@ class OracleConnector(BaseConnector):
             cursor.close()
             conn.close()
             
+            if key_indexes is not None:
+                has_more = limit is not None and len(rows_list) == limit
+                last_key = [rows_list[-1][i] for i in key_indexes] if rows_list else None
+            else:
+                has_more = (offset + len(rows_list)) < total_rows if limit else False
+                last_key = None
+            
             return {
                 "rows": rows_list,
                 "row_count": len(rows_list),
                 "total_rows": total_rows,
-                "has_more": (offset + len(rows_list)) < total_rows if limit else False,
-                "column_names": column_names
+                "has_more": has_more,
+                "column_names": column_names,
+                "last_key": last_key
             }
             
         except Exception as e:
             logger.error("[Oracle get_table_data] Error extracting data from Oracle: %r", e, exc_info=True)
             raise
 
+    def iter_rows(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of an Oracle table with a single query.
+        
+        The cursor's arraysize and prefetchrows are set to fetch_size so each
+        fetchmany call is served by one round trip.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            fetch_size: Number of rows fetched per round trip and per batch
+            key_columns: Primary key columns the key bounds refer to (optional)
+            lower_key: Only read rows with key > lower_key (optional)
+            upper_key: Only read rows with key <= upper_key (optional)
+            connection: Open connection to read over instead of a new one;
+                it is left open for the caller (optional)
+            batch_sizer: ingestion.batching.AdaptiveBatchSizer whose current
+                batch_size replaces fetch_size before every fetch (optional)
+            lower_inclusive: Also read rows with key == lower_key
+            
+        Yields:
+            Dictionary per batch with rows, row_count and column_names
+        """
+        conn = connection or self.connect()
+        cursor = conn.cursor()
+        cursor.arraysize = fetch_size
+        if hasattr(cursor, "prefetchrows"):
+            # One extra row lets the driver detect end-of-fetch without another round trip
+            cursor.prefetchrows = fetch_size + 1
+        
+        try:
+            query = "SELECT * FROM {table}"
+            if self.snapshot:
+                query = f"{query} AS OF SCN {int(self.snapshot['scn'])}"
+            params: List[Any] = []
+            if key_columns:
+                predicate, params = build_key_range_predicate(
+                    [f'"{col}"' for col in key_columns], lower_key, upper_key, lambda n: f":{n}",
+                    lower_inclusive=lower_inclusive
+                )
+                if predicate:
+                    query = f"{query} WHERE {predicate}"
+            self._execute_table_query(cursor, schema, table_name, query, params)
+            
+            column_names = [desc[0] for desc in cursor.description]
+            
+            total = 0
+            while True:
+                if batch_sizer is not None:
+                    fetch_size = cursor.arraysize = batch_sizer.batch_size
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                total += len(rows)
+                yield {
+                    "rows": [list(row) for row in rows],
+                    "row_count": len(rows),
+                    "column_names": column_names
+                }
+            
+            logger.info("[Oracle iter_rows] Streamed %d rows from %s.%s", total, schema, table_name)
+            
+        except Exception as e:
+            logger.error("[Oracle iter_rows] Error streaming data from Oracle: %r", e, exc_info=True)
+            raise
+        finally:
+            cursor.close()
+            if connection is None:
+                conn.close()
+
+    def _execute_table_query(
+        self,
+        cursor,
+        schema: str,
+        table_name: str,
+        query: str,
+        params: Optional[List[Any]] = None
+    ) -> None:
+        """Execute a query whose ``{table}`` placeholder is the quoted table reference.
+        
+        Unquoted identifiers are stored uppercase, so the uppercase name is
+        tried first, then the original (case-sensitive) name.
+        """
+        try:
+            schema_escaped = schema.upper().replace('"', '""')
+            table_escaped = table_name.upper().replace('"', '""')
+            cursor.execute(query.replace("{table}", f'"{schema_escaped}"."{table_escaped}"'), params or [])
+        except Exception as e1:
+            logger.info("[Oracle] Uppercase lookup failed for %s.%s (%r), trying original case", schema, table_name, e1)
+            schema_escaped = schema.replace('"', '""')
+            table_escaped = table_name.replace('"', '""')
+            cursor.execute(query.replace("{table}", f'"{schema_escaped}"."{table_escaped}"'), params or [])
+
+    def get_key_ranges(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        key_columns: List[str],
+        num_ranges: int
+    ) -> List[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+        """Split a table's primary key space into ranges using NTILE.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            key_columns: Primary key columns, in key order
+            num_ranges: Desired number of ranges
+            
+        Returns:
+            List of (lower_key, upper_key) tuples in key order
+        """
+        if num_ranges <= 1 or not key_columns:
+            return [(None, None)]
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            query = build_key_boundary_query([f'"{col}"' for col in key_columns], "{table}", num_ranges)
+            self._execute_table_query(cursor, schema, table_name, query)
+            boundaries = [list(row) for row in cursor.fetchall()]
+            ranges = key_ranges_from_boundaries(boundaries)
+            logger.info("[Oracle get_key_ranges] Split %s.%s into %d key ranges on %s", schema, table_name, len(ranges), key_columns)
+            return ranges
+        finally:
+            cursor.close()
+            conn.close()
+
     def get_table_columns(
         self,
         table: str,
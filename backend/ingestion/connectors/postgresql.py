@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
+import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import psycopg2
@@ -18,7 +19,12 @@ except ImportError:
     sql = None  # type: ignore
     RealDictCursor = None  # type: ignore
 
-from .base_connector import BaseConnector
+from .base_connector import (
+    BaseConnector,
+    build_key_boundary_query,
+    get_key_indexes,
+    key_ranges_from_boundaries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +55,8 @@ class PostgreSQLConnector(BaseConnector):
             connection_config["user"] = connection_config["username"]
         
         super().__init__(connection_config)
+        # Connection holding the transaction of an exported snapshot
+        self._snapshot_conn = None
 
     def _validate_config(self) -> None:
         """Validate that required connection parameters are present."""
@@ -435,7 +443,9 @@ class PostgreSQLConnector(BaseConnector):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data rows from a table.
 
@@ -444,7 +454,9 @@ class PostgreSQLConnector(BaseConnector):
             schema: Schema name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
+            key_columns: Primary key columns for keyset pagination (optional)
+            after_key: Key values of the last row of the previous page (optional)
 
         Returns:
             Dictionary containing data extraction results
@@ -492,8 +504,26 @@ class PostgreSQLConnector(BaseConnector):
                 sql.Identifier(table_name)
             )
 
+            key_indexes = get_key_indexes(column_names, key_columns)
+
             # Add pagination
-            if limit is not None:
+            if key_indexes is not None:
+                # Keyset pagination: seek past the last key instead of rescanning skipped rows
+                params: List[Any] = []
+                key_list = sql.SQL(", ").join([sql.Identifier(col) for col in key_columns])
+                if after_key is not None:
+                    data_query = sql.SQL("{} WHERE ({}) > ({})").format(
+                        data_query,
+                        key_list,
+                        sql.SQL(", ").join([sql.Placeholder()] * len(key_columns))
+                    )
+                    params.extend(after_key)
+                data_query = sql.SQL("{} ORDER BY {}").format(data_query, key_list)
+                if limit is not None:
+                    data_query = sql.SQL("{} LIMIT %s").format(data_query)
+                    params.append(limit)
+                cursor.execute(data_query, params)
+            elif limit is not None:
                 data_query = sql.SQL("{} LIMIT %s OFFSET %s").format(data_query)
                 cursor.execute(data_query, (limit, offset))
             else:
@@ -505,7 +535,12 @@ class PostgreSQLConnector(BaseConnector):
 
             # Check if there are more rows
             has_more = False
-            if limit is not None:
+            last_key = None
+            if key_indexes is not None:
+                has_more = limit is not None and len(row_data) == limit
+                if row_data:
+                    last_key = [row_data[-1][i] for i in key_indexes]
+            elif limit is not None:
                 rows_extracted = len(row_data)
                 has_more = (offset + rows_extracted) < total_rows
 
@@ -519,7 +554,8 @@ class PostgreSQLConnector(BaseConnector):
                 "row_count": len(row_data),
                 "total_rows": total_rows,
                 "has_more": has_more,
-                "column_names": column_names
+                "column_names": column_names,
+                "last_key": last_key
             }
 
         except Exception as e:
@@ -529,6 +565,187 @@ class PostgreSQLConnector(BaseConnector):
             cursor.close()
             conn.close()
 
+    def iter_rows(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of a table through a named (server-side) cursor.
+
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            fetch_size: Number of rows fetched per round trip and per batch
+            key_columns: Primary key columns the key bounds refer to (optional)
+            lower_key: Only read rows with key > lower_key (optional)
+            upper_key: Only read rows with key <= upper_key (optional)
+            connection: Open connection to read over instead of a new one;
+                it is left open for the caller (optional)
+            batch_sizer: ingestion.batching.AdaptiveBatchSizer whose current
+                batch_size replaces fetch_size before every fetch (optional)
+            lower_inclusive: Also read rows with key == lower_key
+
+        Yields:
+            Dictionary per batch with rows, row_count and column_names
+        """
+        conn = connection or self.connect()
+        # Named cursors only live inside a transaction
+        conn.autocommit = False
+        if self.snapshot:
+            # Import the exported snapshot; must be the first statements of the transaction
+            setup_cursor = conn.cursor()
+            try:
+                setup_cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+                setup_cursor.execute("SET TRANSACTION SNAPSHOT %s", (self.snapshot["snapshot_id"],))
+            finally:
+                setup_cursor.close()
+        cursor = conn.cursor(name=f"iter_rows_{uuid.uuid4().hex}")
+        cursor.itersize = fetch_size
+
+        try:
+            query = sql.SQL("SELECT * FROM {}.{}").format(
+                sql.Identifier(schema),
+                sql.Identifier(table_name)
+            )
+            params: List[Any] = []
+            if key_columns and (lower_key is not None or upper_key is not None):
+                key_list = sql.SQL(", ").join([sql.Identifier(col) for col in key_columns])
+                key_placeholders = sql.SQL(", ").join([sql.Placeholder()] * len(key_columns))
+                predicates = []
+                if lower_key is not None:
+                    lower_operator = sql.SQL(">=" if lower_inclusive else ">")
+                    predicates.append(sql.SQL("({}) {} ({})").format(key_list, lower_operator, key_placeholders))
+                    params.extend(lower_key)
+                if upper_key is not None:
+                    predicates.append(sql.SQL("({}) <= ({})").format(key_list, key_placeholders))
+                    params.extend(upper_key)
+                query = sql.SQL("{} WHERE {}").format(query, sql.SQL(" AND ").join(predicates))
+            cursor.execute(query, params or None)
+
+            column_names: Optional[List[str]] = None
+            total = 0
+            while True:
+                if batch_sizer is not None:
+                    fetch_size = batch_sizer.batch_size
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                if column_names is None:
+                    column_names = [desc[0] for desc in cursor.description]
+                total += len(rows)
+                yield {
+                    "rows": [list(row) for row in rows],
+                    "row_count": len(rows),
+                    "column_names": column_names
+                }
+
+            logger.info(f"Streamed {total} rows from {schema}.{table_name}")
+
+        except Exception as e:
+            logger.error(f"Error streaming data from {schema}.{table_name}: {e}")
+            raise
+        finally:
+            try:
+                cursor.close()
+                conn.rollback()
+            finally:
+                if connection is None:
+                    conn.close()
+
+    def get_key_ranges(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        key_columns: List[str],
+        num_ranges: int
+    ) -> List[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+        """Split a table's primary key space into ranges using NTILE.
+
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            key_columns: Primary key columns, in key order
+            num_ranges: Desired number of ranges
+
+        Returns:
+            List of (lower_key, upper_key) tuples in key order
+        """
+        if num_ranges <= 1 or not key_columns:
+            return [(None, None)]
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        try:
+            query = build_key_boundary_query(
+                [sql.Identifier(col).as_string(conn) for col in key_columns],
+                sql.SQL("{}.{}").format(sql.Identifier(schema), sql.Identifier(table_name)).as_string(conn),
+                num_ranges
+            )
+            cursor.execute(query)
+            boundaries = [list(row) for row in cursor.fetchall()]
+            ranges = key_ranges_from_boundaries(boundaries)
+            logger.info(f"Split {schema}.{table_name} into {len(ranges)} key ranges on {key_columns}")
+            return ranges
+        finally:
+            cursor.close()
+            conn.close()
+
+    def begin_snapshot(self, database: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Export a snapshot that all full load readers import.
+
+        The exporting REPEATABLE READ transaction is kept open on its own
+        connection until end_snapshot, since the snapshot can only be imported
+        while it is. The WAL LSN is read right before the snapshot is taken.
+
+        Args:
+            database: Database name (optional, uses config default if not provided)
+
+        Returns:
+            LSN/offset dictionary of the snapshot
+        """
+        lsn_info = self.extract_lsn_offset(database=database)
+
+        conn = self.connect()
+        conn.autocommit = False
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            cursor.execute("SELECT pg_export_snapshot()")
+            snapshot_id = cursor.fetchone()[0]
+        except Exception:
+            conn.close()
+            raise
+        finally:
+            cursor.close()
+
+        self._snapshot_conn = conn
+        self.snapshot = {"snapshot_id": snapshot_id}
+        logger.info(f"Exported snapshot {snapshot_id} at LSN {lsn_info.get('lsn')}")
+        return lsn_info
+
+    def end_snapshot(self) -> None:
+        """Close the transaction that exported the snapshot."""
+        if self._snapshot_conn is not None:
+            try:
+                self._snapshot_conn.rollback()
+                self._snapshot_conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing snapshot connection: {e}")
+            self._snapshot_conn = None
+        super().end_snapshot()
+
     def extract_lsn_offset(
         self,
         database: Optional[str] = None
@@ -1327,6 +1544,44 @@ class PostgreSQLConnector(BaseConnector):
             if conn:
                 conn.close()
 
+    def estimate_row_count(
+        self,
+        table: str,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Optional[int]:
+        """Estimate row count from pg_class.reltuples (maintained by VACUUM/ANALYZE).
+
+        Args:
+            table: Table name
+            database: Database name (optional, must be the connection's database)
+            schema: Schema name (optional)
+
+        Returns:
+            Estimated row count, or None when the table was never analyzed
+        """
+        schema = schema or self.config.get("schema", "public")
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT c.reltuples
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relname = %s
+                """,
+                (schema, table)
+            )
+            row = cursor.fetchone()
+            # reltuples is -1 until the table is first analyzed (PostgreSQL 14+)
+            if row is None or row[0] is None or row[0] < 0:
+                return None
+            return int(row[0])
+        finally:
+            cursor.close()
+            conn.close()
+
     def get_version(self) -> str:
         """Get database version.
 
@@ -361,7 +361,9 @@ class S3Connector(BaseConnector):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data from an S3 object.
         
@@ -371,6 +373,8 @@ class S3Connector(BaseConnector):
             table_name: Object key/name
             limit: Maximum number of rows to extract (None for all rows)
             offset: Number of rows to skip (for pagination)
+            key_columns: Ignored; S3 objects have no primary key (always OFFSET pagination)
+            after_key: Ignored; S3 objects have no primary key
             
         Returns:
             Dictionary containing:
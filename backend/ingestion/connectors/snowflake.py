@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import snowflake.connector as snowflake_connector
@@ -41,7 +41,7 @@ except ImportError:
             self.columns = columns or []
             self.properties = properties or {}
 
-from .base_connector import BaseConnector
+from .base_connector import BaseConnector, build_key_range_predicate, build_keyset_predicate, get_key_indexes
 
 logger = logging.getLogger(__name__)
 
@@ -463,7 +463,9 @@ class SnowflakeConnector(BaseConnector):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data from a Snowflake table.
         
@@ -472,7 +474,9 @@ class SnowflakeConnector(BaseConnector):
             schema: Schema name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
+            key_columns: Primary key columns for keyset pagination (optional)
+            after_key: Key values of the last row of the previous page (optional)
             
         Returns:
             Dictionary containing extracted data
@@ -483,13 +487,24 @@ class SnowflakeConnector(BaseConnector):
             
             # Build query with limit and offset
             query = f'SELECT * FROM "{database}"."{schema}"."{table_name}"'
+            params: List[Any] = []
+            
+            if key_columns:
+                # Keyset pagination: seek on the primary key instead of OFFSET, which rescans skipped rows
+                quoted_keys = [f'"{col}"' for col in key_columns]
+                if after_key is not None:
+                    predicate, params = build_keyset_predicate(quoted_keys, after_key, lambda n: "%s")
+                    query += f" WHERE {predicate}"
+                query += f" ORDER BY {', '.join(quoted_keys)}"
+                if limit:
+                    query += f" LIMIT {limit}"
+            else:
+                if limit:
+                    query += f" LIMIT {limit}"
+                if offset > 0:
+                    query += f" OFFSET {offset}"
             
-            if limit:
-                query += f" LIMIT {limit}"
-            if offset > 0:
-                query += f" OFFSET {offset}"
-            
-            cursor.execute(query)
+            cursor.execute(query, params or None)
             rows = cursor.fetchall()
             
             # Get column names
@@ -500,18 +515,113 @@ class SnowflakeConnector(BaseConnector):
             
             cursor.close()
             
+            key_indexes = get_key_indexes(column_names, key_columns)
+            last_key = None
+            has_more = False  # Can't determine without another query in OFFSET mode
+            if key_indexes is not None:
+                has_more = bool(limit) and len(rows_list) == limit
+                if rows_list:
+                    last_key = [rows_list[-1][i] for i in key_indexes]
+            
             return {
                 "rows": rows_list,
                 "row_count": len(rows_list),
                 "total_rows": len(rows_list),  # Snowflake doesn't provide total count easily
-                "has_more": False,  # Can't determine without another query
-                "column_names": column_names
+                "has_more": has_more,
+                "column_names": column_names,
+                "last_key": last_key
             }
             
         except Exception as e:
             logger.error(f"Error extracting data from Snowflake: {e}")
             raise
 
+    def iter_rows(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of a Snowflake table from its result batches.
+        
+        The query runs once and its result batches are downloaded one at a
+        time, then re-chunked to fetch_size rows.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            fetch_size: Maximum number of rows per yielded batch
+            key_columns: Primary key columns the key bounds refer to (optional)
+            lower_key: Only read rows with key > lower_key (optional)
+            upper_key: Only read rows with key <= upper_key (optional)
+            connection: Open connection to read over instead of a new one;
+                it is left open for the caller (optional)
+            batch_sizer: ingestion.batching.AdaptiveBatchSizer whose current
+                batch_size replaces fetch_size before every fetch (optional)
+            lower_inclusive: Also read rows with key == lower_key
+            
+        Yields:
+            Dictionary per batch with rows, row_count and column_names
+        """
+        conn = connection or self._get_connection()
+        cursor = conn.cursor()
+        
+        try:
+            query = f'SELECT * FROM "{database}"."{schema}"."{table_name}"'
+            params: List[Any] = []
+            if key_columns:
+                predicate, params = build_key_range_predicate(
+                    [f'"{col}"' for col in key_columns], lower_key, upper_key, lambda n: "%s",
+                    lower_inclusive=lower_inclusive
+                )
+                if predicate:
+                    query += f" WHERE {predicate}"
+            cursor.execute(query, params or None)
+            column_names = [desc[0] for desc in cursor.description]
+            
+            result_batches = cursor.get_result_batches()
+            if result_batches is None:
+                # Result not available as batches, page through the cursor instead
+                row_source = (row for chunk in iter(lambda: cursor.fetchmany(fetch_size), []) for row in chunk)
+            else:
+                row_source = (row for result_batch in result_batches for row in result_batch)
+            
+            total = 0
+            buffer: List[List[Any]] = []
+            for row in row_source:
+                buffer.append(list(row))
+                if len(buffer) >= (batch_sizer.batch_size if batch_sizer is not None else fetch_size):
+                    total += len(buffer)
+                    yield {
+                        "rows": buffer,
+                        "row_count": len(buffer),
+                        "column_names": column_names
+                    }
+                    buffer = []
+            if buffer:
+                total += len(buffer)
+                yield {
+                    "rows": buffer,
+                    "row_count": len(buffer),
+                    "column_names": column_names
+                }
+            
+            logger.info(f"Streamed {total} rows from {database}.{schema}.{table_name}")
+            
+        except Exception as e:
+            logger.error(f"Error streaming data from Snowflake: {e}")
+            raise
+        finally:
+            cursor.close()
+
     def full_load(
         self,
         tables: List[str],
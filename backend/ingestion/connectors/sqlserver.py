@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import pyodbc
@@ -43,7 +43,14 @@ except ImportError:
             self.columns = columns or []
             self.properties = properties or {}
 
-from .base_connector import BaseConnector
+from .base_connector import (
+    BaseConnector,
+    build_key_boundary_query,
+    build_key_range_predicate,
+    build_keyset_predicate,
+    get_key_indexes,
+    key_ranges_from_boundaries,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -1290,6 +1297,47 @@ class SQLServerConnector(BaseConnector):
             logger.error(f"Failed to get row count for {target_database}.{target_schema}.{table}: {e}", exc_info=True)
             raise
 
+    def estimate_row_count(
+        self,
+        table: str,
+        database: Optional[str] = None,
+        schema: Optional[str] = None
+    ) -> Optional[int]:
+        """Estimate row count from sys.partitions (heap or clustered index rows).
+
+        Args:
+            table: Table name
+            database: Database name (optional)
+            schema: Schema name (optional)
+
+        Returns:
+            Estimated row count, or None when the table is not found
+        """
+        database = database or self.config.get("database", "master")
+        schema = schema or self.config.get("schema", "dbo")
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"USE [{database}]")
+            cursor.execute(
+                """
+                SELECT SUM(p.rows)
+                FROM sys.partitions p
+                INNER JOIN sys.tables t ON t.object_id = p.object_id
+                INNER JOIN sys.schemas s ON s.schema_id = t.schema_id
+                WHERE s.name = ? AND t.name = ? AND p.index_id IN (0, 1)
+                """,
+                (schema, table)
+            )
+            row = cursor.fetchone()
+            if row is None or row[0] is None:
+                return None
+            return int(row[0])
+        finally:
+            cursor.close()
+            conn.close()
+
     def get_version(self) -> str:
         """Get database version.
 
@@ -2247,6 +2295,8 @@ class SQLServerConnector(BaseConnector):
         limit: Optional[int] = None,
         offset: int = 0,
         include_schema: bool = True,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None,
     ) -> Dict[str, Any]:
         """Extract actual data rows from a table along with schema information.
         
@@ -2258,8 +2308,10 @@ class SQLServerConnector(BaseConnector):
             schema: Schema name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows, use with caution)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
             include_schema: Whether to include schema metadata in the response
+            key_columns: Primary key columns for keyset pagination (optional)
+            after_key: Key values of the last row of the previous page (optional)
             
         Returns:
             Dictionary containing:
@@ -2363,19 +2415,41 @@ class SQLServerConnector(BaseConnector):
             
             # Build SELECT query with column names
             column_list = ", ".join([f"[{col}]" for col in column_names])
-            data_query = f"""
-                SELECT {column_list}
-                FROM [{schema}].[{table_name}]
-                ORDER BY (SELECT NULL)  -- No specific ordering, faster
-            """
-            
-            # Add pagination if limit is specified
-            if limit is not None:
-                data_query += f" OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
+            key_indexes = get_key_indexes(column_names, key_columns)
+            params: List[Any] = []
+            
+            if key_indexes is not None:
+                # Keyset pagination: seek on the primary key instead of OFFSET, which rescans skipped rows
+                quoted_keys = [f"[{col}]" for col in key_columns]
+                where_clause = ""
+                if after_key is not None:
+                    predicate, params = build_keyset_predicate(quoted_keys, after_key, lambda n: "?")
+                    where_clause = f"WHERE {predicate}"
+                data_query = f"""
+                    SELECT {column_list}
+                    FROM [{schema}].[{table_name}]
+                    {where_clause}
+                    ORDER BY {", ".join(quoted_keys)}
+                """
+                if limit is not None:
+                    data_query += f" OFFSET 0 ROWS FETCH NEXT {limit} ROWS ONLY"
+            else:
+                data_query = f"""
+                    SELECT {column_list}
+                    FROM [{schema}].[{table_name}]
+                    ORDER BY (SELECT NULL)  -- No specific ordering, faster
+                """
+                
+                # Add pagination if limit is specified
+                if limit is not None:
+                    data_query += f" OFFSET {offset} ROWS FETCH NEXT {limit} ROWS ONLY"
             
             # Execute data extraction query
-            logger.info(f"Extracting data from {database}.{schema}.{table_name} (limit={limit}, offset={offset})")
-            cursor.execute(data_query)
+            logger.info(
+                f"Extracting data from {database}.{schema}.{table_name} "
+                f"(limit={limit}, offset={offset}, keyset={key_indexes is not None})"
+            )
+            cursor.execute(data_query, params)
             
             # Fetch all rows
             rows = cursor.fetchall()
@@ -2385,7 +2459,12 @@ class SQLServerConnector(BaseConnector):
             
             # Check if there are more rows
             has_more = False
-            if limit is not None:
+            last_key = None
+            if key_indexes is not None:
+                has_more = limit is not None and len(row_data) == limit
+                if row_data:
+                    last_key = [row_data[-1][i] for i in key_indexes]
+            elif limit is not None:
                 rows_extracted = len(row_data)
                 has_more = (offset + rows_extracted) < total_rows
             else:
@@ -2396,7 +2475,8 @@ class SQLServerConnector(BaseConnector):
                 "row_count": len(row_data),
                 "total_rows": total_rows,
                 "has_more": has_more,
-                "column_names": column_names  # Include column names for row mapping
+                "column_names": column_names,  # Include column names for row mapping
+                "last_key": last_key
             }
             
             logger.info(
@@ -2518,6 +2598,41 @@ class SQLServerConnector(BaseConnector):
         
         return result
 
+    def begin_snapshot(self, database: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Read full load tables under SNAPSHOT isolation.
+        
+        SQL Server snapshots cannot be shared between connections, so every
+        reader gets its own snapshot when it starts reading; the LSN is read
+        before any of them. Requires ALLOW_SNAPSHOT_ISOLATION on the database.
+        
+        Args:
+            database: Database name (optional, uses config default if not provided)
+            
+        Returns:
+            LSN/offset dictionary of the snapshot, or None when snapshot
+            isolation is not enabled
+        """
+        database = database or self.config.get("database", "master")
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT snapshot_isolation_state FROM sys.databases WHERE name = ?", (database,))
+            row = cursor.fetchone()
+        finally:
+            cursor.close()
+            conn.close()
+        
+        if not row or row[0] != 1:
+            logger.warning(
+                f"Snapshot isolation is not enabled on database {database} "
+                f"(ALTER DATABASE [{database}] SET ALLOW_SNAPSHOT_ISOLATION ON)"
+            )
+            return None
+        
+        lsn_info = self.extract_lsn_offset(database=database)
+        self.snapshot = {"isolation": "snapshot"}
+        return lsn_info
+
     def extract_lsn_offset(
         self,
         database: Optional[str] = None
@@ -2740,7 +2855,9 @@ class SQLServerConnector(BaseConnector):
         schema: str,
         table_name: str,
         limit: Optional[int] = None,
-        offset: int = 0
+        offset: int = 0,
+        key_columns: Optional[List[str]] = None,
+        after_key: Optional[List[Any]] = None
     ) -> Dict[str, Any]:
         """Extract actual data rows from a table.
         
@@ -2751,7 +2868,9 @@ class SQLServerConnector(BaseConnector):
             schema: Schema name
             table_name: Table name
             limit: Maximum number of rows to extract (None for all rows)
-            offset: Number of rows to skip (for pagination)
+            offset: Number of rows to skip (for pagination, ignored in keyset mode)
+            key_columns: Primary key columns for keyset pagination (optional)
+            after_key: Key values of the last row of the previous page (optional)
             
         Returns:
             Dictionary containing data extraction results
@@ -2762,12 +2881,127 @@ class SQLServerConnector(BaseConnector):
             table_name=table_name,
             limit=limit,
             offset=offset,
-            include_schema=False
+            include_schema=False,
+            key_columns=key_columns,
+            after_key=after_key
         )
         
         # Return only the data portion to match base interface
         return result["data"]
 
+    def iter_rows(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        fetch_size: int = 10000,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        connection: Optional[Any] = None,
+        batch_sizer: Optional[Any] = None,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream all rows of a table with a single query and fetchmany.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            fetch_size: Number of rows fetched per round trip and per batch
+            key_columns: Primary key columns the key bounds refer to (optional)
+            lower_key: Only read rows with key > lower_key (optional)
+            upper_key: Only read rows with key <= upper_key (optional)
+            connection: Open connection to read over instead of a new one;
+                it is left open for the caller (optional)
+            batch_sizer: ingestion.batching.AdaptiveBatchSizer whose current
+                batch_size replaces fetch_size before every fetch (optional)
+            lower_inclusive: Also read rows with key == lower_key
+            
+        Yields:
+            Dictionary per batch with rows, row_count and column_names
+        """
+        conn = connection or self.connect()
+        cursor = conn.cursor()
+        cursor.arraysize = fetch_size
+        
+        try:
+            cursor.execute(f"USE [{database}]")
+            if self.snapshot:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL SNAPSHOT")
+            query = f"SELECT * FROM [{schema}].[{table_name}]"
+            params: List[Any] = []
+            if key_columns:
+                predicate, params = build_key_range_predicate(
+                    [f"[{col}]" for col in key_columns], lower_key, upper_key, lambda n: "?",
+                    lower_inclusive=lower_inclusive
+                )
+                if predicate:
+                    query = f"{query} WHERE {predicate}"
+            cursor.execute(query, params)
+            column_names = [desc[0] for desc in cursor.description]
+            
+            total = 0
+            while True:
+                if batch_sizer is not None:
+                    fetch_size = cursor.arraysize = batch_sizer.batch_size
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    break
+                total += len(rows)
+                yield {
+                    "rows": [list(row) for row in rows],
+                    "row_count": len(rows),
+                    "column_names": column_names
+                }
+            
+            logger.info(f"Streamed {total} rows from {schema}.{table_name}")
+            
+        except Exception as e:
+            logger.error(f"Error streaming data from {schema}.{table_name}: {e}")
+            raise
+        finally:
+            cursor.close()
+            if connection is None:
+                conn.close()
+
+    def get_key_ranges(
+        self,
+        database: str,
+        schema: str,
+        table_name: str,
+        key_columns: List[str],
+        num_ranges: int
+    ) -> List[Tuple[Optional[List[Any]], Optional[List[Any]]]]:
+        """Split a table's primary key space into ranges using NTILE.
+        
+        Args:
+            database: Database name
+            schema: Schema name
+            table_name: Table name
+            key_columns: Primary key columns, in key order
+            num_ranges: Desired number of ranges
+        
+        Returns:
+            List of (lower_key, upper_key) tuples in key order
+        """
+        if num_ranges <= 1 or not key_columns:
+            return [(None, None)]
+        
+        conn = self.connect()
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute(f"USE [{database}]")
+            cursor.execute(build_key_boundary_query([f"[{col}]" for col in key_columns], f"[{schema}].[{table_name}]", num_ranges))
+            boundaries = [list(row) for row in cursor.fetchall()]
+            ranges = key_ranges_from_boundaries(boundaries)
+            logger.info(f"Split {schema}.{table_name} into {len(ranges)} key ranges on {key_columns}")
+            return ranges
+        finally:
+            cursor.close()
+            conn.close()
+
     def full_load(
         self,
         tables: List[str],
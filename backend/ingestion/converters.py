@@ -0,0 +1,193 @@
+"""Per-column value converters, planned once per table."""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+Converter = Callable[[Any], Any]
+
+# Registry key for LOB-like values (objects with a read() method)
+LOB = "lob"
+
+
+def passthrough(value: Any) -> Any:
+    """Marker converter for columns whose values are written as they are."""
+    return value
+
+
+def read_lob(value: Any) -> Any:
+    return value.read()
+
+
+def _isoformat(value: Any) -> str:
+    return value.isoformat()
+
+
+def _hex(value: Any) -> str:
+    return bytes(value).hex()
+
+
+def _read_lob_json(value: Any) -> Any:
+    data = value.read()
+    return bytes(data).hex() if isinstance(data, (bytes, bytearray, memoryview)) else data
+
+
+# JSON documents (Snowflake RECORD_CONTENT): temporal values as ISO 8601, binary as hex
+JSON_CONVERTERS: Dict[Any, Converter] = {
+    bool: passthrough,
+    int: passthrough,
+    float: passthrough,
+    str: passthrough,
+    Decimal: str,
+    datetime: _isoformat,
+    date: _isoformat,
+    dt_time: _isoformat,
+    timedelta: str,
+    uuid.UUID: str,
+    bytes: _hex,
+    bytearray: _hex,
+    memoryview: _hex,
+    dict: passthrough,
+    list: passthrough,
+    LOB: _read_lob_json,
+}
+
+def _json_text(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+# DB-API parameters (executemany): drivers bind native types, LOBs are read first
+PARAMETER_CONVERTERS: Dict[Any, Converter] = {
+    dict: _json_text,
+    list: _json_text,
+    LOB: read_lob,
+}
+
+# Parquet columns: LOBs are read, everything else is typed by pyarrow
+PARQUET_CONVERTERS: Dict[Any, Converter] = {
+    LOB: read_lob,
+}
+
+
+def to_parameter_value(value: Any) -> Any:
+    """Convert any source value to a DB-API parameter (fallback of PARAMETER_CONVERTERS)."""
+    if isinstance(value, (dict, list)):
+        return _json_text(value)
+    if hasattr(value, "read"):
+        return value.read()
+    return value
+
+
+def resolve_converter(value: Any, registry: Dict[Any, Converter], default: Optional[Converter] = None) -> Converter:
+    """Look up the converter of a value's type (or of LOBs) in a registry.
+
+    Args:
+        value: A non-NULL value of the column
+        registry: Python type (or LOB) -> converter
+        default: Converter for types missing from the registry (default: pass through)
+
+    Returns:
+        Converter function
+    """
+    if hasattr(value, "read") and LOB in registry:
+        return registry[LOB]
+    for value_type in type(value).__mro__:
+        converter = registry.get(value_type)
+        if converter is not None:
+            return converter
+    return default or passthrough
+
+
+def convert_values(values: List[Any], converter: Converter, fallback: Converter) -> List[Any]:
+    """Convert the values of one column; NULLs stay None.
+
+    If ``converter`` fails on a value (a type other than the planned one),
+    the whole column is converted again with ``fallback``.
+    """
+    if converter is passthrough:
+        return values
+    try:
+        return [None if value is None else converter(value) for value in values]
+    except Exception:
+        return [None if value is None else fallback(value) for value in values]
+
+
+class ColumnConverters:
+    """Converts the values of a table's columns with one converter per column.
+
+    The converter of a column is looked up once, from the type of the first
+    non-NULL value seen in the column, in a registry mapping Python types
+    (or ``LOB``) to converter functions. Each batch is then converted column
+    by column with the planned function, without inspecting the values.
+    Columns whose type is not in the registry are passed through, unless a
+    ``default`` converter is given. If a planned converter fails on a value
+    of another type, that column of the batch is converted again with the
+    ``fallback`` converter, which handles any value.
+    """
+
+    def __init__(
+        self,
+        column_names: List[str],
+        registry: Dict[Any, Converter],
+        fallback: Converter,
+        default: Optional[Converter] = None
+    ):
+        """Initialize column converters.
+
+        Args:
+            column_names: Column names, in row order
+            registry: Python type (or LOB) -> converter
+            fallback: Converter for values the planned converter cannot handle
+            default: Converter for types missing from the registry (default: pass through)
+        """
+        self.column_names = list(column_names)
+        self.registry = registry
+        self.fallback = fallback
+        self.default = default
+        self.converters: List[Optional[Converter]] = [None] * len(self.column_names)
+
+    def _plan(self, rows: Sequence[Sequence[Any]]) -> None:
+        for index, converter in enumerate(self.converters):
+            if converter is not None:
+                continue
+            for row in rows:
+                value = row[index]
+                if value is not None:
+                    self.converters[index] = resolve_converter(value, self.registry, self.default)
+                    logger.debug(
+                        f"Column {self.column_names[index]} ({type(value).__name__}) "
+                        f"converted with {getattr(self.converters[index], '__name__', 'converter')}"
+                    )
+                    break
+
+    def convert_rows(self, rows: Sequence[Sequence[Any]]) -> List[List[Any]]:
+        """Convert a batch of rows; NULLs stay None.
+
+        Args:
+            rows: Rows, in ``column_names`` order
+
+        Returns:
+            The rows as lists with converted values (list rows are updated in place)
+        """
+        if not rows:
+            return []
+        if not isinstance(rows[0], list):
+            rows = [list(row) for row in rows]
+        if any(converter is None for converter in self.converters):
+            # Columns that were all NULL so far are planned from this batch
+            self._plan(rows)
+
+        for index, converter in enumerate(self.converters):
+            if converter is None or converter is passthrough:
+                continue
+            converted = convert_values([row[index] for row in rows], converter, self.fallback)
+            for row, value in zip(rows, converted):
+                row[index] = value
+        return rows
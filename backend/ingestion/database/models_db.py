@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 import uuid
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, JSON, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, Float, Text, JSON, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ingestion.database.base import Base
 import enum
@@ -56,6 +56,7 @@ class PipelineMode(str, enum.Enum):
     FULL_LOAD_ONLY = "full_load_only"
     CDC_ONLY = "cdc_only"
     FULL_LOAD_AND_CDC = "full_load_and_cdc"
+    INCREMENTAL_RELOAD = "incremental_reload"
 
 
 class ConnectionModel(Base):
@@ -123,6 +124,7 @@ class PipelineModel(Base):
     
     debezium_config = Column(JSON, default={})
     sink_config = Column(JSON, default={})
+    full_load_config = Column(JSON, default={})  # Full load tuning, e.g. {"max_parallel_tables": 4}
     
     auto_create_target = Column(Boolean, default=True)
     target_table_mapping = Column(JSON, nullable=True)  # Dict mapping source_table -> target_table
@@ -136,6 +138,10 @@ class PipelineModel(Base):
     target_connection = relationship("ConnectionModel", foreign_keys=[target_connection_id], back_populates="pipelines_as_target")
     runs = relationship("PipelineRunModel", back_populates="pipeline", cascade="all, delete-orphan")
     metrics = relationship("PipelineMetricsModel", back_populates="pipeline", cascade="all, delete-orphan")
+    full_load_checkpoints = relationship("FullLoadCheckpointModel", back_populates="pipeline", cascade="all, delete-orphan")
+    full_load_progress = relationship("FullLoadProgressModel", back_populates="pipeline", cascade="all, delete-orphan")
+    incremental_watermarks = relationship("IncrementalWatermarkModel", back_populates="pipeline", cascade="all, delete-orphan")
+    event_rollups = relationship("CDCEventRollupModel", back_populates="pipeline", cascade="all, delete-orphan")
     
     __table_args__ = (
         Index('idx_pipeline_status', 'status'),
@@ -168,6 +174,98 @@ class PipelineRunModel(Base):
     )
 
 
+class CDCEventRollupModel(Base):
+    __tablename__ = "cdc_event_rollups"
+    
+    # One row per pipeline, table, event type, status and minute
+    pipeline_id = Column(String(36), ForeignKey('pipelines.id'), primary_key=True)
+    schema_name = Column(String(255), primary_key=True)
+    table_name = Column(String(255), primary_key=True)
+    event_type = Column(String(50), primary_key=True)  # insert, update, delete, truncate
+    status = Column(String(50), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)  # Event time truncated to the minute
+    
+    event_count = Column(BigInteger, nullable=False, default=0)
+    total_bytes = Column(BigInteger, nullable=False, default=0)  # Kafka message bytes
+    max_latency_ms = Column(BigInteger, nullable=True)  # Source commit to event logger
+    last_event_at = Column(DateTime, nullable=True)
+    
+    pipeline = relationship("PipelineModel", back_populates="event_rollups")
+    
+    __table_args__ = (
+        Index('idx_event_rollup_bucket', 'bucket_start'),
+    )
+
+
+class FullLoadCheckpointModel(Base):
+    __tablename__ = "full_load_checkpoints"
+    
+    id = Column(String(36), primary_key=True)
+    pipeline_id = Column(String(36), ForeignKey('pipelines.id'), nullable=False)
+    table_name = Column(String(255), nullable=False)
+    
+    status = Column(String(50), nullable=False, default="in_progress")  # in_progress, completed
+    chunks = Column(JSON, default=[])  # [[lower_key, upper_key], ...] key ranges the table is copied in
+    chunk_states = Column(JSON, default=[])  # pending/started/completed per chunk
+    rows_copied = Column(BigInteger, default=0)
+    lsn_info = Column(JSON, nullable=True)  # Snapshot LSN/offset of the run that started the table
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    pipeline = relationship("PipelineModel", back_populates="full_load_checkpoints")
+    
+    __table_args__ = (
+        Index('idx_checkpoint_pipeline_table', 'pipeline_id', 'table_name', unique=True),
+    )
+
+
+class FullLoadProgressModel(Base):
+    __tablename__ = "full_load_progress"
+    
+    id = Column(String(36), primary_key=True)
+    pipeline_id = Column(String(36), ForeignKey('pipelines.id'), nullable=False)
+    run_started_at = Column(DateTime, nullable=False)  # Start of the full load run the snapshot belongs to
+    table_name = Column(String(255), nullable=False)
+    
+    stage = Column(String(50), nullable=False)  # pending, creating_schema, copying, completed, failed
+    rows_copied = Column(BigInteger, default=0)
+    total_rows = Column(BigInteger, nullable=True)  # Source row count, when known
+    bytes_copied = Column(BigInteger, default=0)  # Estimated from the rows read
+    rows_per_second = Column(Float, default=0)
+    bytes_per_second = Column(Float, default=0)
+    eta_seconds = Column(Float, nullable=True)
+    error = Column(Text, nullable=True)
+    
+    recorded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    pipeline = relationship("PipelineModel", back_populates="full_load_progress")
+    
+    __table_args__ = (
+        Index('idx_progress_pipeline_recorded', 'pipeline_id', 'recorded_at'),
+    )
+
+
+class IncrementalWatermarkModel(Base):
+    __tablename__ = "incremental_watermarks"
+    
+    id = Column(String(36), primary_key=True)
+    pipeline_id = Column(String(36), ForeignKey('pipelines.id'), nullable=False)
+    table_name = Column(String(255), nullable=False)
+    
+    watermark_column = Column(String(255), nullable=False)
+    watermark_value = Column(JSON, nullable=True)  # Highest value copied, encoded like checkpoint keys
+    rows_copied = Column(BigInteger, default=0)  # Rows copied by the last run
+    
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    pipeline = relationship("PipelineModel", back_populates="incremental_watermarks")
+    
+    __table_args__ = (
+        Index('idx_watermark_pipeline_table', 'pipeline_id', 'table_name', unique=True),
+    )
+
+
 class ConnectionTestModel(Base):
     __tablename__ = "connection_tests"
     
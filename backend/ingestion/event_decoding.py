@@ -0,0 +1,74 @@
+"""Decoding of Debezium JSON message values for the CDC event logger."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Top-level payload key as written by Kafka Connect's JsonConverter (compact, after "schema")
+_PAYLOAD_KEY = b',"payload":'
+
+
+def loads(data: Any) -> Any:
+    """Decode JSON bytes or text, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def _decode_payload_only(raw: bytes) -> Any:
+    """Decode only the payload of a {"schema": ..., "payload": ...} envelope.
+
+    The schema block, usually the larger part of a message, is skipped.
+    Raises ValueError when the value has no trailing top-level payload; a
+    "payload" key found inside the payload itself leaves unbalanced braces
+    in the slice, so it cannot decode as a wrong payload.
+    """
+    position = raw.rfind(_PAYLOAD_KEY)
+    end = len(raw.rstrip())
+    if position < 0 or raw[end - 1:end] != b"}":
+        raise ValueError("no trailing payload")
+    return loads(raw[position + len(_PAYLOAD_KEY):end - 1])
+
+
+def decode_debezium_value(raw: Optional[bytes], lazy: bool = True) -> Optional[Any]:
+    """Decode the payload of a Debezium message value.
+
+    Args:
+        raw: Message value bytes (None for tombstones)
+        lazy: Decode only the payload of schema envelopes; when False, or
+            when the value is not such an envelope, the whole value is
+            decoded and its "payload" taken if present
+
+    Returns:
+        The payload (a dict for change events), or None for tombstones
+
+    Raises:
+        ValueError: If the value is not valid JSON
+    """
+    if not raw:
+        return None
+    if lazy and raw[:1] == b"{":
+        try:
+            return _decode_payload_only(raw)
+        except ValueError:
+            pass
+    value = loads(raw)
+    if isinstance(value, str):
+        # JSON-encoded JSON string
+        value = loads(value)
+    if isinstance(value, dict):
+        return value.get("payload", value)
+    return value
@@ -0,0 +1,257 @@
+"""Per-minute rollups of CDC events, kept alongside (or instead of) the raw event rows."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import case, func
+
+logger = logging.getLogger(__name__)
+
+# Columns identifying a rollup row (the table's primary key)
+ROLLUP_KEY = ("pipeline_id", "schema_name", "table_name", "event_type", "status", "bucket_start")
+
+# Event statuses counted as applied / failed / pending
+APPLIED_STATUSES = ("applied", "success", "completed")
+FAILED_STATUSES = ("failed", "error")
+PENDING_STATUSES = ("pending", "processing", "running")
+
+
+def bucket_start(event_time: datetime) -> datetime:
+    """Minute bucket of an event time."""
+    return event_time.replace(second=0, microsecond=0)
+
+
+def aggregate_events(events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate CDC events into rollup rows.
+
+    Args:
+        events: Event dictionaries as built by CDCEventLogger (with
+            event_bytes and latency_ms besides the pipeline_runs fields)
+
+    Returns:
+        Rollup rows, sorted by key so concurrent upserts lock rows in the
+        same order
+    """
+    rollups: Dict[Tuple, Dict[str, Any]] = {}
+    for event in events:
+        metadata = event.get("run_metadata") or {}
+        started_at = event.get("started_at") or datetime.utcnow()
+        key = (
+            event["pipeline_id"],
+            metadata.get("schema_name") or "unknown",
+            metadata.get("table_name") or "unknown",
+            metadata.get("event_type") or "unknown",
+            event.get("status") or "unknown",
+            bucket_start(started_at),
+        )
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = dict(zip(ROLLUP_KEY, key))
+            rollup.update(event_count=0, total_bytes=0, max_latency_ms=None, last_event_at=started_at)
+            rollups[key] = rollup
+        rollup["event_count"] += 1
+        rollup["total_bytes"] += event.get("event_bytes") or 0
+        latency_ms = event.get("latency_ms")
+        if latency_ms is not None and (rollup["max_latency_ms"] is None or latency_ms > rollup["max_latency_ms"]):
+            rollup["max_latency_ms"] = latency_ms
+        if started_at > rollup["last_event_at"]:
+            rollup["last_event_at"] = started_at
+    return [rollups[key] for key in sorted(rollups)]
+
+
+def _greater(current, new):
+    """SQL expression of the greater of two nullable columns."""
+    return case(
+        (current.is_(None), new),
+        (new > current, new),
+        else_=current
+    )
+
+
+def upsert_rollups(session, rollups: List[Dict[str, Any]]) -> None:
+    """Add rollup rows to the rollup table in the session's transaction.
+
+    Counts and bytes are added to an existing row of the same key, the
+    maximum latency and last event time are kept.
+
+    Args:
+        session: SQLAlchemy session of the metadata database
+        rollups: Rollup rows from aggregate_events
+    """
+    from ingestion.database.models_db import CDCEventRollupModel
+
+    if not rollups:
+        return
+    table = CDCEventRollupModel.__table__
+    dialect = session.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        stmt = dialect_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(ROLLUP_KEY),
+            set_={
+                "event_count": table.c.event_count + stmt.excluded.event_count,
+                "total_bytes": table.c.total_bytes + stmt.excluded.total_bytes,
+                "max_latency_ms": _greater(table.c.max_latency_ms, stmt.excluded.max_latency_ms),
+                "last_event_at": _greater(table.c.last_event_at, stmt.excluded.last_event_at),
+            }
+        )
+        session.execute(stmt, rollups)
+        return
+
+    # No portable upsert: update the rows that exist, insert the others
+    for rollup in rollups:
+        model = session.get(CDCEventRollupModel, tuple(rollup[column] for column in ROLLUP_KEY))
+        if model is None:
+            session.add(CDCEventRollupModel(**rollup))
+            continue
+        model.event_count += rollup["event_count"]
+        model.total_bytes += rollup["total_bytes"]
+        if rollup["max_latency_ms"] is not None and (model.max_latency_ms is None or rollup["max_latency_ms"] > model.max_latency_ms):
+            model.max_latency_ms = rollup["max_latency_ms"]
+        if model.last_event_at is None or rollup["last_event_at"] > model.last_event_at:
+            model.last_event_at = rollup["last_event_at"]
+
+
+def _filtered(query, model, pipeline_id: Optional[str], since: Optional[datetime], until: Optional[datetime], table_name: Optional[str]):
+    if pipeline_id:
+        query = query.filter(model.pipeline_id == pipeline_id)
+    if since:
+        query = query.filter(model.bucket_start >= bucket_start(since))
+    if until:
+        query = query.filter(model.bucket_start <= until)
+    if table_name:
+        query = query.filter(func.lower(model.table_name).contains(table_name.lower()))
+    return query
+
+
+def summarize_event_rollups(
+    db,
+    pipeline_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    table_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Count CDC events from the rollup table.
+
+    Args:
+        db: Metadata database session
+        pipeline_id: Count one pipeline's events only (optional)
+        since: Count events from this time on, to the minute (optional)
+        until: Count events up to this time (optional)
+        table_name: Count events of tables whose name contains this (optional)
+
+    Returns:
+        Dictionary with total, applied, failed, pending, by_event_type,
+        total_bytes, max_latency_ms and last_event_at
+    """
+    from ingestion.database.models_db import CDCEventRollupModel as R
+
+    rows = _filtered(
+        db.query(
+            R.event_type,
+            R.status,
+            func.sum(R.event_count),
+            func.sum(R.total_bytes),
+            func.max(R.max_latency_ms),
+            func.max(R.last_event_at)
+        ),
+        R, pipeline_id, since, until, table_name
+    ).group_by(R.event_type, R.status).all()
+
+    summary = {
+        "total": 0,
+        "applied": 0,
+        "failed": 0,
+        "pending": 0,
+        "by_event_type": {},
+        "total_bytes": 0,
+        "max_latency_ms": None,
+        "last_event_at": None
+    }
+    for event_type, status, count, total_bytes, max_latency_ms, last_event_at in rows:
+        count = int(count or 0)
+        summary["total"] += count
+        status = (status or "").lower()
+        if status in APPLIED_STATUSES:
+            summary["applied"] += count
+        elif status in FAILED_STATUSES:
+            summary["failed"] += count
+        elif status in PENDING_STATUSES:
+            summary["pending"] += count
+        summary["by_event_type"][event_type] = summary["by_event_type"].get(event_type, 0) + count
+        summary["total_bytes"] += int(total_bytes or 0)
+        if max_latency_ms is not None and (summary["max_latency_ms"] is None or max_latency_ms > summary["max_latency_ms"]):
+            summary["max_latency_ms"] = int(max_latency_ms)
+        if last_event_at is not None and (summary["last_event_at"] is None or last_event_at > summary["last_event_at"]):
+            summary["last_event_at"] = last_event_at
+    return summary
+
+
+def event_rollup_trend(
+    db,
+    since: datetime,
+    pipeline_id: Optional[str] = None,
+    until: Optional[datetime] = None,
+    table_name: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Per-minute CDC event counts from the rollup table.
+
+    Args:
+        db: Metadata database session
+        since: First minute of the trend
+        pipeline_id: One pipeline's events only (optional)
+        until: Last minute of the trend (optional)
+        table_name: Events of tables whose name contains this (optional)
+
+    Returns:
+        One dictionary per minute with events, per event type counts
+        (insert, update, delete, truncate), failed, bytes and
+        max_latency_ms, in time order
+    """
+    from ingestion.database.models_db import CDCEventRollupModel as R
+
+    rows = _filtered(
+        db.query(
+            R.bucket_start,
+            R.event_type,
+            R.status,
+            func.sum(R.event_count),
+            func.sum(R.total_bytes),
+            func.max(R.max_latency_ms)
+        ),
+        R, pipeline_id, since, until, table_name
+    ).group_by(R.bucket_start, R.event_type, R.status).all()
+
+    buckets: Dict[datetime, Dict[str, Any]] = {}
+    for minute, event_type, status, count, total_bytes, max_latency_ms in rows:
+        bucket = buckets.get(minute)
+        if bucket is None:
+            bucket = {
+                "timestamp": minute.isoformat(),
+                "events": 0,
+                "insert": 0,
+                "update": 0,
+                "delete": 0,
+                "truncate": 0,
+                "failed": 0,
+                "bytes": 0,
+                "max_latency_ms": None
+            }
+            buckets[minute] = bucket
+        count = int(count or 0)
+        bucket["events"] += count
+        if event_type in ("insert", "update", "delete", "truncate"):
+            bucket[event_type] += count
+        if (status or "").lower() in FAILED_STATUSES:
+            bucket["failed"] += count
+        bucket["bytes"] += int(total_bytes or 0)
+        if max_latency_ms is not None and (bucket["max_latency_ms"] is None or max_latency_ms > bucket["max_latency_ms"]):
+            bucket["max_latency_ms"] = int(max_latency_ms)
+    return [buckets[minute] for minute in sorted(buckets)]
@@ -0,0 +1,258 @@
+"""Partition-parallel parsing and persisting of CDC event logger messages."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionWorkerPool:
+    """Parses and persists polled Kafka messages on worker threads.
+
+    Every partition is assigned to one worker (the least loaded when the
+    partition is first seen) and handled by it in poll order, so events of
+    a partition are persisted in order. Each worker batches the events of
+    its partitions and persists them by size or age; only then are the
+    offsets of those partitions reported as persisted, for the consumer
+    thread to commit. A batch that fails to persist is retried, holding
+    back its partitions' offsets, so no event is committed unpersisted.
+
+    Memory is bounded by back-pressure: while a worker retries a failed
+    batch it dequeues nothing, and the partitions of a worker that is
+    retrying or has ``max_queued_polls`` polls queued are reported by
+    ``saturated_partitions`` for the consumer thread to pause.
+
+    Partitions revoked in a consumer group rebalance are handed back with
+    ``revoke``, so no event of them is persisted after their new owner
+    starts consuming them.
+
+    The KafkaConsumer is not thread-safe: only the consumer thread polls,
+    submits and commits.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        parse: Callable[[Any], Optional[Dict[str, Any]]],
+        persist: Callable[[List[Dict[str, Any]]], bool],
+        max_batch_size: int,
+        batch_timeout_seconds: float,
+        max_queued_polls: int = 4
+    ):
+        """Initialize worker pool.
+
+        Args:
+            num_workers: Number of worker threads
+            parse: Parses a message into an event (None to skip it)
+            persist: Persists a batch of events, returning False on failure
+            max_batch_size: Events per worker batch before persisting
+            batch_timeout_seconds: Max age of a worker batch before persisting
+            max_queued_polls: Polled message lists queued per worker before
+                its partitions are reported as saturated
+        """
+        self.num_workers = max(num_workers, 1)
+        self.parse = parse
+        self.persist = persist
+        self.max_batch_size = max_batch_size
+        self.batch_timeout_seconds = batch_timeout_seconds
+        self.max_queued_polls = max_queued_polls
+        # Unbounded: submit never blocks polling, the consumer pauses saturated partitions instead
+        self._queues = [queue.Queue() for _ in range(self.num_workers)]
+        self._failing = [False] * self.num_workers  # Worker is retrying a failed batch
+        # Per worker: (revoked partitions, set once the worker released them)
+        self._revoke_requests: List[Optional[Tuple[Set[Any], threading.Event]]] = [None] * self.num_workers
+        self._threads: List[threading.Thread] = []
+        self._assignment: Dict[Any, int] = {}  # TopicPartition -> worker index
+        self._persisted: Dict[Any, int] = {}  # TopicPartition -> next offset to consume
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        self._stopping.clear()
+        for index in range(self.num_workers):
+            thread = threading.Thread(target=self._run_worker, args=(index,), name=f"cdc-event-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Started {self.num_workers} CDC event logger workers")
+
+    def _worker_for(self, topic_partition) -> int:
+        index = self._assignment.get(topic_partition)
+        if index is None:
+            load = [0] * self.num_workers
+            for assigned in self._assignment.values():
+                load[assigned] += 1
+            index = load.index(min(load))
+            self._assignment[topic_partition] = index
+            logger.info(f"Assigned {topic_partition.topic}[{topic_partition.partition}] to CDC event worker {index}")
+        return index
+
+    def submit(self, topic_partition, messages: List[Any]) -> None:
+        """Queue polled messages of a partition for its worker."""
+        if not self._stopping.is_set():
+            self._queues[self._worker_for(topic_partition)].put((topic_partition, messages))
+
+    def saturated_partitions(self) -> Set[Any]:
+        """Partitions whose worker is retrying a failed batch or has a full queue.
+
+        The consumer thread pauses fetching them until they are no longer
+        reported.
+        """
+        saturated = {
+            index for index in range(self.num_workers)
+            if self._failing[index] or self._queues[index].qsize() >= self.max_queued_polls
+        }
+        return {topic_partition for topic_partition, index in self._assignment.items() if index in saturated}
+
+    def persisted_offsets(self) -> Dict[Any, int]:
+        """Take the offsets persisted since the last call.
+
+        Returns:
+            Dictionary of TopicPartition to the next offset to consume
+        """
+        with self._lock:
+            offsets, self._persisted = self._persisted, {}
+        return offsets
+
+    def revoke(self, partitions: Set[Any], timeout: float = 30.0) -> None:
+        """Release partitions revoked from the consumer in a rebalance.
+
+        Polls of the partitions still queued are dropped. The workers that
+        handled them persist their current batch; if that fails, the
+        partitions' events are dropped from it instead. Afterwards
+        ``persisted_offsets`` includes every offset of the partitions that
+        was persisted, for the consumer thread to commit while it still owns
+        them. Called on the consumer thread (from the rebalance listener).
+
+        Args:
+            partitions: Revoked TopicPartitions
+            timeout: Max seconds to wait for the workers
+        """
+        partitions = set(partitions)
+        indexes = {self._assignment.pop(tp) for tp in partitions if tp in self._assignment}
+        requests = []
+        for index in indexes:
+            worker_queue = self._queues[index]
+            with worker_queue.mutex:
+                kept = [item for item in worker_queue.queue if item[0] not in partitions]
+                dropped = len(worker_queue.queue) - len(kept)
+                worker_queue.queue.clear()
+                worker_queue.queue.extend(kept)
+            if dropped:
+                logger.info(f"Dropped {dropped} queued polls of revoked partitions from CDC event worker {index}")
+            if index < len(self._threads) and self._threads[index].is_alive():
+                done = threading.Event()
+                with self._lock:
+                    self._revoke_requests[index] = (partitions, done)
+                requests.append((index, done))
+
+        deadline = time.time() + timeout
+        for index, done in requests:
+            if not done.wait(max(deadline - time.time(), 0.1)):
+                # Offsets it reports later are not committed, the partitions are no longer assigned
+                logger.warning(f"CDC event worker {index} did not release revoked partitions within {timeout}s; their events may be logged twice")
+        logger.info(f"Released {len(partitions)} revoked partitions")
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Persist the workers' pending batches and stop them.
+
+        Workers stop dequeuing at once; polls still queued are not processed
+        and their offsets are not reported, so they are consumed again after
+        restart.
+        """
+        self._stopping.set()
+        deadline = time.time() + timeout
+        for thread in self._threads:
+            thread.join(timeout=max(deadline - time.time(), 0.1))
+        self._threads = []
+
+    def _run_worker(self, index: int) -> None:
+        worker_queue = self._queues[index]
+        batch: Dict[Any, List[Dict[str, Any]]] = {}  # TopicPartition -> events in poll order
+        batch_size = 0
+        offsets: Dict[Any, int] = {}
+        batch_start_time = None
+
+        while not self._stopping.is_set():
+            with self._lock:
+                request, self._revoke_requests[index] = self._revoke_requests[index], None
+            if request is not None:
+                partitions, done = request
+                if offsets.keys() & partitions:
+                    if not self._flush(batch, offsets):
+                        # Their new owner consumes them again from the committed offsets
+                        dropped = sum(len(batch.pop(tp, [])) for tp in partitions)
+                        for tp in partitions:
+                            offsets.pop(tp, None)
+                        batch_size -= dropped
+                        logger.warning(f"CDC event worker {index} dropped {dropped} unpersisted events of revoked partitions")
+                        if offsets:
+                            self._failing[index] = True
+                            done.set()
+                            continue
+                    batch = {}
+                    batch_size = 0
+                    offsets = {}
+                    batch_start_time = None
+                    self._failing[index] = False
+                done.set()
+                continue
+
+            if self._failing[index]:
+                # Retry the failed batch without dequeuing more; its partitions are paused meanwhile
+                time.sleep(1)
+                if self._flush(batch, offsets):
+                    batch = {}
+                    batch_size = 0
+                    offsets = {}
+                    batch_start_time = None
+                    self._failing[index] = False
+                continue
+
+            wait = 0.5
+            if batch_start_time is not None:
+                wait = min(max(batch_start_time + self.batch_timeout_seconds - time.time(), 0.01), wait)
+            try:
+                item = worker_queue.get(timeout=wait)
+            except queue.Empty:
+                item = None
+
+            if item is not None:
+                topic_partition, messages = item
+                for message in messages:
+                    event = self.parse(message)
+                    if event:
+                        batch.setdefault(topic_partition, []).append(event)
+                        batch_size += 1
+                if messages:
+                    offsets[topic_partition] = messages[-1].offset + 1
+                    if batch_start_time is None:
+                        batch_start_time = time.time()
+
+            if offsets and (batch_size >= self.max_batch_size or time.time() - batch_start_time >= self.batch_timeout_seconds):
+                if self._flush(batch, offsets):
+                    batch = {}
+                    batch_size = 0
+                    offsets = {}
+                    batch_start_time = None
+                else:
+                    # Its partitions' offsets stay uncommitted until the retry succeeds
+                    logger.warning(f"CDC event worker {index} failed to persist {batch_size} events, retrying")
+                    self._failing[index] = True
+
+        # Stopping: persist only the polls already dequeued
+        if offsets and not self._flush(batch, offsets):
+            logger.warning(f"CDC event worker {index} stopped with {batch_size} unpersisted events; they will be consumed again")
+
+    def _flush(self, batch: Dict[Any, List[Dict[str, Any]]], offsets: Dict[Any, int]) -> bool:
+        events = [event for partition_events in batch.values() for event in partition_events]
+        if events and not self.persist(events):
+            return False
+        with self._lock:
+            self._persisted.update(offsets)
+        return True
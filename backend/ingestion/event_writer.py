@@ -0,0 +1,108 @@
+"""Bulk writer of CDC events logged to the pipeline_runs table."""
+
+from __future__ import annotations
+
+import io
+import logging
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import insert
+
+from ingestion.loaders.postgresql import encode_text_value
+
+logger = logging.getLogger(__name__)
+
+# Event fields written as pipeline_runs columns, in COPY column order
+EVENT_COLUMNS = (
+    "id",
+    "pipeline_id",
+    "run_type",
+    "status",
+    "started_at",
+    "completed_at",
+    "rows_processed",
+    "errors_count",
+    "run_metadata",
+)
+
+WRITE_METHODS = ("auto", "copy", "insert")
+
+
+class CDCEventWriter:
+    """Writes batches of CDC events with one statement per batch.
+
+    On PostgreSQL the events are streamed with ``COPY pipeline_runs FROM
+    STDIN``; on other databases (or with method "insert") they are inserted
+    with a SQLAlchemy Core executemany, which SQLAlchemy sends as multi-row
+    INSERT statements ("insertmanyvalues"). No ORM objects are created.
+    The events are written in the caller's session transaction.
+    """
+
+    def __init__(self, method: str = "auto"):
+        """Initialize event writer.
+
+        Args:
+            method: "copy" (PostgreSQL COPY), "insert" (Core executemany) or
+                "auto" (COPY on PostgreSQL, else insert)
+        """
+        if method not in WRITE_METHODS:
+            raise ValueError(f"Unknown event write method {method!r}, expected one of {WRITE_METHODS}")
+        self.method = method
+        self._copy_failed = False
+
+    def _use_copy(self, session) -> bool:
+        if self.method == "insert" or self._copy_failed:
+            return False
+        return session.get_bind().dialect.name == "postgresql"
+
+    def write(self, session, events: Sequence[Dict[str, Any]]) -> int:
+        """Write events to pipeline_runs in the session's transaction.
+
+        Must be the first write of the transaction: with method "auto", a
+        failed COPY rolls the session back and the events are inserted
+        instead.
+
+        Args:
+            session: SQLAlchemy session of the metadata database
+            events: Event dictionaries with the EVENT_COLUMNS fields
+
+        Returns:
+            Number of events written
+        """
+        if not events:
+            return 0
+        if self._use_copy(session):
+            try:
+                self._copy(session, events)
+                return len(events)
+            except Exception as e:
+                if self.method == "copy":
+                    raise
+                # The failed COPY aborted the transaction, which holds nothing else yet
+                session.rollback()
+                self._copy_failed = True
+                logger.warning(f"COPY of CDC events failed, using multi-row INSERT from now on: {e}")
+        self._insert(session, events)
+        return len(events)
+
+    def _insert(self, session, events: Sequence[Dict[str, Any]]) -> None:
+        from ingestion.database.models_db import PipelineRunModel
+
+        rows: List[Dict[str, Any]] = [{column: event.get(column) for column in EVENT_COLUMNS} for event in events]
+        session.execute(insert(PipelineRunModel.__table__), rows)
+
+    def _copy(self, session, events: Sequence[Dict[str, Any]]) -> None:
+        buffer = io.StringIO()
+        write = buffer.write
+        for event in events:
+            write("\t".join([encode_text_value(event.get(column)) for column in EVENT_COLUMNS]))
+            write("\n")
+        buffer.seek(0)
+
+        # The raw DB-API connection of the session's transaction
+        dbapi_connection = session.connection().connection
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY pipeline_runs ({', '.join(EVENT_COLUMNS)}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
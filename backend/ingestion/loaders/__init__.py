@@ -0,0 +1,95 @@
+"""Bulk loaders for full load targets."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from ingestion.connectors.base_connector import BaseConnector
+from ingestion.connectors.oracle import OracleConnector
+from ingestion.connectors.postgresql import PostgreSQLConnector
+from ingestion.connectors.sqlserver import SQLServerConnector
+
+from .base_loader import BaseLoader, FULL_LOAD_METADATA_COLUMNS
+from .oracle import OracleArrayLoader
+from .postgresql import PostgreSQLCopyLoader
+from .s3 import S3TableWriter
+from .snowflake import SnowflakeStageLoader
+from .sqlserver import SQLServerBulkLoader
+
+
+def create_loader(
+    connector: BaseConnector,
+    table_name: str,
+    column_names: List[str],
+    database: Optional[str] = None,
+    schema: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None
+) -> Optional[BaseLoader]:
+    """Create the bulk loader for a full load target table.
+
+    Args:
+        connector: Target database connector
+        table_name: Target table name
+        column_names: Source column names, in row order
+        database: Target database name (optional)
+        schema: Target schema name (optional)
+        options: Pipeline full_load_config; recognised keys:
+            - load_method: "bulk" (default) or "insert" to disable bulk loaders
+            - commit_every_rows: rows written between commits (default: 50000)
+            - copy_format: PostgreSQL COPY format, "text" (default) or "binary"
+            - tablock: SQL Server INSERT ... WITH (TABLOCK) into empty tables (default: False)
+            - append_values: Oracle /*+ APPEND_VALUES */ direct-path inserts (default: False)
+
+    Returns:
+        Loader instance, or None when the target has no bulk loader
+        (callers fall back to batched INSERTs)
+    """
+    options = options or {}
+    if options.get("load_method", "bulk") == "insert":
+        return None
+
+    commit_every_rows = int(options.get("commit_every_rows", 50000))
+
+    if isinstance(connector, PostgreSQLConnector):
+        return PostgreSQLCopyLoader(
+            connector,
+            table_name,
+            column_names,
+            schema=schema,
+            database=database,
+            commit_every_rows=commit_every_rows,
+            copy_format=options.get("copy_format", "text")
+        )
+    if isinstance(connector, SQLServerConnector):
+        return SQLServerBulkLoader(
+            connector,
+            table_name,
+            column_names,
+            schema=schema,
+            database=database,
+            commit_every_rows=commit_every_rows,
+            tablock=bool(options.get("tablock", False))
+        )
+    if isinstance(connector, OracleConnector):
+        return OracleArrayLoader(
+            connector,
+            table_name,
+            column_names,
+            schema=schema,
+            database=database,
+            commit_every_rows=commit_every_rows,
+            append_values=bool(options.get("append_values", False))
+        )
+    return None
+
+
+__all__ = [
+    "BaseLoader",
+    "FULL_LOAD_METADATA_COLUMNS",
+    "OracleArrayLoader",
+    "PostgreSQLCopyLoader",
+    "S3TableWriter",
+    "SnowflakeStageLoader",
+    "SQLServerBulkLoader",
+    "create_loader",
+]
@@ -0,0 +1,294 @@
+"""Base loader class for full load target writers."""
+
+from __future__ import annotations
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+from ingestion.columnar import record_batch_to_rows
+from ingestion.connectors.base_connector import BaseConnector, build_key_range_predicate
+from ingestion.converters import ColumnConverters, PARAMETER_CONVERTERS, to_parameter_value
+
+logger = logging.getLogger(__name__)
+
+# Number of rejected rows kept with their error messages for reporting
+MAX_REPORTED_REJECTED_ROWS = 100
+
+# Metadata columns of SCD2-style target tables, filled by the full load as
+# __op='r', __source_ts_ms=<load start>, __deleted=NULL
+FULL_LOAD_METADATA_COLUMNS = ["__op", "__source_ts_ms", "__deleted"]
+
+
+class BaseLoader(ABC):
+    """Abstract base class for full load bulk loaders.
+
+    A loader writes the rows of one target table over a single long-lived
+    connection opened on the first write, appending the full load metadata
+    columns to each row and committing every ``commit_every_rows`` rows.
+    Loaders are used as context managers: leaving the block normally
+    commits the remaining rows, leaving it with an exception rolls back the
+    uncommitted ones.
+
+    Writing a batch is split in ``prepare`` (converting rows to what the
+    target driver sends, no database I/O) and ``write_prepared``, so a copy
+    can convert the next batch in another thread while one is being
+    written.
+    """
+
+    def __init__(
+        self,
+        connector: BaseConnector,
+        table_name: str,
+        column_names: List[str],
+        schema: Optional[str] = None,
+        database: Optional[str] = None,
+        commit_every_rows: int = 50000
+    ):
+        """Initialize loader.
+
+        Args:
+            connector: Target database connector
+            table_name: Target table name
+            column_names: Source column names, in row order
+            schema: Target schema name (optional)
+            database: Target database name (optional)
+            commit_every_rows: Number of rows written between commits
+        """
+        self.connector = connector
+        self.table_name = table_name
+        self.column_names = list(column_names)
+        self.schema = schema
+        self.database = database
+        self.commit_every_rows = max(1, int(commit_every_rows))
+        self.source_ts_ms = int(time.time() * 1000)
+        self.rows_written = 0
+        self.rejected_rows = 0
+        self.rejected_row_errors: List[Dict[str, Any]] = []
+        self.conn = None
+        self._rows_since_commit = 0
+        self._parameter_converters = ColumnConverters(self.column_names, PARAMETER_CONVERTERS, to_parameter_value)
+
+    @property
+    def insert_columns(self) -> List[str]:
+        """Target columns written by the loader: source columns + metadata columns."""
+        return self.column_names + FULL_LOAD_METADATA_COLUMNS
+
+    @property
+    def metadata_values(self) -> List[Any]:
+        """Values of the metadata columns appended to every row."""
+        return ["r", self.source_ts_ms, None]
+
+    @abstractmethod
+    def _connect(self):
+        """Open the target connection with autocommit disabled.
+
+        Returns:
+            DB-API connection object
+        """
+        pass
+
+    def prepare(self, rows: Sequence[Sequence[Any]]) -> Any:
+        """Convert source rows to the batch passed to ``_write``.
+
+        Must not use the target connection; may run in another thread than
+        the writes, after ``open``. By default, converts LOB and JSON
+        columns to driver parameters and appends the metadata values to
+        every row.
+        """
+        metadata = self.metadata_values
+        return [row + metadata for row in self._parameter_converters.convert_rows(rows)]
+
+    def prepare_record_batch(self, batch) -> Any:
+        """Convert an Arrow record batch (source columns only) to the batch passed to ``_write``.
+
+        By default the record batch is turned back into rows; loaders with
+        a columnar write path override this.
+        """
+        return self.prepare(record_batch_to_rows(batch))
+
+    @abstractmethod
+    def _write(self, batch: Any, row_count: int) -> int:
+        """Write a prepared batch in the current transaction.
+
+        Args:
+            batch: Result of ``prepare``
+            row_count: Number of source rows in the batch
+
+        Returns:
+            Number of rows written; rows the target rejected are reported
+            with report_rejected_row and not counted
+        """
+        pass
+
+    def report_rejected_row(self, row_number: int, error: str) -> None:
+        """Record a row the target rejected without failing its batch.
+
+        Args:
+            row_number: Zero-based position of the row in the load
+            error: Error message returned by the target
+        """
+        self.rejected_rows += 1
+        if len(self.rejected_row_errors) < MAX_REPORTED_REJECTED_ROWS:
+            self.rejected_row_errors.append({"row": row_number, "error": error})
+
+    def quote_identifier(self, name: str) -> str:
+        """Quote an identifier for the target dialect."""
+        return '"' + name.replace('"', '""') + '"'
+
+    def placeholder(self, position: int) -> str:
+        """Bind placeholder of the ``position``-th (1-based) parameter."""
+        return "%s"
+
+    def delete_full_load_rows(
+        self,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None
+    ) -> int:
+        """Delete full load rows (``__op = 'r'``) in a primary key range.
+
+        Used when an interrupted full load is resumed, to remove the rows a
+        chunk committed before the interruption. Runs in the current
+        transaction, so the delete is committed together with the first rows
+        written after it.
+
+        Args:
+            key_columns: Primary key columns the bounds refer to (None deletes all full load rows)
+            lower_key: Only delete rows with key > lower_key (optional)
+            upper_key: Only delete rows with key <= upper_key (optional)
+
+        Returns:
+            Number of rows deleted
+        """
+        self.open()
+        where = f"{self.quote_identifier('__op')} = 'r'"
+        params: List[Any] = []
+        if key_columns:
+            predicate, params = build_key_range_predicate(
+                [self.quote_identifier(col) for col in key_columns], lower_key, upper_key, self.placeholder
+            )
+            if predicate:
+                where = f"{where} AND ({predicate})"
+
+        cursor = self.conn.cursor()
+        try:
+            cursor.execute(
+                f"DELETE FROM {self.quote_identifier(self.schema)}.{self.quote_identifier(self.table_name)} WHERE {where}",
+                params
+            )
+            deleted = cursor.rowcount
+        finally:
+            cursor.close()
+        logger.info(f"Deleted {deleted} rows of an interrupted full load from {self.schema}.{self.table_name}")
+        return deleted
+
+    def delete_rows_by_keys(self, key_columns: List[str], keys: Sequence[Sequence[Any]]) -> int:
+        """Delete the target rows with the given primary keys.
+
+        Used by incremental reloads to upsert: the rows of a batch are
+        deleted right before the batch is written, in the same transaction.
+
+        Args:
+            key_columns: Primary key columns
+            keys: Key values, one list per row, in ``key_columns`` order
+
+        Returns:
+            Number of rows deleted (-1 when the driver does not report it)
+        """
+        if not keys:
+            return 0
+        self.open()
+        where = " AND ".join(
+            f"{self.quote_identifier(col)} = {self.placeholder(position)}"
+            for position, col in enumerate(key_columns, start=1)
+        )
+        cursor = self.conn.cursor()
+        try:
+            cursor.executemany(
+                f"DELETE FROM {self.quote_identifier(self.schema)}.{self.quote_identifier(self.table_name)} WHERE {where}",
+                [list(key) for key in keys]
+            )
+            return cursor.rowcount
+        finally:
+            cursor.close()
+
+    def open(self) -> None:
+        """Open the target connection if it is not open yet."""
+        if self.conn is None:
+            self.conn = self._connect()
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> int:
+        """Write a batch of source rows, committing when the commit interval is reached.
+
+        Args:
+            rows: Source rows, in ``column_names`` order
+
+        Returns:
+            Number of rows written (excluding rejected rows)
+        """
+        if not rows:
+            return 0
+        self.open()
+        return self.write_prepared(self.prepare(rows), len(rows))
+
+    def write_prepared(self, batch: Any, row_count: int) -> int:
+        """Write a batch returned by ``prepare``, committing when the commit interval is reached.
+
+        Args:
+            batch: Result of ``prepare``
+            row_count: Number of source rows in the batch
+
+        Returns:
+            Number of rows written (excluding rejected rows)
+        """
+        if not row_count:
+            return 0
+        self.open()
+        written = self._write(batch, row_count)
+        self.rows_written += written
+        self._rows_since_commit += row_count
+        if self._rows_since_commit >= self.commit_every_rows:
+            self.commit()
+        return written
+
+    def commit(self) -> None:
+        """Commit rows written since the last commit."""
+        if self.conn is not None:
+            self.conn.commit()
+            logger.debug(
+                f"Committed {self._rows_since_commit} rows into {self.schema}.{self.table_name} "
+                f"(total: {self.rows_written})"
+            )
+        self._rows_since_commit = 0
+
+    def rollback(self) -> None:
+        """Roll back rows written since the last commit."""
+        if self.conn is not None:
+            try:
+                self.conn.rollback()
+            except Exception as e:
+                logger.warning(f"Rollback failed for {self.schema}.{self.table_name}: {e}")
+        self._rows_since_commit = 0
+
+    def close(self) -> None:
+        """Close the target connection without committing."""
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Exception:
+                pass
+            self.conn = None
+
+    def __enter__(self) -> "BaseLoader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
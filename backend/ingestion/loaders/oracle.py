@@ -0,0 +1,170 @@
+"""Oracle array-DML loader for full loads."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, List, Optional
+
+try:
+    import oracledb
+    ORACLEDB_AVAILABLE = True
+except ImportError:
+    ORACLEDB_AVAILABLE = False
+    oracledb = None  # type: ignore
+
+try:
+    import cx_Oracle
+    CX_ORACLE_AVAILABLE = True
+except ImportError:
+    CX_ORACLE_AVAILABLE = False
+    cx_Oracle = None  # type: ignore
+
+from .base_loader import BaseLoader
+
+logger = logging.getLogger(__name__)
+
+
+def get_input_size(driver, data_type: str, char_length: Optional[int], data_length: Optional[int]) -> Any:
+    """Map an ALL_TAB_COLUMNS data type to a setinputsizes entry.
+
+    Strings map to their maximum length, other types to the driver's DB type
+    constant; None lets the driver infer the type from the first row.
+    """
+    data_type = (data_type or "").upper()
+
+    if data_type in ("VARCHAR2", "NVARCHAR2", "CHAR", "NCHAR"):
+        return char_length or data_length or None
+    if data_type in ("NUMBER", "FLOAT", "INTEGER"):
+        return driver.DB_TYPE_NUMBER
+    if data_type in ("BINARY_FLOAT", "BINARY_DOUBLE"):
+        return driver.DB_TYPE_BINARY_DOUBLE
+    if data_type == "DATE":
+        return driver.DB_TYPE_DATE
+    if data_type.startswith("TIMESTAMP"):
+        if "LOCAL TIME ZONE" in data_type:
+            return driver.DB_TYPE_TIMESTAMP_LTZ
+        if "TIME ZONE" in data_type:
+            return driver.DB_TYPE_TIMESTAMP_TZ
+        return driver.DB_TYPE_TIMESTAMP
+    if data_type in ("CLOB", "NCLOB"):
+        return driver.DB_TYPE_CLOB
+    if data_type == "BLOB":
+        return driver.DB_TYPE_BLOB
+    if data_type == "RAW":
+        return driver.DB_TYPE_RAW
+    return None
+
+
+class OracleArrayLoader(BaseLoader):
+    """Loads full load rows into Oracle with array DML.
+
+    Each batch is one executemany call with bind types precomputed from the
+    target column metadata. With batch errors enabled, rows Oracle rejects
+    are reported (and counted as not written) while the rest of the batch is
+    kept. ``append_values`` switches to direct-path inserts for initial
+    loads; direct-path batches are committed one by one and do not use batch
+    errors, since a failing direct-path array insert fails as a whole.
+    """
+
+    def __init__(
+        self,
+        connector,
+        table_name: str,
+        column_names: List[str],
+        schema: Optional[str] = None,
+        database: Optional[str] = None,
+        commit_every_rows: int = 50000,
+        append_values: bool = False
+    ):
+        """Initialize Oracle array loader.
+
+        Args:
+            connector: Target Oracle connector
+            table_name: Target table name
+            column_names: Source column names, in row order
+            schema: Target schema (owner) name (optional, default: connection user)
+            database: Target database name (unused, the connection's service is loaded)
+            commit_every_rows: Number of rows written between commits
+            append_values: Use /*+ APPEND_VALUES */ direct-path inserts
+        """
+        if not ORACLEDB_AVAILABLE and not CX_ORACLE_AVAILABLE:
+            raise ImportError(
+                "No Oracle driver available. "
+                "Install it with: pip install oracledb"
+            )
+
+        schema_name = (schema or connector.config.get("schema") or connector.config.get("user") or "PUBLIC").upper()
+        super().__init__(connector, table_name.upper(), column_names, schema_name, database, commit_every_rows)
+        self.append_values = append_values
+        self._driver = oracledb if ORACLEDB_AVAILABLE else cx_Oracle
+        self._cursor = None
+        self._insert_sql: Optional[str] = None
+        self._input_sizes: List[Any] = []
+
+    def _connect(self):
+        conn = self.connector.connect()
+        conn.autocommit = False
+        cursor = conn.cursor()
+
+        quoted_cols = ", ".join(f'"{c}"' for c in self.insert_columns)
+        placeholders = ", ".join(f":{i+1}" for i in range(len(self.insert_columns)))
+        hint = "/*+ APPEND_VALUES */ " if self.append_values else ""
+        self._insert_sql = f'INSERT {hint}INTO "{self.schema}"."{self.table_name}" ({quoted_cols}) VALUES ({placeholders})'
+
+        self._input_sizes = self._get_input_sizes(cursor)
+        self._cursor = cursor
+        return conn
+
+    def placeholder(self, position: int) -> str:
+        return f":{position}"
+
+    def _get_input_sizes(self, cursor) -> List[Any]:
+        cursor.execute(
+            """
+            SELECT COLUMN_NAME, DATA_TYPE, CHAR_LENGTH, DATA_LENGTH
+            FROM ALL_TAB_COLUMNS
+            WHERE OWNER = :1 AND TABLE_NAME = :2
+            """,
+            (self.schema, self.table_name)
+        )
+        column_types = {row[0]: row[1:] for row in cursor.fetchall()}
+        if not column_types:
+            logger.warning(f"No column metadata for Oracle {self.schema}.{self.table_name}, bind types will be inferred")
+            return []
+
+        return [
+            get_input_size(self._driver, *column_types[col]) if col in column_types else None
+            for col in self.insert_columns
+        ]
+
+    def _write(self, batch: List[List[Any]], row_count: int) -> int:
+        if self._input_sizes:
+            self._cursor.setinputsizes(*self._input_sizes)
+
+        if self.append_values:
+            self._cursor.executemany(self._insert_sql, batch)
+            # A direct-path insert must be committed before the table is modified again
+            self.conn.commit()
+            return row_count
+
+        self._cursor.executemany(self._insert_sql, batch, batcherrors=True)
+        errors = self._cursor.getbatcherrors()
+        if not errors:
+            return row_count
+
+        for error in errors:
+            self.report_rejected_row(self.rows_written + error.offset, error.message)
+        logger.warning(
+            f"Oracle rejected {len(errors)} of {row_count} rows in batch for {self.schema}.{self.table_name} "
+            f"(first error at row {self.rows_written + errors[0].offset}: {errors[0].message})"
+        )
+        return row_count - len(errors)
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Exception:
+                pass
+            self._cursor = None
+        super().close()
@@ -0,0 +1,385 @@
+"""PostgreSQL COPY FROM STDIN loader for full loads."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import struct
+import uuid
+from datetime import date, datetime, time as dt_time, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from psycopg2 import sql
+    from psycopg2.extras import execute_batch
+
+    POSTGRESQL_AVAILABLE = True
+except ImportError:
+    POSTGRESQL_AVAILABLE = False
+    sql = None  # type: ignore
+    execute_batch = None  # type: ignore
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None  # type: ignore
+    pa_csv = None  # type: ignore
+
+from ingestion.columnar import with_constant_columns
+from ingestion.converters import LOB, ColumnConverters
+
+from .base_loader import BaseLoader, FULL_LOAD_METADATA_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Binary COPY header: signature, flags, header extension length
+_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_BINARY_TRAILER = struct.pack("!h", -1)
+_PG_EPOCH_DATE = date(2000, 1, 1)
+_PG_EPOCH = datetime(2000, 1, 1)
+
+_TEXT_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+
+def encode_text_value(value: Any) -> str:
+    """Encode a Python value as a COPY text-format field."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, (date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex format; the backslash itself is escaped for COPY text
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    elif hasattr(value, "read"):
+        # LOB-like objects
+        value = value.read()
+        if isinstance(value, (bytes, bytearray)):
+            return "\\\\x" + bytes(value).hex()
+    return str(value).translate(_TEXT_ESCAPES)
+
+
+def _escape_text(value: Any) -> str:
+    return str(value).translate(_TEXT_ESCAPES)
+
+
+def _encode_text_bytea(value: Any) -> str:
+    return "\\\\x" + bytes(value).hex()
+
+
+def _encode_text_json(value: Any) -> str:
+    return json.dumps(value, default=str).translate(_TEXT_ESCAPES)
+
+
+# COPY text encoders by Python type, planned per column by ColumnConverters;
+# encode_text_value handles values of any other type
+TEXT_CONVERTERS: Dict[Any, Callable[[Any], str]] = {
+    bool: lambda v: "t" if v else "f",
+    int: str,
+    float: str,
+    Decimal: str,
+    datetime: lambda v: v.isoformat(sep=" "),
+    date: lambda v: v.isoformat(),
+    dt_time: lambda v: v.isoformat(),
+    bytes: _encode_text_bytea,
+    bytearray: _encode_text_bytea,
+    memoryview: _encode_text_bytea,
+    dict: _encode_text_json,
+    list: _encode_text_json,
+    str: _escape_text,
+    LOB: encode_text_value,
+}
+
+
+def _csv_array(array: "pa.Array") -> Optional["pa.Array"]:
+    """Prepare an Arrow column for COPY CSV, or None when it has no CSV form."""
+    data_type = array.type
+    if pa.types.is_binary(data_type) or pa.types.is_large_binary(data_type) or pa.types.is_fixed_size_binary(data_type):
+        # bytea hex format
+        return pa.array([None if value is None else "\\x" + value.hex() for value in array.to_pylist()], type=pa.string())
+    if (
+        pa.types.is_null(data_type)
+        or pa.types.is_boolean(data_type)
+        or pa.types.is_integer(data_type)
+        or pa.types.is_floating(data_type)
+        or pa.types.is_decimal(data_type)
+        or pa.types.is_string(data_type)
+        or pa.types.is_large_string(data_type)
+        or pa.types.is_date(data_type)
+        or pa.types.is_time(data_type)
+        or pa.types.is_timestamp(data_type)
+    ):
+        return array
+    return None
+
+
+def _encode_text(value: Any) -> bytes:
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    return str(value).encode("utf-8")
+
+
+def _encode_bytea(value: Any) -> bytes:
+    if hasattr(value, "read"):
+        value = value.read()
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    return bytes(value)
+
+
+def _encode_date(value: Any) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    return struct.pack("!i", (value - _PG_EPOCH_DATE).days)
+
+
+def _encode_timestamp(value: Any) -> bytes:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _PG_EPOCH
+    return struct.pack("!q", (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+
+
+def _encode_uuid(value: Any) -> bytes:
+    if not isinstance(value, uuid.UUID):
+        value = uuid.UUID(str(value))
+    return value.bytes
+
+
+# Binary encoders by target type name; columns of any other type make the
+# loader fall back to the text format
+BINARY_ENCODERS: Dict[str, Callable[[Any], bytes]] = {
+    "int2": lambda v: struct.pack("!h", int(v)),
+    "int4": lambda v: struct.pack("!i", int(v)),
+    "int8": lambda v: struct.pack("!q", int(v)),
+    "float4": lambda v: struct.pack("!f", float(v)),
+    "float8": lambda v: struct.pack("!d", float(v)),
+    "bool": lambda v: b"\x01" if v else b"\x00",
+    "text": _encode_text,
+    "varchar": _encode_text,
+    "bpchar": _encode_text,
+    "name": _encode_text,
+    "json": _encode_text,
+    "jsonb": lambda v: b"\x01" + _encode_text(v),
+    "bytea": _encode_bytea,
+    "date": _encode_date,
+    "timestamp": _encode_timestamp,
+    "uuid": _encode_uuid,
+}
+
+
+class PostgreSQLCopyLoader(BaseLoader):
+    """Loads full load rows into PostgreSQL with COPY FROM STDIN.
+
+    Each written batch is sent as one COPY statement on the loader's single
+    connection. The text format works for every column type; the binary
+    format skips server-side text parsing and is used when every target
+    column has an encoder in BINARY_ENCODERS. Arrow record batches are
+    encoded as CSV by pyarrow, column by column, and sent with COPY ...
+    (FORMAT csv).
+    """
+
+    def __init__(
+        self,
+        connector,
+        table_name: str,
+        column_names: List[str],
+        schema: Optional[str] = None,
+        database: Optional[str] = None,
+        commit_every_rows: int = 50000,
+        copy_format: str = "text"
+    ):
+        """Initialize PostgreSQL COPY loader.
+
+        Args:
+            connector: Target PostgreSQL connector
+            table_name: Target table name
+            column_names: Source column names, in row order
+            schema: Target schema name (optional, default: public)
+            database: Target database name (unused, the connection's database is loaded)
+            commit_every_rows: Number of rows written between commits
+            copy_format: "text" or "binary"
+        """
+        if not POSTGRESQL_AVAILABLE:
+            raise ImportError(
+                "psycopg2 is not installed. "
+                "Install it with: pip install psycopg2-binary"
+            )
+        if copy_format not in ("text", "binary"):
+            raise ValueError(f"Unsupported COPY format: {copy_format}")
+
+        super().__init__(connector, table_name, column_names, schema or "public", database, commit_every_rows)
+        self.copy_format = copy_format
+        self._encoders: Optional[List[Callable[[Any], bytes]]] = None
+        self._text_converters = ColumnConverters(
+            self.column_names, TEXT_CONVERTERS, encode_text_value, default=_escape_text
+        )
+        self._copy_sql = None
+        self._csv_copy_sql = None
+
+    def _connect(self):
+        conn = self.connector.connect()
+        conn.autocommit = False
+
+        if self.copy_format == "binary":
+            self._encoders = self._get_binary_encoders(conn)
+            if self._encoders is None:
+                self.copy_format = "text"
+
+        copy_sql = sql.SQL("COPY {}.{} ({}) FROM STDIN WITH (FORMAT {})")
+        table = sql.Identifier(self.schema), sql.Identifier(self.table_name)
+        column_list = sql.SQL(", ").join([sql.Identifier(col) for col in self.insert_columns])
+        self._copy_sql = copy_sql.format(*table, column_list, sql.SQL(self.copy_format)).as_string(conn)
+        self._csv_copy_sql = copy_sql.format(*table, column_list, sql.SQL("csv")).as_string(conn)
+        return conn
+
+    def _get_binary_encoders(self, conn) -> Optional[List[Callable[[Any], bytes]]]:
+        """Resolve a binary encoder per insert column from the target column types.
+
+        Returns None when a column type has no binary encoder.
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                """
+                SELECT a.attname, t.typname
+                FROM pg_attribute a
+                JOIN pg_type t ON t.oid = a.atttypid
+                WHERE a.attrelid = to_regclass(%s)
+                    AND a.attnum > 0
+                    AND NOT a.attisdropped
+                """,
+                (sql.SQL("{}.{}").format(sql.Identifier(self.schema), sql.Identifier(self.table_name)).as_string(conn),)
+            )
+            column_types = dict(cursor.fetchall())
+            conn.rollback()
+        finally:
+            cursor.close()
+
+        encoders = []
+        for col in self.insert_columns:
+            type_name = column_types.get(col)
+            encoder = BINARY_ENCODERS.get(type_name)
+            if encoder is None:
+                logger.info(
+                    f"Column {col} of {self.schema}.{self.table_name} has type {type_name!r} "
+                    f"without a binary encoder, using COPY text format"
+                )
+                return None
+            encoders.append(encoder)
+        return encoders
+
+    def prepare(self, rows: Sequence[Sequence[Any]]) -> Tuple[str, io.IOBase]:
+        # The COPY format is settled when the connection is opened
+        self.open()
+        if self.copy_format == "binary":
+            return self._copy_sql, self._build_binary(rows)
+        return self._copy_sql, self._build_text(rows)
+
+    def prepare_record_batch(self, batch) -> Tuple[str, io.IOBase]:
+        self.open()
+        batch = with_constant_columns(batch, dict(zip(FULL_LOAD_METADATA_COLUMNS, self.metadata_values)))
+        arrays = [_csv_array(column) for column in batch.columns]
+        if any(array is None for array in arrays):
+            # Nested or other types without a CSV form go through the row encoders
+            source_columns = len(self.column_names)
+            return super().prepare_record_batch(
+                pa.RecordBatch.from_arrays(batch.columns[:source_columns], names=batch.schema.names[:source_columns])
+            )
+
+        buffer = io.BytesIO()
+        pa_csv.write_csv(
+            pa.RecordBatch.from_arrays(arrays, names=batch.schema.names),
+            buffer,
+            # Quote every value so empty strings stay distinct from unquoted NULLs
+            write_options=pa_csv.WriteOptions(include_header=False, quoting_style="all_valid")
+        )
+        buffer.seek(0)
+        return self._csv_copy_sql, buffer
+
+    def delete_rows_by_keys(self, key_columns: List[str], keys: Sequence[Sequence[Any]]) -> int:
+        # execute_batch sends pages of DELETEs per round trip instead of one per key
+        if not keys:
+            return 0
+        self.open()
+        statement = sql.SQL("DELETE FROM {}.{} WHERE {}").format(
+            sql.Identifier(self.schema),
+            sql.Identifier(self.table_name),
+            sql.SQL(" AND ").join([sql.SQL("{} = %s").format(sql.Identifier(col)) for col in key_columns])
+        ).as_string(self.conn)
+        cursor = self.conn.cursor()
+        try:
+            execute_batch(cursor, statement, [list(key) for key in keys], page_size=1000)
+            # Only the last page's count is known
+            return -1
+        finally:
+            cursor.close()
+
+    def _write(self, batch: Tuple[str, io.IOBase], row_count: int) -> int:
+        copy_sql, buffer = batch
+        cursor = self.conn.cursor()
+        try:
+            cursor.copy_expert(copy_sql, buffer)
+        finally:
+            cursor.close()
+        return row_count
+
+    def _build_text(self, rows: Sequence[Sequence[Any]]) -> io.StringIO:
+        metadata = "\t" + "\t".join(encode_text_value(v) for v in self.metadata_values)
+        buffer = io.StringIO()
+        write = buffer.write
+        for row in self._text_converters.convert_rows(rows):
+            write("\t".join(["\\N" if v is None else v for v in row]))
+            write(metadata)
+            write("\n")
+        buffer.seek(0)
+        return buffer
+
+    def _build_binary(self, rows: Sequence[Sequence[Any]]) -> io.BytesIO:
+        field_count = struct.pack("!h", len(self.insert_columns))
+        null_field = struct.pack("!i", -1)
+        column_encoders = self._encoders[:len(self.column_names)]
+
+        # Metadata fields are the same for every row, encode them once
+        metadata_fields = []
+        for value, encoder in zip(self.metadata_values, self._encoders[len(self.column_names):]):
+            if value is None:
+                metadata_fields.append(null_field)
+            else:
+                data = encoder(value)
+                metadata_fields.append(struct.pack("!i", len(data)) + data)
+        metadata = b"".join(metadata_fields)
+
+        buffer = io.BytesIO()
+        write = buffer.write
+        write(_BINARY_HEADER)
+        for row in rows:
+            write(field_count)
+            for value, encoder in zip(row, column_encoders):
+                if value is None:
+                    write(null_field)
+                else:
+                    data = encoder(value)
+                    write(struct.pack("!i", len(data)))
+                    write(data)
+            write(metadata)
+        write(_BINARY_TRAILER)
+        buffer.seek(0)
+        return buffer
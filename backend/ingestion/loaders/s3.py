@@ -0,0 +1,397 @@
+"""Streaming S3 writer for full loads."""
+
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+from ingestion.converters import ColumnConverters, PARQUET_CONVERTERS
+
+logger = logging.getLogger(__name__)
+
+# S3 requires every multipart upload part except the last to be at least 5 MB
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+# Kafka partition directory of full load files, kept apart from the numeric
+# partitions the S3 sink connector writes so offsets never collide
+FULL_LOAD_PARTITION = "snapshot"
+
+PARQUET_COMPRESSIONS = ("snappy", "zstd", "gzip", "none")
+JSON_COMPRESSIONS = ("gzip", "none")
+
+
+class MultipartUploadSink(io.RawIOBase):
+    """Write-only file object that streams its bytes to one S3 object.
+
+    Bytes are buffered until a part is full and then sent with upload_part;
+    objects smaller than one part are sent with a single put_object.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, part_size: int = 8 * 1024 * 1024, content_type: str = "application/octet-stream"):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = max(MIN_PART_SIZE, int(part_size))
+        self.content_type = content_type
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict[str, Any]] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        self.bytes_written += len(data)
+        if len(self._buffer) >= self.part_size:
+            self._upload_part()
+        return len(data)
+
+    def tell(self) -> int:
+        return self.bytes_written
+
+    def _upload_part(self) -> None:
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, ContentType=self.content_type
+            )
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=bytes(self._buffer)
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+        self._buffer = bytearray()
+
+    def complete(self) -> None:
+        """Send the remaining bytes and finish the object."""
+        if self._upload_id is None:
+            self.s3_client.put_object(
+                Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer), ContentType=self.content_type
+            )
+            self._buffer = bytearray()
+            return
+        if self._buffer:
+            self._upload_part()
+        self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts}
+        )
+        self._upload_id = None
+
+    def abort(self) -> None:
+        """Abort an unfinished multipart upload."""
+        self._buffer = bytearray()
+        if self._upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self._upload_id)
+        except Exception as e:
+            logger.warning(f"Failed to abort multipart upload of s3://{self.bucket}/{self.key}: {e}")
+        self._upload_id = None
+
+
+def _widen_parquet_type(current, new):
+    """Type that holds the values of both Parquet column types.
+
+    Decimals take the largest scale at the maximum precision, integers mixed
+    with floats become float64 and with decimals become decimals; other
+    conflicting types are stored as strings.
+    """
+    if new == current or pa.types.is_null(new):
+        return current
+    if pa.types.is_null(current):
+        return new
+    if pa.types.is_decimal(current) and pa.types.is_decimal(new):
+        return pa.decimal128(38, max(current.scale, new.scale))
+    if pa.types.is_integer(current) and pa.types.is_integer(new):
+        if pa.types.is_uint64(current) or pa.types.is_uint64(new):
+            return pa.decimal128(38, 0)
+        return pa.int64()
+    if pa.types.is_decimal(current) and pa.types.is_integer(new):
+        return current
+    if pa.types.is_integer(current) and pa.types.is_decimal(new):
+        return pa.decimal128(38, new.scale)
+    numeric = (pa.types.is_integer, pa.types.is_floating, pa.types.is_decimal)
+    if any(is_type(current) for is_type in numeric) and any(is_type(new) for is_type in numeric):
+        return pa.float64()
+    return pa.string()
+
+
+def _to_parquet_value(value: Any) -> Any:
+    if hasattr(value, "read"):
+        # LOB types
+        value = value.read()
+    return value
+
+
+class S3TableWriter:
+    """Streams the full load rows of one table to S3 as rolling files.
+
+    Files are NDJSON (gzip or uncompressed) or Parquet (snappy, zstd, gzip or
+    uncompressed; requires pyarrow) and are rolled when ``rows_per_file``
+    rows or ``max_file_bytes`` bytes have been written. Each file is
+    uploaded while it is written, with multipart upload once it grows past
+    one part. Keys follow the S3 sink connector's DefaultPartitioner layout,
+    ``<prefix>topics/<topic>/partition=<partition>/<topic>+<partition>+<start offset>.<ext>``,
+    with the row number within the table as offset.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        prefix: str,
+        topic: str,
+        column_names: List[str],
+        file_format: str = "json",
+        compression: Optional[str] = None,
+        rows_per_file: int = 1000000,
+        max_file_bytes: int = 256 * 1024 * 1024,
+        part_size: int = 8 * 1024 * 1024,
+        partition: str = FULL_LOAD_PARTITION
+    ):
+        """Initialize S3 table writer.
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Target bucket name
+            prefix: Key prefix ("" or ending with "/")
+            topic: Kafka topic name of the table, used as directory and file name
+            column_names: Source column names, in row order
+            file_format: "json" (NDJSON) or "parquet"
+            compression: Codec (default: gzip for json, snappy for parquet)
+            rows_per_file: Maximum number of rows per file
+            max_file_bytes: Maximum (compressed) size per file
+            part_size: Multipart upload part size
+            partition: Partition directory of the files
+        """
+        if file_format == "parquet":
+            if not PYARROW_AVAILABLE:
+                raise ImportError(
+                    "pyarrow is not installed. "
+                    "Install it with: pip install pyarrow"
+                )
+            compression = compression or "snappy"
+            if compression not in PARQUET_COMPRESSIONS:
+                raise ValueError(f"Unsupported Parquet compression: {compression}")
+        elif file_format == "json":
+            compression = compression or "gzip"
+            if compression not in JSON_COMPRESSIONS:
+                raise ValueError(f"Unsupported JSON compression: {compression}")
+        else:
+            raise ValueError(f"Unsupported S3 file format: {file_format}")
+
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.prefix = prefix
+        self.topic = topic
+        self.column_names = list(column_names)
+        self.file_format = file_format
+        self.compression = compression
+        self.rows_per_file = max(1, int(rows_per_file))
+        self.max_file_bytes = max(MIN_PART_SIZE, int(max_file_bytes))
+        self.part_size = part_size
+        self.partition = partition
+        self.rows_written = 0
+        self.keys: List[str] = []
+        self._sink: Optional[MultipartUploadSink] = None
+        self._stream = None
+        self._parquet_schema = None
+        self._parquet_converters = ColumnConverters(self.column_names, PARQUET_CONVERTERS, _to_parquet_value)
+        self._file_rows = 0
+
+    @property
+    def extension(self) -> str:
+        if self.file_format == "parquet":
+            return "parquet" if self.compression == "none" else f"{self.compression}.parquet"
+        return "json.gz" if self.compression == "gzip" else "json"
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> int:
+        """Write a batch of source rows, rolling to a new file when the current one is full.
+
+        Args:
+            rows: Source rows, in ``column_names`` order
+
+        Returns:
+            Number of rows written
+        """
+        def write_chunk(start: int, end: int) -> None:
+            chunk = rows[start:end]
+            if self.file_format == "parquet":
+                self._write_parquet(chunk)
+            else:
+                self._write_json(chunk)
+
+        return self._write_chunks(len(rows), write_chunk)
+
+    def write_record_batch(self, batch) -> int:
+        """Write an Arrow record batch (requires pyarrow), rolling files like write_rows.
+
+        Parquet files take the batch's columns as they are, without
+        converting values to Python objects.
+
+        Args:
+            batch: pyarrow.RecordBatch with the ``column_names`` columns
+
+        Returns:
+            Number of rows written
+        """
+        def write_chunk(start: int, end: int) -> None:
+            chunk = batch.slice(start, end - start)
+            if self.file_format == "parquet":
+                self._write_parquet_table(pa.Table.from_batches([chunk]))
+            else:
+                self._write_json_records(chunk.to_pylist())
+
+        return self._write_chunks(batch.num_rows, write_chunk)
+
+    def close(self) -> List[str]:
+        """Finish the current file.
+
+        Returns:
+            Keys of all files written
+        """
+        if self._sink is not None:
+            self._close_file()
+        return self.keys
+
+    def abort(self) -> None:
+        """Abort the file being uploaded; completed files are kept."""
+        if self._sink is not None:
+            self._sink.abort()
+            self._sink = None
+            self._stream = None
+
+    def _write_chunks(self, row_count: int, write_chunk) -> int:
+        """Call ``write_chunk(start, end)`` for the row ranges that fit in the current file."""
+        start = 0
+        while start < row_count:
+            if self._sink is None:
+                self._open_file()
+            end = min(row_count, start + self.rows_per_file - self._file_rows)
+            write_chunk(start, end)
+            self._file_rows += end - start
+            self.rows_written += end - start
+            start = end
+            if self._file_rows >= self.rows_per_file or self._sink.tell() >= self.max_file_bytes:
+                self._close_file()
+        return row_count
+
+    def _open_file(self) -> None:
+        file_name = f"{self.topic}+{self.partition}+{self.rows_written:010d}.{self.extension}"
+        key = f"{self.prefix}topics/{self.topic}/partition={self.partition}/{file_name}"
+        content_type = "application/json" if self.file_format == "json" else "application/octet-stream"
+        self._sink = MultipartUploadSink(self.s3_client, self.bucket, key, self.part_size, content_type)
+        self._file_rows = 0
+        if self.file_format == "json" and self.compression == "gzip":
+            self._stream = gzip.GzipFile(fileobj=self._sink, mode="wb", compresslevel=6)
+        else:
+            # Parquet writers are created on the first batch, once the schema is known
+            self._stream = self._sink if self.file_format == "json" else None
+
+    def _close_file(self) -> None:
+        if self._stream is not None and self._stream is not self._sink:
+            self._stream.close()
+        self._sink.complete()
+        self.keys.append(self._sink.key)
+        logger.info(
+            f"Uploaded {self._file_rows} rows ({self._sink.bytes_written} bytes) "
+            f"to s3://{self.bucket}/{self._sink.key}"
+        )
+        self._sink = None
+        self._stream = None
+
+    def _write_json(self, rows: Sequence[Sequence[Any]]) -> None:
+        column_names = self.column_names
+        self._write_json_records(dict(zip(column_names, row)) for row in rows)
+
+    def _write_json_records(self, records: Iterable[Dict[str, Any]]) -> None:
+        lines = [json.dumps(record, default=str) for record in records]
+        self._stream.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+    def _write_parquet(self, rows: Sequence[Sequence[Any]]) -> None:
+        # Only LOB columns need converting; the others go to pyarrow as they are
+        rows = self._parquet_converters.convert_rows(rows)
+        columns = {
+            col: [row[i] for row in rows]
+            for i, col in enumerate(self.column_names)
+        }
+        if self._parquet_schema is None:
+            self._set_parquet_schema(pa.Table.from_pydict(columns).schema)
+        try:
+            table = pa.Table.from_pydict(self._parquet_string_columns(columns), schema=self._parquet_schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            self._widen_parquet_schema(pa.Table.from_pydict(columns).schema, e)
+            table = pa.Table.from_pydict(self._parquet_string_columns(columns), schema=self._parquet_schema)
+        self._write_parquet_table(table)
+
+    def _parquet_string_columns(self, columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        columns = dict(columns)
+        for field in self._parquet_schema:
+            if pa.types.is_string(field.type):
+                columns[field.name] = [None if v is None else str(v) for v in columns[field.name]]
+        return columns
+
+    def _set_parquet_schema(self, inferred) -> None:
+        # Columns that are all NULL in the first batch cannot be typed; store them as strings.
+        # Decimals get the maximum precision: the first batch's values do not bound later ones
+        fields = []
+        for field in inferred:
+            if pa.types.is_null(field.type):
+                field = pa.field(field.name, pa.string())
+            elif pa.types.is_decimal(field.type) and field.type.scale <= 38:
+                field = pa.field(field.name, pa.decimal128(38, field.type.scale))
+            fields.append(field)
+        self._parquet_schema = pa.schema(fields)
+
+    def _widen_parquet_schema(self, inferred, error: Exception) -> None:
+        """Widen the schema to hold a batch that does not fit it.
+
+        A Parquet file has one schema: the current file is finished and the
+        batch starts a new file with the widened schema.
+        """
+        schema = pa.schema([
+            pa.field(field.name, _widen_parquet_type(field.type, inferred.field(field.name).type))
+            for field in self._parquet_schema
+        ])
+        if schema == self._parquet_schema:
+            raise error
+        logger.info(f"Widening Parquet schema of {self.topic} for new values ({error}): {schema}")
+        if self._stream is not None:
+            self._close_file()
+            self._open_file()
+        self._parquet_schema = schema
+
+    def _write_parquet_table(self, table) -> None:
+        if self._parquet_schema is None:
+            self._set_parquet_schema(table.schema)
+        if table.schema != self._parquet_schema:
+            try:
+                table = table.cast(self._parquet_schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+                self._widen_parquet_schema(table.schema, e)
+                table = table.cast(self._parquet_schema)
+        if self._stream is None:
+            self._stream = pq.ParquetWriter(self._sink, self._parquet_schema, compression=self.compression)
+        self._stream.write_table(table)
@@ -0,0 +1,233 @@
+"""Snowflake stage-and-COPY loader for full loads."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None  # type: ignore
+
+from ingestion.converters import ColumnConverters, JSON_CONVERTERS, convert_values, resolve_converter
+
+logger = logging.getLogger(__name__)
+
+
+def to_json_value(value: Any) -> Any:
+    """Convert a source value to a JSON-serializable value for RECORD_CONTENT."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "read"):
+        # LOB types
+        try:
+            value = value.read()
+        except Exception:
+            return str(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).hex()
+    return value
+
+
+class SnowflakeStageLoader:
+    """Loads full load rows into a Snowflake RECORD_CONTENT/RECORD_METADATA table.
+
+    Rows are written as gzip-compressed NDJSON chunk files in a local
+    temporary directory, each chunk is PUT to the table stage when it is
+    full, and ``finish`` loads all staged chunks with a single COPY INTO.
+    Every NDJSON line holds the record content and the Kafka connector style
+    metadata of one row, which COPY INTO maps onto the two VARIANT columns.
+    """
+
+    def __init__(
+        self,
+        cursor,
+        table_name: str,
+        column_names: List[str],
+        source: Dict[str, str],
+        rows_per_file: int = 250000
+    ):
+        """Initialize Snowflake stage loader.
+
+        Args:
+            cursor: Snowflake cursor with the target database and schema in use
+            table_name: Target table name (already upper-cased)
+            column_names: Source column names, in row order
+            source: Source database/schema/table stored in RECORD_METADATA
+            rows_per_file: Number of rows per staged chunk file
+        """
+        self.cursor = cursor
+        self.table_name = table_name
+        self.column_names = list(column_names)
+        self.source = source
+        self.rows_per_file = max(1, int(rows_per_file))
+        self.rows_written = 0
+        self.files_staged = 0
+        # Chunks of this load live under their own stage path so COPY INTO
+        # and cleanup never pick up files of another load
+        self.stage_path = f'@%"{table_name}"/full_load_{uuid.uuid4().hex}'
+        self._local_dir = tempfile.mkdtemp(prefix="snowflake_full_load_")
+        self._file = None
+        self._file_path: Optional[str] = None
+        self._file_rows = 0
+        self._converters = ColumnConverters(self.column_names, JSON_CONVERTERS, to_json_value)
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> int:
+        """Append a batch of source rows to the current chunk file.
+
+        Values are converted column by column, with the JSON converters
+        planned from the first values of each column.
+
+        Args:
+            rows: Source rows, in ``column_names`` order
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+
+        column_names = self.column_names
+        rows = self._converters.convert_rows(rows)
+        self._write_contents(dict(zip(column_names, row)) for row in rows)
+        return len(rows)
+
+    def write_record_batch(self, batch) -> int:
+        """Append an Arrow record batch (requires pyarrow) to the current chunk file.
+
+        Values are converted column by column: only temporal and binary
+        columns, known from the Arrow schema, are converted, with the JSON
+        converter of the column's first value.
+
+        Args:
+            batch: pyarrow.RecordBatch with the ``column_names`` columns
+
+        Returns:
+            Number of rows written
+        """
+        if batch.num_rows == 0:
+            return 0
+
+        columns = []
+        for field, column in zip(batch.schema, batch.columns):
+            values = column.to_pylist()
+            if (
+                pa.types.is_temporal(field.type)
+                or pa.types.is_binary(field.type)
+                or pa.types.is_large_binary(field.type)
+                or pa.types.is_fixed_size_binary(field.type)
+            ):
+                first = next((value for value in values if value is not None), None)
+                if first is not None:
+                    values = convert_values(values, resolve_converter(first, JSON_CONVERTERS), to_json_value)
+            columns.append(values)
+        column_names = batch.schema.names
+        self._write_contents(dict(zip(column_names, values)) for values in zip(*columns))
+        return batch.num_rows
+
+    def _write_contents(self, contents: Iterable[Dict[str, Any]]) -> None:
+        """Write one NDJSON record per RECORD_CONTENT value, staging full chunk files."""
+        created_time = datetime.utcnow().isoformat()
+        for content in contents:
+            if self._file is None:
+                self._open_file()
+            record = {
+                "content": content,
+                "metadata": {
+                    "source": self.source,
+                    "created_time": created_time,
+                    "operation": "r",  # 'r' for full load (read/reload)
+                    "partition": 0,  # Default partition for full load
+                    "offset": self.rows_written  # Sequential offset for full load
+                }
+            }
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str))
+            self._file.write("\n")
+            self.rows_written += 1
+            self._file_rows += 1
+            if self._file_rows >= self.rows_per_file:
+                self._stage_file()
+
+    def finish(self) -> int:
+        """Stage the last chunk and load all staged chunks with one COPY INTO.
+
+        Returns:
+            Number of rows loaded by COPY INTO
+        """
+        if self._file is not None:
+            self._stage_file()
+        if self.files_staged == 0:
+            return 0
+
+        self.cursor.execute(
+            f'COPY INTO "{self.table_name}" ("RECORD_CONTENT", "RECORD_METADATA") '
+            f"FROM (SELECT $1:content, $1:metadata FROM {self.stage_path}/) "
+            f"FILE_FORMAT = (TYPE = 'JSON' COMPRESSION = 'GZIP') "
+            f"ON_ERROR = 'ABORT_STATEMENT' PURGE = TRUE"
+        )
+        rows_loaded = self._get_rows_loaded(self.cursor.fetchall())
+        logger.info(
+            f"COPY INTO {self.table_name} loaded {rows_loaded} rows from {self.files_staged} staged files"
+        )
+        return rows_loaded
+
+    def abort(self) -> None:
+        """Remove chunk files staged by this load."""
+        try:
+            self.cursor.execute(f"REMOVE {self.stage_path}/")
+        except Exception as e:
+            logger.warning(f"Failed to remove staged files at {self.stage_path}: {e}")
+
+    def close(self) -> None:
+        """Close the current chunk file and delete the local directory."""
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+        shutil.rmtree(self._local_dir, ignore_errors=True)
+
+    def _open_file(self) -> None:
+        self._file_path = os.path.join(self._local_dir, f"part_{self.files_staged:05d}.json.gz")
+        self._file = gzip.open(self._file_path, "wt", encoding="utf-8", compresslevel=6)
+        self._file_rows = 0
+
+    def _stage_file(self) -> None:
+        self._file.close()
+        self._file = None
+        file_url = "file://" + self._file_path.replace("\\", "/")
+        self.cursor.execute(
+            f"PUT '{file_url}' {self.stage_path}/ AUTO_COMPRESS = FALSE SOURCE_COMPRESSION = GZIP OVERWRITE = TRUE"
+        )
+        os.remove(self._file_path)
+        self.files_staged += 1
+        logger.debug(f"Staged {self._file_rows} rows for {self.table_name} at {self.stage_path} (file {self.files_staged})")
+
+    def _get_rows_loaded(self, results) -> int:
+        """Sum rows_loaded over the per-file COPY INTO result rows."""
+        columns = [desc[0].lower() for desc in (self.cursor.description or [])]
+        if "rows_loaded" not in columns:
+            return 0
+        index = columns.index("rows_loaded")
+        return sum(int(row[index] or 0) for row in results)
+
+    def __enter__(self) -> "SnowflakeStageLoader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            if exc_type is not None:
+                self.abort()
+        finally:
+            self.close()
@@ -0,0 +1,203 @@
+"""SQL Server fast_executemany loader for full loads."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, List, Optional, Tuple
+
+try:
+    import pyodbc
+
+    SQLSERVER_AVAILABLE = True
+except ImportError:
+    SQLSERVER_AVAILABLE = False
+    pyodbc = None  # type: ignore
+
+from .base_loader import BaseLoader
+
+logger = logging.getLogger(__name__)
+
+
+def get_input_size(
+    data_type: str,
+    char_length: Optional[int],
+    numeric_precision: Optional[int],
+    numeric_scale: Optional[int],
+    datetime_precision: Optional[int]
+) -> Optional[Tuple[int, int, int]]:
+    """Map an INFORMATION_SCHEMA column type to a pyodbc setinputsizes tuple.
+
+    Returns:
+        (sql_type, column_size, decimal_digits), or None for types without a mapping
+    """
+    data_type = (data_type or "").lower()
+    # -1 is (n)varchar(max)/varbinary(max); size 0 lets the driver stream the value
+    size = char_length if char_length and char_length > 0 else 0
+
+    if data_type == "int":
+        return (pyodbc.SQL_INTEGER, 0, 0)
+    if data_type == "bigint":
+        return (pyodbc.SQL_BIGINT, 0, 0)
+    if data_type == "smallint":
+        return (pyodbc.SQL_SMALLINT, 0, 0)
+    if data_type == "tinyint":
+        return (pyodbc.SQL_TINYINT, 0, 0)
+    if data_type == "bit":
+        return (pyodbc.SQL_BIT, 0, 0)
+    if data_type in ("decimal", "numeric", "money", "smallmoney"):
+        return (pyodbc.SQL_DECIMAL, numeric_precision or 38, numeric_scale or 0)
+    if data_type == "float":
+        return (pyodbc.SQL_DOUBLE, 0, 0)
+    if data_type == "real":
+        return (pyodbc.SQL_REAL, 0, 0)
+    if data_type in ("varchar", "char"):
+        return (pyodbc.SQL_VARCHAR, size, 0)
+    if data_type in ("nvarchar", "nchar"):
+        return (pyodbc.SQL_WVARCHAR, size, 0)
+    if data_type in ("text", "ntext", "xml"):
+        return (pyodbc.SQL_WLONGVARCHAR, 0, 0)
+    if data_type == "date":
+        return (pyodbc.SQL_TYPE_DATE, 0, 0)
+    if data_type == "datetime2":
+        precision = 7 if datetime_precision is None else datetime_precision
+        return (pyodbc.SQL_TYPE_TIMESTAMP, 20 + precision if precision else 19, precision)
+    if data_type == "datetime":
+        return (pyodbc.SQL_TYPE_TIMESTAMP, 23, 3)
+    if data_type == "smalldatetime":
+        return (pyodbc.SQL_TYPE_TIMESTAMP, 16, 0)
+    if data_type == "time":
+        precision = 7 if datetime_precision is None else datetime_precision
+        return (pyodbc.SQL_SS_TIME2, 9 + precision if precision else 8, precision)
+    if data_type in ("varbinary", "binary"):
+        return (pyodbc.SQL_VARBINARY, size, 0)
+    if data_type == "image":
+        return (pyodbc.SQL_LONGVARBINARY, 0, 0)
+    if data_type == "uniqueidentifier":
+        return (pyodbc.SQL_GUID, 0, 0)
+    return None
+
+
+class SQLServerBulkLoader(BaseLoader):
+    """Loads full load rows into SQL Server with pyodbc fast_executemany.
+
+    Parameters are sent as one array per batch instead of one round trip per
+    row, with input sizes taken from the target column types so pyodbc does
+    not have to guess them from the first row. With ``tablock`` the insert
+    takes a table lock (allowing minimal logging) when the target table is
+    empty.
+    """
+
+    def __init__(
+        self,
+        connector,
+        table_name: str,
+        column_names: List[str],
+        schema: Optional[str] = None,
+        database: Optional[str] = None,
+        commit_every_rows: int = 50000,
+        tablock: bool = False
+    ):
+        """Initialize SQL Server bulk loader.
+
+        Args:
+            connector: Target SQL Server connector
+            table_name: Target table name
+            column_names: Source column names, in row order
+            schema: Target schema name (optional, default: dbo)
+            database: Target database name (optional)
+            commit_every_rows: Number of rows written between commits
+            tablock: Use INSERT ... WITH (TABLOCK) for an initial load into an empty table
+        """
+        if not SQLSERVER_AVAILABLE:
+            raise ImportError(
+                "pyodbc is not installed. "
+                "Install it with: pip install pyodbc"
+            )
+
+        super().__init__(connector, table_name, column_names, schema or "dbo", database, commit_every_rows)
+        self.tablock = tablock
+        self._cursor = None
+        self._insert_sql: Optional[str] = None
+        self._input_sizes: Optional[List[Tuple[int, int, int]]] = None
+
+    def _connect(self):
+        conn = self.connector.connect()
+        conn.autocommit = False
+        cursor = conn.cursor()
+
+        if self.database:
+            cursor.execute(f"USE [{self.database}]")
+
+        self._input_sizes = self._get_input_sizes(cursor)
+
+        use_tablock = self.tablock and self._is_target_empty(cursor)
+        column_list = ", ".join([f"[{col}]" for col in self.insert_columns])
+        placeholders = ", ".join(["?" for _ in self.insert_columns])
+        self._insert_sql = (
+            f"INSERT INTO [{self.schema}].[{self.table_name}] "
+            f"{'WITH (TABLOCK) ' if use_tablock else ''}({column_list}) VALUES ({placeholders})"
+        )
+        if use_tablock:
+            logger.info(f"Loading empty table {self.schema}.{self.table_name} WITH (TABLOCK)")
+
+        cursor.fast_executemany = True
+        self._cursor = cursor
+        return conn
+
+    def _get_input_sizes(self, cursor) -> Optional[List[Tuple[int, int, int]]]:
+        """Build setinputsizes from the target column types.
+
+        Returns None (let pyodbc infer types) when a column is missing or has
+        no mapping.
+        """
+        cursor.execute(
+            """
+            SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+                   NUMERIC_PRECISION, NUMERIC_SCALE, DATETIME_PRECISION
+            FROM INFORMATION_SCHEMA.COLUMNS
+            WHERE TABLE_SCHEMA = ? AND TABLE_NAME = ?
+            """,
+            (self.schema, self.table_name)
+        )
+        column_types = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        input_sizes = []
+        for col in self.insert_columns:
+            column_type = column_types.get(col)
+            input_size = get_input_size(*column_type) if column_type else None
+            if input_size is None:
+                logger.info(
+                    f"No input size for column {col} of {self.schema}.{self.table_name} "
+                    f"({column_type[0] if column_type else 'missing'}), letting pyodbc infer parameter types"
+                )
+                return None
+            input_sizes.append(input_size)
+        return input_sizes
+
+    def quote_identifier(self, name: str) -> str:
+        return "[" + name.replace("]", "]]") + "]"
+
+    def placeholder(self, position: int) -> str:
+        return "?"
+
+    def _is_target_empty(self, cursor) -> bool:
+        cursor.execute(f"SELECT TOP 1 1 FROM [{self.schema}].[{self.table_name}]")
+        if cursor.fetchone() is None:
+            return True
+        logger.info(f"Table {self.schema}.{self.table_name} is not empty, loading without TABLOCK")
+        return False
+
+    def _write(self, batch: List[List[Any]], row_count: int) -> int:
+        if self._input_sizes is not None:
+            self._cursor.setinputsizes(self._input_sizes)
+        self._cursor.executemany(self._insert_sql, batch)
+        return row_count
+
+    def close(self) -> None:
+        if self._cursor is not None:
+            try:
+                self._cursor.close()
+            except Exception:
+                pass
+            self._cursor = None
+        super().close()
@@ -41,6 +41,7 @@ class PipelineMode(str, Enum):
     FULL_LOAD_ONLY = "full_load_only"
     CDC_ONLY = "cdc_only"
     FULL_LOAD_AND_CDC = "full_load_and_cdc"
+    INCREMENTAL_RELOAD = "incremental_reload"
 
 
 class UserRole(str, Enum):
@@ -192,6 +193,7 @@ class Pipeline:
         kafka_topics: Optional[List[str]] = None,
         debezium_config: Optional[Dict[str, Any]] = None,
         sink_config: Optional[Dict[str, Any]] = None,
+        full_load_config: Optional[Dict[str, Any]] = None,
         status: str = PipelineStatus.STOPPED,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
@@ -231,6 +233,8 @@ class Pipeline:
         self.kafka_topics = kafka_topics or []
         self.debezium_config = debezium_config or {}
         self.sink_config = sink_config or {}
+        # Full load tuning, e.g. {"max_parallel_tables": 4}
+        self.full_load_config = full_load_config or {}
         self.status = status
         self.created_at = created_at or datetime.utcnow()
         self.updated_at = updated_at or datetime.utcnow()
@@ -262,6 +266,7 @@ class Pipeline:
             "kafka_topics": self.kafka_topics,
             "debezium_config": self.debezium_config,
             "sink_config": self.sink_config,
+            "full_load_config": self.full_load_config,
             "status": self.status,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None
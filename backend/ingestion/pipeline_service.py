@@ -49,7 +49,9 @@ class PipelineService:
                     - "public" for PostgreSQL and others)
                 - target_tables (Optional[List[str]]): List of target table names (defaults to source_tables)
                 - mode (str): Pipeline mode (default: PipelineMode.FULL_LOAD_AND_CDC)
-                    Options: "full_load_only", "cdc_only", "full_load_and_cdc"
+                    Options: "full_load_only", "cdc_only", "full_load_and_cdc", "incremental_reload"
+                    ("incremental_reload" copies rows above a stored watermark on every start,
+                    see full_load_config "watermark_column")
                 - enable_full_load (Optional[bool]): Deprecated, use mode instead (default: None)
                 - auto_create_target (bool): Auto-create target tables (default: True)
                 - target_table_mapping (Optional[Dict[str, str]]): Source to target table mapping (default: None)
@@ -0,0 +1,411 @@
+"""Live full load progress per table, for the progress endpoint and WebSocket."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STAGE_PENDING = "pending"
+STAGE_CREATING_SCHEMA = "creating_schema"
+STAGE_COUNTING = "counting"
+STAGE_COPYING = "copying"
+STAGE_COMPLETED = "completed"
+STAGE_FAILED = "failed"
+
+RUN_IN_PROGRESS = "in_progress"
+RUN_COMPLETED = "completed"
+RUN_FAILED = "failed"
+
+# Rates are measured over the batches written in this window
+RATE_WINDOW_SECONDS = 30.0
+
+# Default interval between snapshots persisted to the metadata database
+PERSIST_INTERVAL_SECONDS = 30.0
+
+
+class TableProgress:
+    """Progress of one table of a full load."""
+
+    def __init__(self, table_name: str):
+        self.table_name = table_name
+        self.stage = STAGE_PENDING
+        self.rows_copied = 0
+        self.total_rows: Optional[int] = None
+        self.bytes_copied = 0
+        self.error: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        self._started = None
+        # (monotonic time, rows_copied, bytes_copied) after each batch, within RATE_WINDOW_SECONDS
+        self._samples: Deque[Tuple[float, int, int]] = deque()
+
+    def start(self, total_rows: Optional[int], rows_copied: int) -> None:
+        self.stage = STAGE_COPYING
+        self.total_rows = total_rows
+        self.rows_copied = rows_copied
+        self.started_at = datetime.utcnow()
+        self._started = time.monotonic()
+        self._samples.clear()
+        self._samples.append((self._started, self.rows_copied, self.bytes_copied))
+
+    def add(self, rows: int, byte_count: int) -> None:
+        if self._started is None:
+            self.start(None, 0)
+        now = time.monotonic()
+        self.rows_copied += rows
+        self.bytes_copied += byte_count
+        self._samples.append((now, self.rows_copied, self.bytes_copied))
+        # Keep one sample older than the window as the start of the measurement
+        while len(self._samples) > 2 and self._samples[1][0] <= now - RATE_WINDOW_SECONDS:
+            self._samples.popleft()
+
+    def rates(self) -> Tuple[float, float]:
+        """Rows and bytes per second over the last RATE_WINDOW_SECONDS."""
+        if self.stage != STAGE_COPYING or len(self._samples) < 2:
+            return 0.0, 0.0
+        first_time, first_rows, first_bytes = self._samples[0]
+        # Time since the last batch counts, so a stalled table shows a falling rate
+        elapsed = time.monotonic() - first_time
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return (self.rows_copied - first_rows) / elapsed, (self.bytes_copied - first_bytes) / elapsed
+
+    def snapshot(self) -> Dict[str, Any]:
+        rows_per_second, bytes_per_second = self.rates()
+        eta_seconds = None
+        progress_percent = None
+        if self.stage == STAGE_COMPLETED:
+            eta_seconds = 0.0
+            progress_percent = 100.0
+        elif self.total_rows:
+            progress_percent = round(min(100.0, 100.0 * self.rows_copied / self.total_rows), 1)
+            if rows_per_second > 0:
+                eta_seconds = round(max(0, self.total_rows - self.rows_copied) / rows_per_second, 1)
+        return {
+            "table_name": self.table_name,
+            "stage": self.stage,
+            "rows_copied": self.rows_copied,
+            "total_rows": self.total_rows,
+            "bytes_copied": self.bytes_copied,
+            "rows_per_second": round(rows_per_second, 1),
+            "bytes_per_second": round(bytes_per_second, 1),
+            "mb_per_second": round(bytes_per_second / (1024 * 1024), 3),
+            "eta_seconds": eta_seconds,
+            "progress_percent": progress_percent,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "error": self.error
+        }
+
+
+class FullLoadProgress:
+    """Progress of the full load of one pipeline.
+
+    The transfer reports stages and copied batches per table; readers take
+    ``snapshot`` at any time. Updates are cheap and thread-safe, so tables
+    and key ranges copied concurrently report into the same object. When a
+    session factory is given, a snapshot of every table is appended to the
+    full_load_progress table at most every ``persist_interval`` seconds
+    (and when the run ends); persisting never fails the full load.
+    """
+
+    def __init__(
+        self,
+        pipeline_id: str,
+        tables: Optional[List[str]] = None,
+        session_factory=None,
+        persist_interval: float = PERSIST_INTERVAL_SECONDS
+    ):
+        """Initialize full load progress.
+
+        Args:
+            pipeline_id: Pipeline ID
+            tables: Tables of the full load, listed as pending until they start
+            session_factory: Metadata database session factory (optional)
+            persist_interval: Seconds between persisted snapshots
+        """
+        self.pipeline_id = pipeline_id
+        self.session_factory = session_factory
+        self.persist_interval = max(1.0, float(persist_interval))
+        self.status = RUN_IN_PROGRESS
+        self.started_at = datetime.utcnow()
+        self.completed_at: Optional[datetime] = None
+        self.tables: Dict[str, TableProgress] = {name: TableProgress(name) for name in (tables or [])}
+        self._lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        self._last_persist = time.monotonic()
+
+    def _table(self, table_name: str) -> TableProgress:
+        table = self.tables.get(table_name)
+        if table is None:
+            table = self.tables[table_name] = TableProgress(table_name)
+        return table
+
+    def set_stage(self, table_name: str, stage: str) -> None:
+        """Set the current stage of a table."""
+        with self._lock:
+            self._table(table_name).stage = stage
+
+    def start_table(self, table_name: str, total_rows: Optional[int] = None, rows_copied: int = 0) -> None:
+        """Mark a table as copying.
+
+        Args:
+            table_name: Table name
+            total_rows: Source row count, when known
+            rows_copied: Rows already copied (by an earlier, resumed run)
+        """
+        with self._lock:
+            self._table(table_name).start(total_rows, rows_copied)
+
+    def add_rows(self, table_name: str, rows: int, byte_count: int = 0) -> None:
+        """Record a batch written to the target.
+
+        Args:
+            table_name: Table name
+            rows: Rows in the batch
+            byte_count: Estimated size of the batch in bytes
+        """
+        with self._lock:
+            self._table(table_name).add(rows, byte_count)
+        self.persist()
+
+    def complete_table(self, table_name: str) -> None:
+        """Mark a table as completely copied."""
+        with self._lock:
+            table = self._table(table_name)
+            table.stage = STAGE_COMPLETED
+            table.completed_at = datetime.utcnow()
+        self.persist(force=True)
+
+    def fail_table(self, table_name: str, error: Any) -> None:
+        """Mark a table as failed."""
+        with self._lock:
+            table = self._table(table_name)
+            table.stage = STAGE_FAILED
+            table.error = str(error)
+            table.completed_at = datetime.utcnow()
+        self.persist(force=True)
+
+    def finish(self, success: bool) -> None:
+        """Mark the full load as ended and persist its final snapshot."""
+        with self._lock:
+            self.status = RUN_COMPLETED if success else RUN_FAILED
+            self.completed_at = datetime.utcnow()
+        self.persist(force=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current progress of the full load and of every table.
+
+        Returns:
+            Dictionary with the run status, totals, overall rates and ETA,
+            the tables being copied and a list of per-table snapshots
+        """
+        with self._lock:
+            tables = [table.snapshot() for table in self.tables.values()]
+            status = self.status
+            completed_at = self.completed_at
+
+        rows_copied = sum(table["rows_copied"] for table in tables)
+        rows_per_second = sum(table["rows_per_second"] for table in tables)
+        bytes_per_second = sum(table["bytes_per_second"] for table in tables)
+        # Tables not counted yet (pending) are left out of the total, progress and ETA
+        counted = [
+            table for table in tables
+            if table["total_rows"] is not None or table["stage"] == STAGE_COMPLETED
+        ]
+        total_rows = None
+        progress_percent = None
+        eta_seconds = None
+        if counted:
+            total_rows = sum(
+                table["rows_copied"] if table["total_rows"] is None else max(table["total_rows"], table["rows_copied"])
+                for table in counted
+            )
+            counted_rows = sum(table["rows_copied"] for table in counted)
+            progress_percent = round(100.0 * counted_rows / total_rows, 1) if total_rows else 100.0
+            if rows_per_second > 0:
+                eta_seconds = round(max(0, total_rows - counted_rows) / rows_per_second, 1)
+        if status == RUN_COMPLETED:
+            progress_percent, eta_seconds = 100.0, 0.0
+
+        return {
+            "pipeline_id": self.pipeline_id,
+            "status": status,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "tables_total": len(tables),
+            "tables_completed": sum(1 for table in tables if table["stage"] == STAGE_COMPLETED),
+            "tables_failed": sum(1 for table in tables if table["stage"] == STAGE_FAILED),
+            "current_tables": [
+                table["table_name"] for table in tables
+                if table["stage"] not in (STAGE_PENDING, STAGE_COMPLETED, STAGE_FAILED)
+            ],
+            "rows_copied": rows_copied,
+            "total_rows": total_rows,
+            "totals_complete": len(counted) == len(tables),
+            "bytes_copied": sum(table["bytes_copied"] for table in tables),
+            "rows_per_second": round(rows_per_second, 1),
+            "bytes_per_second": round(bytes_per_second, 1),
+            "mb_per_second": round(bytes_per_second / (1024 * 1024), 3),
+            "eta_seconds": eta_seconds,
+            "progress_percent": progress_percent,
+            "tables": tables,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    def persist(self, force: bool = False) -> None:
+        """Append a snapshot of every started table to the metadata database.
+
+        Without ``force`` this is a no-op until ``persist_interval`` seconds
+        passed since the last snapshot; one thread persists at a time and
+        the others carry on.
+        """
+        if self.session_factory is None:
+            return
+        if not force and time.monotonic() - self._last_persist < self.persist_interval:
+            return
+        if not self._persist_lock.acquire(blocking=force):
+            return
+        try:
+            self._last_persist = time.monotonic()
+            self._write_snapshot()
+        finally:
+            self._persist_lock.release()
+
+    def _write_snapshot(self) -> None:
+        from ingestion.database.models_db import FullLoadProgressModel
+
+        recorded_at = datetime.utcnow()
+        tables = [table for table in self.snapshot()["tables"] if table["stage"] != STAGE_PENDING]
+        if not tables:
+            return
+        try:
+            db = next(self.session_factory())
+            try:
+                for table in tables:
+                    db.add(FullLoadProgressModel(
+                        id=str(uuid.uuid4()),
+                        pipeline_id=self.pipeline_id,
+                        run_started_at=self.started_at,
+                        table_name=table["table_name"],
+                        stage=table["stage"],
+                        rows_copied=table["rows_copied"],
+                        total_rows=table["total_rows"],
+                        bytes_copied=table["bytes_copied"],
+                        rows_per_second=table["rows_per_second"],
+                        bytes_per_second=table["bytes_per_second"],
+                        eta_seconds=table["eta_seconds"],
+                        error=table["error"],
+                        recorded_at=recorded_at
+                    ))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning(f"Could not persist full load progress of pipeline {self.pipeline_id}: {e}")
+
+
+class ProgressRegistry:
+    """In-memory registry of the full load progress of every pipeline.
+
+    A pipeline's progress stays registered after its full load ends, so
+    readers see the final numbers until the next full load replaces it.
+    """
+
+    def __init__(self):
+        self._progress: Dict[str, FullLoadProgress] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        pipeline_id: str,
+        tables: Optional[List[str]] = None,
+        session_factory=None,
+        persist_interval: float = PERSIST_INTERVAL_SECONDS
+    ) -> FullLoadProgress:
+        """Register (replacing any previous) progress for a pipeline's full load.
+
+        Returns:
+            FullLoadProgress the transfer reports into
+        """
+        progress = FullLoadProgress(pipeline_id, tables, session_factory, persist_interval)
+        with self._lock:
+            self._progress[str(pipeline_id)] = progress
+        return progress
+
+    def get(self, pipeline_id: str) -> Optional[FullLoadProgress]:
+        with self._lock:
+            return self._progress.get(str(pipeline_id))
+
+    def snapshot(self, pipeline_id: str) -> Optional[Dict[str, Any]]:
+        """Current progress of a pipeline's full load, or None when none ran in this process."""
+        progress = self.get(pipeline_id)
+        return progress.snapshot() if progress is not None else None
+
+    def remove(self, pipeline_id: str) -> None:
+        with self._lock:
+            self._progress.pop(str(pipeline_id), None)
+
+
+def load_persisted_snapshot(db, pipeline_id: str) -> Optional[Dict[str, Any]]:
+    """Latest persisted progress of a pipeline's most recent full load run.
+
+    Used when the run's progress is not in this process's registry (e.g.
+    after a restart).
+
+    Args:
+        db: Metadata database session
+        pipeline_id: Pipeline ID
+
+    Returns:
+        Dictionary with run_started_at, recorded_at and the latest snapshot
+        of every table, or None when nothing was persisted
+    """
+    from ingestion.database.models_db import FullLoadProgressModel
+
+    latest = db.query(FullLoadProgressModel).filter(
+        FullLoadProgressModel.pipeline_id == pipeline_id
+    ).order_by(FullLoadProgressModel.recorded_at.desc()).first()
+    if latest is None:
+        return None
+
+    models = db.query(FullLoadProgressModel).filter(
+        FullLoadProgressModel.pipeline_id == pipeline_id,
+        FullLoadProgressModel.run_started_at == latest.run_started_at
+    ).order_by(FullLoadProgressModel.recorded_at).all()
+    tables: Dict[str, Any] = {}
+    for model in models:
+        # Later snapshots of a table replace earlier ones
+        tables[model.table_name] = {
+            "table_name": model.table_name,
+            "stage": model.stage,
+            "rows_copied": model.rows_copied or 0,
+            "total_rows": model.total_rows,
+            "bytes_copied": model.bytes_copied or 0,
+            "rows_per_second": model.rows_per_second or 0.0,
+            "bytes_per_second": model.bytes_per_second or 0.0,
+            "eta_seconds": model.eta_seconds,
+            "error": model.error,
+            "recorded_at": model.recorded_at.isoformat()
+        }
+    return {
+        "pipeline_id": pipeline_id,
+        "run_started_at": latest.run_started_at.isoformat(),
+        "recorded_at": latest.recorded_at.isoformat(),
+        "rows_copied": sum(table["rows_copied"] for table in tables.values()),
+        "tables": list(tables.values())
+    }
+
+
+# Process-wide registry read by the API
+progress_registry = ProgressRegistry()
@@ -0,0 +1,503 @@
+"""Checksum-based reconciliation of a source table with its target copy."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from ingestion.connectors.base_connector import (
+    BaseConnector,
+    build_key_boundary_query,
+    build_key_range_predicate,
+    key_ranges_from_boundaries,
+)
+from ingestion.connectors.postgresql import PostgreSQLConnector
+from ingestion.connectors.sqlserver import SQLServerConnector
+from ingestion.converters import LOB, ColumnConverters, Converter, passthrough, read_lob
+from ingestion.exceptions import ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Columns the CDC sink and the full load add to target tables (SCD2 history)
+METADATA_COLUMNS = ("__op", "__source_ts_ms", "__deleted")
+
+KeyRange = Tuple[Optional[List[Any]], Optional[List[Any]]]
+
+# Deepest bisection of a mismatched range before its rows are compared
+MAX_BISECT_DEPTH = 64
+
+
+def _canonical_decimal(value: Decimal) -> str:
+    if not value.is_finite():
+        return str(value)
+    # 1.50 (numeric(10,2)) and 1.5 (numeric) are the same value
+    return format(value.normalize(), "f")
+
+
+def _canonical_float(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def _canonical_bytes(value: Any) -> str:
+    return bytes(value).hex()
+
+
+def _canonical_json(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _canonical_lob(value: Any) -> str:
+    data = read_lob(value)
+    return _canonical_bytes(data) if isinstance(data, (bytes, bytearray, memoryview)) else str(data)
+
+
+# Text compared for a value when the two sides are different databases: the
+# drivers' Python values are rendered the same way whatever the database
+CANONICAL_CONVERTERS: Dict[Any, Converter] = {
+    str: passthrough,
+    bool: lambda value: "1" if value else "0",
+    int: str,
+    float: _canonical_float,
+    Decimal: _canonical_decimal,
+    datetime: lambda value: value.isoformat(sep=" "),
+    date: lambda value: value.isoformat(),
+    dt_time: lambda value: value.isoformat(),
+    timedelta: str,
+    uuid.UUID: str,
+    bytes: _canonical_bytes,
+    bytearray: _canonical_bytes,
+    memoryview: _canonical_bytes,
+    dict: _canonical_json,
+    list: _canonical_json,
+    LOB: _canonical_lob,
+}
+
+
+def hash_canonical_row(values: List[Any]) -> str:
+    """MD5 of a row's canonical column values (NULL distinct from any text)."""
+    text = "\x1f".join("\x00" if value is None else value for value in values)
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def get_dialect(connector: BaseConnector) -> str:
+    """Dialect of the SQL reconciliation runs on a connector's database.
+
+    Raises:
+        ValidationError: If the database is not PostgreSQL or SQL Server
+    """
+    if isinstance(connector, PostgreSQLConnector):
+        return "postgresql"
+    if isinstance(connector, SQLServerConnector):
+        return "sqlserver"
+    raise ValidationError(
+        f"Reconciliation supports PostgreSQL and SQL Server tables, not {type(connector).__name__}",
+        validation_type="reconciliation"
+    )
+
+
+class ReconcileSide:
+    """One side (source or target table) of a reconciliation.
+
+    Runs the range hash, row hash and range split queries on its own
+    connection per call, so ranges can be hashed by several threads. On a
+    target table with SCD2 history (``__source_ts_ms`` column), only the
+    latest version of every key is compared, and keys whose latest
+    version is a delete are treated as absent.
+    """
+
+    def __init__(
+        self,
+        connector: BaseConnector,
+        database: Optional[str],
+        schema: str,
+        table_name: str
+    ):
+        """Initialize reconciliation side.
+
+        Args:
+            connector: PostgreSQL or SQL Server connector
+            database: Database name (optional, uses the connector's default)
+            schema: Schema name
+            table_name: Table name
+        """
+        self.connector = connector
+        self.database = database or connector.config.get("database")
+        self.schema = schema
+        self.table_name = table_name
+        self.dialect = get_dialect(connector)
+        self.key_columns: List[str] = []
+        self.columns: List[str] = []
+        self.current_versions = False
+        self._all_columns: Optional[List[str]] = None
+
+    def quote(self, name: str) -> str:
+        if self.dialect == "sqlserver":
+            return "[" + name.replace("]", "]]") + "]"
+        return '"' + name.replace('"', '""') + '"'
+
+    def placeholder(self, position: int) -> str:
+        return "?" if self.dialect == "sqlserver" else "%s"
+
+    def _connect(self):
+        conn = self.connector.connect()
+        if self.dialect == "sqlserver" and self.database:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"USE {self.quote(self.database)}")
+            finally:
+                cursor.close()
+        return conn
+
+    def _query(self, query: str, params: Optional[List[Any]] = None) -> List[Tuple[Any, ...]]:
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params or [])
+                return [tuple(row) for row in cursor.fetchall()]
+            finally:
+                cursor.close()
+        finally:
+            conn.close()
+
+    @property
+    def table_ref(self) -> str:
+        return f"{self.quote(self.schema)}.{self.quote(self.table_name)}"
+
+    def get_all_columns(self) -> List[str]:
+        """Column names of the table, read once."""
+        if self._all_columns is None:
+            conn = self._connect()
+            try:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(f"SELECT * FROM {self.table_ref} WHERE 1 = 0")
+                    self._all_columns = [desc[0] for desc in cursor.description]
+                finally:
+                    cursor.close()
+            finally:
+                conn.close()
+        return self._all_columns
+
+    def relation(self) -> str:
+        """FROM clause item of the rows compared, aliased as r."""
+        if not self.current_versions:
+            return f"{self.table_ref} r"
+        all_columns = {name.lower(): name for name in self.get_all_columns()}
+        partition = ", ".join(f"t.{self.quote(col)}" for col in self.key_columns)
+        ts_column = self.quote(all_columns["__source_ts_ms"])
+        where = "v.__reconcile_rn = 1"
+        if "__deleted" in all_columns:
+            where += f" AND COALESCE(CAST(v.{self.quote(all_columns['__deleted'])} AS VARCHAR(10)), 'false') <> 'true'"
+        return (
+            f"(SELECT * FROM (SELECT t.*, ROW_NUMBER() OVER (PARTITION BY {partition} "
+            f"ORDER BY COALESCE(t.{ts_column}, 0) DESC) AS __reconcile_rn FROM {self.table_ref} t) v "
+            f"WHERE {where}) r"
+        )
+
+    def _range_where(self, key_range: KeyRange) -> Tuple[str, List[Any]]:
+        lower_key, upper_key = key_range
+        predicate, params = build_key_range_predicate(
+            [f"r.{self.quote(col)}" for col in self.key_columns], lower_key, upper_key, self.placeholder
+        )
+        return (f" WHERE {predicate}" if predicate else ""), params
+
+    def _row_hash_sql(self) -> str:
+        if self.dialect == "sqlserver":
+            # FOR XML renders every type at full precision; columns are aliased
+            # by position so differently cased names hash the same
+            selected = ", ".join(f"r.{self.quote(col)} AS c{i}" for i, col in enumerate(self.columns))
+            return f"HASHBYTES('MD5', (SELECT {selected} FOR XML RAW, BINARY BASE64))"
+        values = ", ".join(f"r.{self.quote(col)}" for col in self.columns)
+        return f"md5(CAST(ROW({values}) AS TEXT))"
+
+    def range_checksum(self, key_range: KeyRange) -> Tuple[int, Any]:
+        """Row count and hash aggregate of the rows in a key range.
+
+        PostgreSQL hashes the row hashes concatenated in key order
+        (``md5(string_agg(...))``); SQL Server sums the first four bytes of
+        every row's ``HASHBYTES`` MD5. Both sides of a SQL reconciliation
+        run on the same database system, so their aggregates are comparable.
+        """
+        where, params = self._range_where(key_range)
+        if self.dialect == "sqlserver":
+            query = (
+                f"SELECT COUNT_BIG(*), SUM(CAST(CONVERT(BINARY(4), h) AS BIGINT)) "
+                f"FROM (SELECT {self._row_hash_sql()} AS h FROM {self.relation()}{where}) s"
+            )
+        else:
+            order = ", ".join(f"s.{self.quote(col)}" for col in self.key_columns)
+            keys = ", ".join(f"r.{self.quote(col)}" for col in self.key_columns)
+            query = (
+                f"SELECT COUNT(*), md5(string_agg(s.h, '' ORDER BY {order})) "
+                f"FROM (SELECT {keys}, {self._row_hash_sql()} AS h FROM {self.relation()}{where}) s"
+            )
+        row_count, checksum = self._query(query, params)[0]
+        return int(row_count or 0), checksum
+
+    def row_hashes(self, key_range: KeyRange, in_sql: bool) -> Dict[Tuple[str, ...], Tuple[List[Any], str]]:
+        """Hash of every row in a key range.
+
+        Args:
+            key_range: (lower_key, upper_key), exclusive lower and inclusive upper bound
+            in_sql: Hash rows in the database; otherwise the rows are read and
+                their canonical values hashed here
+
+        Returns:
+            Canonical key -> (key values as read, row hash)
+        """
+        where, params = self._range_where(key_range)
+        keys = ", ".join(f"r.{self.quote(col)}" for col in self.key_columns)
+        if in_sql:
+            selected = f"{keys}, {self._row_hash_sql()}"
+        else:
+            selected = f"{keys}, " + ", ".join(f"r.{self.quote(col)}" for col in self.columns)
+        rows = self._query(f"SELECT {selected} FROM {self.relation()}{where}", params)
+
+        key_count = len(self.key_columns)
+        names = [f"key_{col}" for col in self.key_columns] + (["hash"] if in_sql else self.columns)
+        converted = ColumnConverters(names, CANONICAL_CONVERTERS, str).convert_rows(rows)
+        hashes: Dict[Tuple[str, ...], Tuple[List[Any], str]] = {}
+        for row, values in zip(rows, converted):
+            row_hash = values[key_count] if in_sql else hash_canonical_row(values[key_count:])
+            hashes[tuple(values[:key_count])] = (list(row[:key_count]), row_hash)
+        return hashes
+
+    def split_range(self, key_range: KeyRange, parts: int) -> List[KeyRange]:
+        """Split a key range into ``parts`` ranges of about the same row count."""
+        where, params = self._range_where(key_range)
+        quoted_keys = [self.quote(col) for col in self.key_columns]
+        keys = ", ".join(f"r.{key}" for key in quoted_keys)
+        query = build_key_boundary_query(quoted_keys, f"(SELECT {keys} FROM {self.relation()}{where}) b", parts)
+        boundaries = [list(row) for row in self._query(query, params)]
+        ranges = key_ranges_from_boundaries(boundaries)
+        lower_key, upper_key = key_range
+        ranges[0] = (lower_key, ranges[0][1])
+        ranges[-1] = (ranges[-1][0], upper_key)
+        return ranges
+
+
+class _Differences:
+    """Rows found only on one side, or with different content, across all ranges compared."""
+
+    def __init__(self):
+        self.source_only: Dict[Tuple[str, ...], Tuple[List[Any], str]] = {}
+        self.target_only: Dict[Tuple[str, ...], Tuple[List[Any], str]] = {}
+        self.mismatched: Dict[Tuple[str, ...], List[Any]] = {}
+
+    def add_range(
+        self,
+        source_rows: Dict[Tuple[str, ...], Tuple[List[Any], str]],
+        target_rows: Dict[Tuple[str, ...], Tuple[List[Any], str]]
+    ) -> None:
+        for key, (raw_key, row_hash) in source_rows.items():
+            target_row = target_rows.get(key)
+            if target_row is None:
+                self.source_only[key] = (raw_key, row_hash)
+            elif target_row[1] != row_hash:
+                self.mismatched[key] = raw_key
+        for key, target_row in target_rows.items():
+            if key not in source_rows:
+                self.target_only[key] = target_row
+
+    def resolve(self) -> None:
+        """Match keys found on different sides of a range boundary.
+
+        The two databases may order text keys differently (collations), so
+        a row can fall into another range on the target than on the source.
+        """
+        for key in list(self.source_only):
+            target_row = self.target_only.pop(key, None)
+            if target_row is None:
+                continue
+            raw_key, row_hash = self.source_only.pop(key)
+            if target_row[1] != row_hash:
+                self.mismatched[key] = raw_key
+
+
+def reconcile_table(
+    source_connector: BaseConnector,
+    target_connector: BaseConnector,
+    source_database: Optional[str],
+    source_schema: str,
+    source_table: str,
+    target_database: Optional[str],
+    target_schema: str,
+    target_table: str,
+    key_columns: Optional[List[str]] = None,
+    num_ranges: int = 16,
+    leaf_rows: int = 1000,
+    split_parts: int = 2,
+    max_workers: int = 4,
+    max_differences: int = 1000
+) -> Dict[str, Any]:
+    """Compare a source table with its target copy row by row, by key ranges.
+
+    The primary key space is split into ``num_ranges`` ranges. When both
+    tables are on the same database system, a hash aggregate of every range
+    is computed in SQL on both sides; ranges whose row count or hash differ
+    are split into ``split_parts`` ranges and compared again, until a range
+    holds at most ``leaf_rows`` rows, whose row hashes are then compared to
+    find the differing keys. Only mismatched ranges are read row by row.
+    Between different database systems, whose SQL hashes are not
+    comparable, the rows of every range are read and hashed here from their
+    canonical values. Ranges are compared on ``max_workers`` threads.
+
+    The columns compared are the source columns present in the target
+    (matched case-insensitively), without the CDC metadata columns.
+
+    Args:
+        source_connector: Source connector (PostgreSQL or SQL Server)
+        target_connector: Target connector (PostgreSQL or SQL Server)
+        source_database: Source database name
+        source_schema: Source schema name
+        source_table: Source table name
+        target_database: Target database name
+        target_schema: Target schema name
+        target_table: Target table name
+        key_columns: Key columns (default: the source table's primary key)
+        num_ranges: Number of ranges the key space is split into first
+        leaf_rows: Largest range whose rows are compared one by one
+        split_parts: Number of ranges a mismatched range is split into
+        max_workers: Number of ranges compared concurrently
+        max_differences: Maximum number of keys listed per kind of difference
+
+    Returns:
+        Dictionary with match, the keys missing_in_target, missing_in_source
+        and mismatched (lists of key values), their counts and the number
+        of ranges compared
+
+    Raises:
+        ValidationError: If the tables cannot be reconciled (unsupported
+            database, no key, key or columns missing on the target)
+    """
+    started = time.monotonic()
+    source = ReconcileSide(source_connector, source_database, source_schema, source_table)
+    target = ReconcileSide(target_connector, target_database, target_schema, target_table)
+
+    key_columns = key_columns or source_connector.get_primary_keys(
+        source_table, database=source.database, schema=source_schema
+    )
+    if not key_columns:
+        raise ValidationError(
+            f"Cannot reconcile {source_schema}.{source_table} without a primary key",
+            validation_type="reconciliation"
+        )
+
+    # Columns are compared by name; target names may differ in case
+    target_columns = {name.lower(): name for name in target.get_all_columns()}
+    missing_keys = [col for col in key_columns if col.lower() not in target_columns]
+    if missing_keys:
+        raise ValidationError(
+            f"Key columns {missing_keys} of {source_table} not found in target {target_schema}.{target_table}",
+            validation_type="reconciliation"
+        )
+    compared = [
+        col for col in source.get_all_columns()
+        if col.lower() in target_columns and col.lower() not in METADATA_COLUMNS
+    ]
+    source.key_columns, source.columns = list(key_columns), compared
+    target.key_columns = [target_columns[col.lower()] for col in key_columns]
+    target.columns = [target_columns[col.lower()] for col in compared]
+    target.current_versions = "__source_ts_ms" in target_columns
+
+    in_sql = source.dialect == target.dialect
+    ranges = source_connector.get_key_ranges(
+        source.database, source_schema, source_table, key_columns, max(1, int(num_ranges))
+    )
+    logger.info(
+        f"Reconciling {source_schema}.{source_table} with {target_schema}.{target_table}: "
+        f"{len(compared)} columns, {len(ranges)} key ranges, hashed {'in SQL' if in_sql else 'from row values'}"
+    )
+
+    differences = _Differences()
+    ranges_compared = 0
+    ranges_mismatched = 0
+    rows_compared = 0
+
+    def compare_checksums(key_range: KeyRange) -> Tuple[KeyRange, Tuple[int, Any], Tuple[int, Any]]:
+        return key_range, source.range_checksum(key_range), target.range_checksum(key_range)
+
+    def split(key_range: KeyRange, source_has_more: bool) -> List[KeyRange]:
+        # Split by the keys of the side holding more rows of the range
+        side = source if source_has_more else target
+        return side.split_range(key_range, max(2, int(split_parts)))
+
+    def compare_rows(key_range: KeyRange):
+        return source.row_hashes(key_range, in_sql), target.row_hashes(key_range, in_sql)
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="reconcile") as pool:
+        pending = list(ranges)
+        depth = 0
+        while pending:
+            ranges_compared += len(pending)
+            if in_sql:
+                leaves: List[KeyRange] = []
+                to_split: List[Tuple[KeyRange, bool]] = []
+                for key_range, (source_count, source_hash), (target_count, target_hash) in pool.map(
+                    compare_checksums, pending
+                ):
+                    if source_count == target_count and source_hash == target_hash:
+                        continue
+                    ranges_mismatched += 1
+                    if max(source_count, target_count) <= leaf_rows or depth >= MAX_BISECT_DEPTH:
+                        leaves.append(key_range)
+                    else:
+                        to_split.append((key_range, source_count >= target_count))
+                pending = []
+                for (key_range, _), sub_ranges in zip(
+                    to_split, pool.map(lambda item: split(*item), to_split)
+                ):
+                    if len(sub_ranges) > 1:
+                        pending.extend(sub_ranges)
+                    else:
+                        leaves.append(key_range)
+            else:
+                leaves, pending = pending, []
+
+            for source_rows, target_rows in pool.map(compare_rows, leaves):
+                rows_compared += max(len(source_rows), len(target_rows))
+                differences.add_range(source_rows, target_rows)
+            depth += 1
+
+    differences.resolve()
+    missing_in_target = [raw_key for raw_key, _ in differences.source_only.values()]
+    missing_in_source = [raw_key for raw_key, _ in differences.target_only.values()]
+    mismatched = list(differences.mismatched.values())
+    difference_count = len(missing_in_target) + len(missing_in_source) + len(mismatched)
+
+    result = {
+        "table": source_table,
+        "target_table": f"{target_schema}.{target_table}",
+        "match": difference_count == 0,
+        "hashed_in_sql": in_sql,
+        "key_columns": list(key_columns),
+        "columns_compared": len(compared),
+        "ranges_compared": ranges_compared,
+        "ranges_mismatched": ranges_mismatched if in_sql else None,
+        "rows_compared": rows_compared,
+        "missing_in_target_count": len(missing_in_target),
+        "missing_in_source_count": len(missing_in_source),
+        "mismatched_count": len(mismatched),
+        "missing_in_target": missing_in_target[:max_differences],
+        "missing_in_source": missing_in_source[:max_differences],
+        "mismatched": mismatched[:max_differences],
+        "truncated": max(len(missing_in_target), len(missing_in_source), len(mismatched)) > max_differences,
+        "duration_seconds": round(time.monotonic() - started, 3)
+    }
+    if difference_count:
+        logger.warning(
+            f"Reconciliation of {source_table} found {difference_count} differing rows: "
+            f"{len(missing_in_target)} missing in target, {len(missing_in_source)} only in target, "
+            f"{len(mismatched)} with different content"
+        )
+    else:
+        logger.info(f"Reconciliation of {source_table} found no differences ({rows_compared} rows compared row by row)")
+    return result
@@ -0,0 +1,122 @@
+"""Threaded stages connected by bounded queues, for overlapping full load reads and writes."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often blocked stages check whether the copy was stopped
+POLL_INTERVAL_SECONDS = 0.5
+
+_END = object()
+
+
+class _StageFailure:
+    """Exception raised in a stage, passed downstream in place of an item."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class StagedPipeline:
+    """Runs the stages of a copy in threads connected by bounded queues.
+
+    Each stage consumes an iterable in its own thread and puts its results
+    on a queue of at most ``queue_depth`` items, so a fast stage blocks
+    (backpressure) instead of buffering without limit, and the slowest
+    stage sets the throughput. An exception in a stage is passed downstream
+    and raised by the consumer. ``stop`` makes blocked stages exit and waits
+    for their threads; iterators that a stage consumes are closed in that
+    stage's thread.
+
+    With ``queue_depth`` 0 stages run lazily on the consuming thread.
+    """
+
+    def __init__(self, name: str, queue_depth: int = 4):
+        """Initialize staged pipeline.
+
+        Args:
+            name: Name used for the stage threads
+            queue_depth: Maximum number of items waiting between two stages
+        """
+        self.name = name
+        self.queue_depth = max(0, int(queue_depth))
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self, items: Iterable[Any], func: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+        """Start a stage applying ``func`` to every item.
+
+        Args:
+            items: Input of the stage (a source generator or a previous stage)
+            func: Conversion applied to every item (None passes items through)
+
+        Returns:
+            Iterator over the stage results, to be consumed by one thread
+        """
+        if self.queue_depth == 0:
+            return iter(items) if func is None else map(func, items)
+
+        out_queue: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        thread = threading.Thread(
+            target=self._run,
+            args=(items, func, out_queue),
+            name=f"{self.name}-stage-{len(self._threads)}",
+            daemon=True
+        )
+        self._threads.append(thread)
+        thread.start()
+        return self._drain(out_queue)
+
+    def stop(self) -> None:
+        """Stop all stages and wait for their threads to exit."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _run(self, items: Iterable[Any], func: Optional[Callable[[Any], Any]], out_queue: queue.Queue) -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if self._stop.is_set():
+                    return
+                if not self._put(out_queue, item if func is None else func(item)):
+                    return
+            self._put(out_queue, _END)
+        except Exception as e:
+            self._put(out_queue, _StageFailure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Failed to close input of stage {threading.current_thread().name}: {e}")
+
+    def _put(self, out_queue: queue.Queue, item: Any) -> bool:
+        while not self._stop.is_set():
+            try:
+                out_queue.put(item, timeout=POLL_INTERVAL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _drain(self, in_queue: queue.Queue) -> Iterator[Any]:
+        while True:
+            try:
+                item = in_queue.get(timeout=POLL_INTERVAL_SECONDS)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            if item is _END:
+                return
+            if isinstance(item, _StageFailure):
+                raise item.error
+            yield item
@@ -0,0 +1,132 @@
+"""Source table statistics gathered once per full load run."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+from ingestion.connectors.base_connector import BaseConnector
+
+logger = logging.getLogger(__name__)
+
+
+def count_table_rows(connector: BaseConnector, database: Optional[str], schema: Optional[str], table_name: str) -> int:
+    """Count a table's rows exactly (COUNT(*))."""
+    if hasattr(connector, "get_table_row_count"):
+        return connector.get_table_row_count(table=table_name, database=database, schema=schema)
+    data = connector.extract_data(database=database, schema=schema, table_name=table_name, limit=1, offset=0)
+    return max(data.get("total_rows") or 0, len(data.get("rows") or []))
+
+
+def estimate_table_rows(connector: BaseConnector, database: Optional[str], schema: Optional[str], table_name: str) -> int:
+    """Estimate a table's row count from catalog statistics, counting rows when there are none."""
+    try:
+        estimate = connector.estimate_row_count(table_name, database=database, schema=schema)
+    except Exception as e:
+        logger.debug(f"Could not read row estimate of {table_name} from catalog statistics: {e}")
+        estimate = None
+    if estimate is not None:
+        return estimate
+    return count_table_rows(connector, database, schema, table_name)
+
+
+class TableStatsCache:
+    """Statistics of a run's source tables, each gathered once.
+
+    Shared by the source validation before a full load, the transfer of
+    every table (row totals for progress reporting, the check of a table
+    that copied no rows) and the checks after the load, which otherwise
+    each counted the table again. Row counts are read from catalog
+    statistics where the connector has them (see
+    BaseConnector.estimate_row_count); exact counts are only taken for
+    tables without statistics, tables the statistics show as empty, and
+    when a caller asks for one with ``count_rows``.
+    """
+
+    def __init__(self, connector: BaseConnector, database: Optional[str], schema: Optional[str]):
+        """Initialize table statistics cache.
+
+        Args:
+            connector: Source database connector
+            database: Source database name
+            schema: Source schema name
+        """
+        self.connector = connector
+        self.database = database
+        self.schema = schema
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._table_locks: Dict[str, threading.Lock] = {}
+
+    def _table_lock(self, table_name: str) -> threading.Lock:
+        with self._lock:
+            return self._table_locks.setdefault(table_name, threading.Lock())
+
+    def get(self, table_name: str, connector: Optional[BaseConnector] = None) -> Dict[str, Any]:
+        """Get the statistics of a table, gathering them on the first call.
+
+        Args:
+            table_name: Source table name
+            connector: Connector to query with instead of the cache's, e.g. a
+                parallel worker's clone (optional)
+
+        Returns:
+            Dictionary with table_exists, columns (names), row_estimate,
+            estimated (False when row_estimate is an exact count) and has_data
+        """
+        with self._table_lock(table_name):
+            stats = self._stats.get(table_name)
+            if stats is None:
+                stats = self._gather(table_name, connector or self.connector)
+                self._stats[table_name] = stats
+            return stats
+
+    def _gather(self, table_name: str, connector: BaseConnector) -> Dict[str, Any]:
+        schema_result = connector.extract_schema(database=self.database, schema=self.schema, table=table_name)
+        tables = schema_result.get("tables", [])
+        if not tables:
+            return {"table_exists": False, "columns": [], "row_estimate": 0, "estimated": False, "has_data": False}
+
+        try:
+            estimate = connector.estimate_row_count(table_name, database=self.database, schema=self.schema)
+        except Exception as e:
+            logger.debug(f"Could not read row estimate of {table_name} from catalog statistics: {e}")
+            estimate = None
+        if estimate:
+            row_estimate, estimated = estimate, True
+        else:
+            # No statistics, or statistics of an empty table: counting is cheap or needed
+            row_estimate, estimated = self.count_rows(table_name, connector), False
+
+        stats = {
+            "table_exists": True,
+            "columns": [column.get("name") for column in tables[0].get("columns", [])],
+            "row_estimate": row_estimate,
+            "estimated": estimated,
+            "has_data": row_estimate > 0
+        }
+        logger.info(
+            f"Source table {self.schema}.{table_name}: {'~' if estimated else ''}{row_estimate} rows, "
+            f"{len(stats['columns'])} columns"
+        )
+        return stats
+
+    def count_rows(self, table_name: str, connector: Optional[BaseConnector] = None) -> int:
+        """Count a table's rows exactly, once per run.
+
+        Args:
+            table_name: Source table name
+            connector: Connector to query with instead of the cache's (optional)
+
+        Returns:
+            Row count
+        """
+        with self._lock:
+            if table_name in self._counts:
+                return self._counts[table_name]
+        count = count_table_rows(connector or self.connector, self.database, self.schema, table_name)
+        with self._lock:
+            self._counts[table_name] = count
+        return count
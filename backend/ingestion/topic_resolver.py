@@ -0,0 +1,162 @@
+"""Kafka topic to pipeline resolution for the CDC event logger."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _TopicIndex:
+    """Immutable lookup structures of one topic mapping."""
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = dict(mapping)
+        # Trie of dot-separated topic segments; each node keeps the pipeline
+        # of the first topic registered through it
+        self.trie: Dict[str, tuple] = {}
+        for topic, pipeline_id in self.mapping.items():
+            children = self.trie
+            for segment in topic.split("."):
+                node = children.get(segment)
+                if node is None:
+                    node = (pipeline_id, {})
+                    children[segment] = node
+                children = node[1]
+
+    def match_prefix(self, topic: str) -> Optional[str]:
+        """Pipeline of the registered topic sharing the most leading segments with topic."""
+        pipeline_id = None
+        children = self.trie
+        for segment in topic.split("."):
+            node = children.get(segment)
+            if node is None:
+                break
+            pipeline_id, children = node
+        return pipeline_id
+
+
+class TopicResolver:
+    """Resolves Kafka topics to pipeline IDs without a database query per message.
+
+    Topics are looked up in the registered mapping, then by their longest
+    dot-separated prefix shared with a registered topic (e.g. another table
+    topic of the same Debezium server), and the result is cached. Topics
+    matching nothing are cached as unknown for ``negative_ttl_seconds``;
+    the mapping is reloaded with ``loader`` at most once per that interval.
+    Registering or removing a topic (pipeline start/stop) rebuilds the
+    index and clears both caches.
+    """
+
+    def __init__(
+        self,
+        mapping: Optional[Dict[str, str]] = None,
+        loader: Optional[Callable[[], Dict[str, str]]] = None,
+        negative_ttl_seconds: float = 60.0
+    ):
+        """Initialize topic resolver.
+
+        Args:
+            mapping: Topic name to pipeline ID mapping (optional)
+            loader: Returns the topic mapping of all pipelines, e.g. from the
+                metadata database (optional)
+            negative_ttl_seconds: How long a topic without pipeline stays unknown
+        """
+        self.loader = loader
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._lock = threading.Lock()
+        self._index = _TopicIndex(mapping or {})
+        self._resolved: Dict[str, str] = {}
+        self._unknown: Dict[str, float] = {}  # topic -> time the entry expires
+        self._last_load = 0.0
+
+    def _rebuild(self, mapping: Dict[str, str]) -> None:
+        # Called with the lock held; readers keep using the previous index until swapped
+        self._index = _TopicIndex(mapping)
+        self._resolved = {}
+        self._unknown = {}
+
+    def set_mapping(self, mapping: Dict[str, str]) -> None:
+        """Replace the topic mapping."""
+        with self._lock:
+            self._rebuild({topic: str(pipeline_id) for topic, pipeline_id in mapping.items()})
+
+    def add(self, topic: str, pipeline_id: str) -> None:
+        """Register the topic of a started pipeline."""
+        with self._lock:
+            if self._index.mapping.get(topic) == pipeline_id:
+                return
+            mapping = dict(self._index.mapping)
+            mapping[topic] = pipeline_id
+            self._rebuild(mapping)
+
+    def remove(self, topic: str) -> None:
+        """Unregister the topic of a stopped pipeline."""
+        with self._lock:
+            if topic not in self._index.mapping:
+                return
+            mapping = dict(self._index.mapping)
+            del mapping[topic]
+            self._rebuild(mapping)
+
+    def mapping(self) -> Dict[str, str]:
+        """Registered topic to pipeline ID mapping."""
+        return dict(self._index.mapping)
+
+    def resolve(self, topic: str) -> Optional[str]:
+        """Get the pipeline ID of a topic.
+
+        Args:
+            topic: Kafka topic name
+
+        Returns:
+            Pipeline ID, or None when no pipeline matches the topic
+        """
+        index = self._index
+        pipeline_id = index.mapping.get(topic) or self._resolved.get(topic)
+        if pipeline_id:
+            return pipeline_id
+
+        now = time.monotonic()
+        expires = self._unknown.get(topic)
+        if expires is not None and now < expires:
+            return None
+
+        pipeline_id = index.match_prefix(topic)
+        if pipeline_id is None and self.loader and now - self._last_load >= self.negative_ttl_seconds:
+            self._reload(now)
+            index = self._index
+            pipeline_id = index.mapping.get(topic) or index.match_prefix(topic)
+
+        with self._lock:
+            if index is not self._index:
+                # The mapping changed meanwhile; resolve against it on the next message
+                return pipeline_id
+            if pipeline_id:
+                self._resolved[topic] = pipeline_id
+                logger.info(f"Resolved topic {topic} to pipeline {pipeline_id}")
+            else:
+                self._unknown[topic] = now + self.negative_ttl_seconds
+                logger.warning(
+                    f"⚠️  No pipeline found for topic {topic}; its events are skipped for "
+                    f"{self.negative_ttl_seconds:.0f}s. Registered topics: {list(index.mapping.keys())}"
+                )
+        return pipeline_id
+
+    def _reload(self, now: float) -> None:
+        self._last_load = now
+        try:
+            loaded = self.loader()
+        except Exception as e:
+            logger.error(f"❌ Failed to load topic mappings: {e}")
+            return
+        with self._lock:
+            mapping = dict(self._index.mapping)
+            added = {topic: pipeline_id for topic, pipeline_id in loaded.items() if topic not in mapping}
+            if added:
+                mapping.update(added)
+                self._rebuild(mapping)
+                logger.info(f"Loaded {len(added)} topic mappings: {list(added.keys())}")
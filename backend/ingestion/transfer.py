@@ -2,19 +2,316 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import math
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
+from ingestion.batching import AdaptiveBatchSizer, create_batch_sizer, estimate_batch_bytes
+from ingestion.columnar import columnar_enabled, record_batch_to_rows
+from ingestion.checkpoints import CHUNK_COMPLETED, CHUNK_PENDING, CHUNK_STARTED, TABLE_COMPLETED, FullLoadCheckpointStore
 from ingestion.connectors.base_connector import BaseConnector
 from ingestion.connectors.sqlserver import SQLServerConnector
 from ingestion.connectors.postgresql import PostgreSQLConnector
 from ingestion.connectors.oracle import OracleConnector
 from ingestion.connectors.as400 import AS400Connector
+from ingestion.loaders import BaseLoader, create_loader
+from ingestion.progress import STAGE_COUNTING, STAGE_CREATING_SCHEMA, FullLoadProgress
+from ingestion.stages import StagedPipeline
+from ingestion.table_stats import TableStatsCache, estimate_table_rows
+from ingestion.watermarks import WatermarkStore, WatermarkTracker, get_watermark_column, is_watermark_strictly_increasing
 
 logger = logging.getLogger(__name__)
 
 
+def clone_connector(connector: BaseConnector) -> BaseConnector:
+    """Create a new connector of the same type and configuration.
+
+    Used to give each full load worker its own connections. The clone reads
+    through the same consistent snapshot as the original, if one is active.
+    """
+    clone = type(connector)(dict(connector.config))
+    clone.snapshot = connector.snapshot
+    return clone
+
+
+def run_table_workers(
+    tables: List[str],
+    worker: Callable[[str], Any],
+    max_workers: int = 1
+) -> List[Tuple[str, Any, Optional[Exception]]]:
+    """Run a per-table worker for every table, several tables at a time.
+
+    Args:
+        tables: Table names to process
+        worker: Callable taking a table name and returning its result
+        max_workers: Maximum number of tables processed concurrently
+
+    Returns:
+        List of (table_name, result, error) in the order of ``tables``;
+        result is None when the worker raised
+    """
+    def run(table_name: str) -> Tuple[str, Any, Optional[Exception]]:
+        try:
+            return table_name, worker(table_name), None
+        except Exception as e:
+            return table_name, None, e
+
+    max_workers = max(1, min(max_workers or 1, len(tables)))
+    if max_workers == 1:
+        return [run(table_name) for table_name in tables]
+
+    logger.info(f"Processing {len(tables)} tables with {max_workers} parallel workers")
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="full-load") as executor:
+        return list(executor.map(run, tables))
+
+
+class TransferSession:
+    """Source and target state shared by all copies of one table.
+
+    Table metadata (primary key columns, source row count) is resolved once
+    per table instead of once per batch or chunk. The session holds one
+    source connection, read by every chunk in turn, and one bulk loader (or,
+    without one, one INSERT connection) on the target, so a table copy
+    opens a single connection per side. Sessions forked for parallel
+    workers get their own connections and share the metadata and the
+    batch sizer.
+
+    Connections are opened on first use; ``close`` closes them and leaves
+    the session usable, so a session is reset after a failed chunk.
+    """
+
+    def __init__(
+        self,
+        source: BaseConnector,
+        target: BaseConnector,
+        table_name: str,
+        source_database: Optional[str],
+        source_schema: Optional[str],
+        target_database: Optional[str],
+        target_schema: Optional[str],
+        options: Optional[Dict[str, Any]] = None,
+        batch_sizer: Optional[AdaptiveBatchSizer] = None,
+        table_stats: Optional[TableStatsCache] = None,
+        _metadata: Optional[Dict[str, Any]] = None
+    ):
+        """Initialize transfer session.
+
+        Args:
+            source: Source database connector
+            target: Target database connector
+            table_name: Name of the table
+            source_database: Source database name
+            source_schema: Source schema name
+            target_database: Target database name (optional)
+            target_schema: Target schema name (optional)
+            options: Full load options, passed to create_loader
+            batch_sizer: Batch sizer of the table (default: from options)
+            table_stats: Source table statistics of the run, which the row
+                count and estimate are read from (optional)
+        """
+        self.source = source
+        self.target = target
+        self.table_name = table_name
+        self.source_database = source_database
+        self.source_schema = source_schema
+        self.target_database = target_database
+        self.target_schema = target_schema
+        self.options = options or {}
+        self.batch_sizer = batch_sizer or create_batch_sizer(self.options)
+        self.table_stats = table_stats
+        # Shared with forked sessions, guarded by its lock
+        self._metadata = _metadata if _metadata is not None else {"lock": threading.Lock()}
+        self._source_conn = None
+        self._target_conn = None
+        self._loader: Optional[BaseLoader] = None
+        self._loader_resolved = False
+
+    @property
+    def key_columns(self) -> List[str]:
+        """Primary key columns of the source table (empty when it has none)."""
+        with self._metadata["lock"]:
+            if "key_columns" not in self._metadata:
+                try:
+                    self._metadata["key_columns"] = self.source.get_primary_keys(
+                        self.table_name, database=self.source_database, schema=self.source_schema
+                    ) or []
+                except Exception as e:
+                    logger.warning(f"Could not get primary keys for {self.table_name}: {e}")
+                    self._metadata["key_columns"] = []
+            return self._metadata["key_columns"]
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the source table, counted once."""
+        if self.table_stats is not None:
+            return self.table_stats.count_rows(self.table_name, self.source)
+        with self._metadata["lock"]:
+            if "row_count" not in self._metadata:
+                data = self.source.extract_data(
+                    database=self.source_database,
+                    schema=self.source_schema,
+                    table_name=self.table_name,
+                    limit=1,
+                    offset=0
+                )
+                self._metadata["row_count"] = max(data.get("total_rows") or 0, len(data.get("rows") or []))
+            return self._metadata["row_count"]
+
+    @property
+    def row_estimate(self) -> int:
+        """Number of rows in the source table, from catalog statistics where available."""
+        if self.table_stats is not None:
+            return self.table_stats.get(self.table_name, self.source)["row_estimate"]
+        with self._metadata["lock"]:
+            if "row_estimate" not in self._metadata:
+                self._metadata["row_estimate"] = estimate_table_rows(
+                    self.source, self.source_database, self.source_schema, self.table_name
+                )
+            return self._metadata["row_estimate"]
+
+    def iter_rows(
+        self,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        columnar: bool = False,
+        lower_inclusive: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream the table (optionally one key range) over the session's source connection.
+
+        Batches are sized by the session's batch sizer. With ``columnar``
+        they hold an Arrow record batch ("batch") instead of "rows". With
+        ``lower_inclusive`` rows with key == lower_key are read too.
+        """
+        if self._source_conn is None:
+            self._source_conn = self.source.connect()
+        read = self.source.iter_record_batches if columnar else self.source.iter_rows
+        return read(
+            database=self.source_database,
+            schema=self.source_schema,
+            table_name=self.table_name,
+            fetch_size=self.batch_sizer.batch_size,
+            key_columns=key_columns,
+            lower_key=lower_key,
+            upper_key=upper_key,
+            connection=self._source_conn,
+            batch_sizer=self.batch_sizer,
+            lower_inclusive=lower_inclusive
+        )
+
+    def get_loader(self, column_names: List[str]) -> Optional[BaseLoader]:
+        """Get the session's bulk loader, creating it on the first call.
+
+        Returns:
+            Loader, or None when the target has no bulk loader
+        """
+        if not self._loader_resolved:
+            self._loader = create_loader(
+                self.target,
+                self.table_name,
+                column_names,
+                database=self.target_database,
+                schema=self.target_schema,
+                options=self.options
+            )
+            self._loader_resolved = True
+            if self._loader is not None:
+                logger.info(f"Loading {self.table_name} with {type(self._loader).__name__}")
+        return self._loader
+
+    def target_connection(self):
+        """Target connection for batched INSERTs when there is no bulk loader."""
+        if self._target_conn is None:
+            self._target_conn = self.target.connect()
+        return self._target_conn
+
+    def fork(self) -> "TransferSession":
+        """Create a session for a parallel worker, with its own connections and shared metadata."""
+        return TransferSession(
+            clone_connector(self.source),
+            clone_connector(self.target),
+            self.table_name,
+            self.source_database,
+            self.source_schema,
+            self.target_database,
+            self.target_schema,
+            self.options,
+            batch_sizer=self.batch_sizer,
+            table_stats=self.table_stats,
+            _metadata=self._metadata
+        )
+
+    def close(self) -> None:
+        """Close the session's connections."""
+        if self._loader is not None:
+            self._loader.close()
+        self._loader = None
+        self._loader_resolved = False
+        for conn in (self._source_conn, self._target_conn):
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        self._source_conn = None
+        self._target_conn = None
+
+    def __enter__(self) -> "TransferSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def run_with_sessions(
+    session: TransferSession,
+    func: Callable[[TransferSession, Any], Any],
+    items: List[Any],
+    max_workers: int = 1,
+    thread_name_prefix: str = "transfer-session"
+) -> List[Tuple[Any, Any, Optional[Exception]]]:
+    """Run ``func(session, item)`` for every item on up to ``max_workers`` sessions.
+
+    With one worker every item uses ``session``; otherwise each worker
+    thread borrows one of ``max_workers`` forked sessions, which are closed
+    at the end. A session whose item raised is closed, so the next item
+    reconnects.
+
+    Returns:
+        List of (item, result, error) in the order of ``items``
+    """
+    max_workers = max(1, min(max_workers or 1, len(items)))
+    idle_sessions: "queue.Queue[TransferSession]" = queue.Queue()
+    forked = [session.fork() for _ in range(max_workers)] if max_workers > 1 else [session]
+    for item_session in forked:
+        idle_sessions.put(item_session)
+
+    def run(item: Any) -> Tuple[Any, Any, Optional[Exception]]:
+        item_session = idle_sessions.get()
+        try:
+            return item, func(item_session, item), None
+        except Exception as e:
+            item_session.close()
+            return item, None, e
+        finally:
+            idle_sessions.put(item_session)
+
+    if max_workers == 1:
+        return [run(item) for item in items]
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix) as executor:
+            return list(executor.map(run, items))
+    finally:
+        for item_session in forked:
+            item_session.close()
+
+
 class DataTransfer:
     """Utility class for transferring data between databases.
     
@@ -141,16 +438,37 @@ class DataTransfer:
     def __init__(
         self,
         source_connector: BaseConnector,
-        target_connector: BaseConnector
+        target_connector: BaseConnector,
+        options: Optional[Dict[str, Any]] = None,
+        checkpoints: Optional[FullLoadCheckpointStore] = None,
+        progress: Optional[FullLoadProgress] = None,
+        watermarks: Optional[WatermarkStore] = None,
+        table_stats: Optional[TableStatsCache] = None
     ):
         """Initialize data transfer utility.
 
         Args:
             source_connector: Source database connector instance
             target_connector: Target database connector instance
+            options: Full load options (pipeline full_load_config), e.g. the
+                bulk loader settings read by ingestion.loaders.create_loader
+            checkpoints: Checkpoint store; when set, tables are copied in
+                checkpointed chunks and interrupted loads resume (optional)
+            progress: Full load progress the tables' stages and copied
+                batches are reported to (optional)
+            watermarks: Watermark store; when set, tables are reloaded
+                incrementally, copying only rows from the stored watermark on
+                (optional)
+            table_stats: Source table statistics shared with the validation
+                of the run, so tables are not counted again (optional)
         """
         self.source = source_connector
         self.target = target_connector
+        self.options = options or {}
+        self.checkpoints = checkpoints
+        self.progress = progress
+        self.watermarks = watermarks
+        self.table_stats = table_stats
         self._validate_connectors()
 
     def _validate_connectors(self) -> None:
@@ -200,7 +518,9 @@ class DataTransfer:
         transfer_schema: bool = True,
         transfer_data: bool = True,
         batch_size: int = 1000,
-        create_if_not_exists: bool = True
+        create_if_not_exists: bool = True,
+        strategy: str = "cursor",
+        parallel_chunks: int = 4
     ) -> Dict[str, Any]:
         """Transfer a single table from source to target database.
 
@@ -212,8 +532,12 @@ class DataTransfer:
             target_schema: Target schema name (optional)
             transfer_schema: Whether to transfer/create table schema
             transfer_data: Whether to transfer table data
-            batch_size: Number of rows to insert per batch
+            batch_size: Initial number of rows per batch; adapted to the row
+                size and write latency unless full_load_config sets
+                "adaptive_batch_size" to false (see ingestion.batching)
             create_if_not_exists: Whether to create table if it doesn't exist
+            strategy: Data transfer strategy, "cursor" or "pk_range" (see transfer_data)
+            parallel_chunks: Number of key ranges copied concurrently with "pk_range"
 
         Returns:
             Dictionary with transfer results
@@ -234,6 +558,8 @@ class DataTransfer:
         try:
             # Transfer schema if requested
             if transfer_schema:
+                if self.progress is not None:
+                    self.progress.set_stage(table_name, STAGE_CREATING_SCHEMA)
                 try:
                     self.transfer_schema(
                         table_name=table_name,
@@ -260,7 +586,9 @@ class DataTransfer:
                         source_schema=source_schema,
                         target_database=target_database,
                         target_schema=target_schema,
-                        batch_size=batch_size
+                        batch_size=batch_size,
+                        strategy=strategy,
+                        parallel_chunks=parallel_chunks
                     )
                     result["data_transferred"] = True
                     result["rows_transferred"] = rows_transferred
@@ -282,12 +610,19 @@ class DataTransfer:
                 f"Table transfer completed: {table_name} "
                 f"({result['rows_transferred']} rows transferred)"
             )
+            if self.progress is not None:
+                if result["errors"]:
+                    self.progress.fail_table(table_name, result["errors"][0])
+                else:
+                    self.progress.complete_table(table_name)
 
         except Exception as e:
             # Only catch exceptions that weren't already handled
             logger.error(f"Table transfer failed for {table_name}: {e}")
             if str(e) not in result["errors"]:
                 result["errors"].append(str(e))
+            if self.progress is not None:
+                self.progress.fail_table(table_name, result["errors"][0])
             # Re-raise critical exceptions
             if "Data transfer failed" in str(e) or "Schema transfer failed" in str(e):
                 raise
@@ -303,7 +638,9 @@ class DataTransfer:
         target_schema: Optional[str] = None,
         transfer_schema: bool = True,
         transfer_data: bool = True,
-        batch_size: int = 1000
+        batch_size: int = 1000,
+        max_parallel_tables: int = 1,
+        table_options: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Transfer multiple tables from source to target database.
 
@@ -315,7 +652,13 @@ class DataTransfer:
             target_schema: Target schema name (optional)
             transfer_schema: Whether to transfer/create table schemas
             transfer_data: Whether to transfer table data
-            batch_size: Number of rows to insert per batch
+            batch_size: Initial number of rows per batch; adapted to the row
+                size and write latency unless full_load_config sets
+                "adaptive_batch_size" to false (see ingestion.batching)
+            max_parallel_tables: Number of tables transferred concurrently;
+                each worker uses its own source and target connectors
+            table_options: Per-table settings keyed by table name, e.g.
+                {"orders": {"strategy": "pk_range", "parallel_chunks": 8}}
 
         Returns:
             Dictionary with transfer results for all tables
@@ -328,18 +671,41 @@ class DataTransfer:
             "tables": []
         }
 
-        for table_name in tables:
+        parallel = max_parallel_tables > 1 and len(tables) > 1
+        worker_local = threading.local()
+
+        table_options = table_options or {}
+
+        def transfer_one(table_name: str) -> Dict[str, Any]:
+            options = table_options.get(table_name) or {}
+            transfer = self
+            if parallel:
+                transfer = getattr(worker_local, "transfer", None)
+                if transfer is None:
+                    transfer = DataTransfer(
+                        clone_connector(self.source), clone_connector(self.target), self.options,
+                        self.checkpoints, self.progress, self.watermarks, self.table_stats
+                    )
+                    worker_local.transfer = transfer
+            return transfer.transfer_table(
+                table_name=table_name,
+                source_database=source_database,
+                source_schema=source_schema,
+                target_database=target_database,
+                target_schema=target_schema,
+                transfer_schema=transfer_schema,
+                transfer_data=transfer_data,
+                batch_size=batch_size,
+                strategy=options.get("strategy", "cursor"),
+                parallel_chunks=int(options.get("parallel_chunks", 4))
+            )
+
+        outcomes = run_table_workers(tables, transfer_one, max_parallel_tables)
+
+        for table_name, table_result, error in outcomes:
             try:
-                table_result = self.transfer_table(
-                    table_name=table_name,
-                    source_database=source_database,
-                    source_schema=source_schema,
-                    target_database=target_database,
-                    target_schema=target_schema,
-                    transfer_schema=transfer_schema,
-                    transfer_data=transfer_data,
-                    batch_size=batch_size
-                )
+                if error is not None:
+                    raise error
 
                 results["tables"].append(table_result)
 
@@ -835,7 +1201,9 @@ class DataTransfer:
         source_schema: Optional[str] = None,
         target_database: Optional[str] = None,
         target_schema: Optional[str] = None,
-        batch_size: int = 1000
+        batch_size: int = 1000,
+        strategy: str = "cursor",
+        parallel_chunks: int = 4
     ) -> int:
         """Transfer table data (DML) from source to target.
 
@@ -845,92 +1213,498 @@ class DataTransfer:
             source_schema: Source schema name (optional)
             target_database: Target database name (optional)
             target_schema: Target schema name (optional)
-            batch_size: Number of rows to insert per batch
+            batch_size: Initial number of rows per batch; adapted to the row
+                size and write latency unless full_load_config sets
+                "adaptive_batch_size" to false (see ingestion.batching)
+            strategy: "cursor" streams the table through one source cursor;
+                "pk_range" splits the primary key into ranges that are
+                copied concurrently (for very large tables)
+            parallel_chunks: Number of key ranges copied concurrently with
+                the "pk_range" strategy
 
         Returns:
             Number of rows transferred
         """
-        # Extract data from source in batches
-        offset = 0
-        total_rows = 0
+        source_database = source_database or self.source.config.get("database")
+        source_schema = source_schema or self.source.config.get("schema", "dbo" if isinstance(self.source, SQLServerConnector) else "public")
+
+        # Metadata and connections are shared by all batches and chunks of the table
+        with TransferSession(
+            self.source,
+            self.target,
+            table_name,
+            source_database,
+            source_schema,
+            target_database,
+            target_schema,
+            self.options,
+            batch_sizer=create_batch_sizer(self.options, batch_size),
+            table_stats=self.table_stats
+        ) as session:
+            if self.watermarks is not None:
+                total_rows = self._transfer_data_incremental(session)
+            elif self.checkpoints is not None:
+                total_rows = self._transfer_data_checkpointed(session, strategy, parallel_chunks)
+            elif strategy == "pk_range":
+                self._start_progress(session)
+                total_rows = self._transfer_data_pk_range(session, parallel_chunks)
+            else:
+                if strategy != "cursor":
+                    logger.warning(f"Unknown transfer strategy {strategy!r} for {table_name}, using 'cursor'")
+                self._start_progress(session)
+                total_rows = self._copy_rows(session)
+
+            logger.info(f"Data transfer completed: {total_rows} rows transferred for {table_name}")
+
+            # If we attempted to transfer data but got 0 rows, check if source has data
+            # (an incremental reload copies no rows when nothing changed)
+            if total_rows == 0 and self.watermarks is None:
+                # Check if source actually has data
+                try:
+                    source_rows = session.row_count
+                    if source_rows > 0:
+                        # Source has data but we transferred 0 rows - this is a failure
+                        raise Exception(
+                            f"Data transfer failed for {table_name}: Source has data ({source_rows} rows) "
+                            f"but 0 rows were transferred. This indicates an insertion failure."
+                        )
+                    else:
+                        logger.info(f"Source table {table_name} is empty, 0 rows transferred is expected")
+                except Exception as check_error:
+                    # If we can't check, assume failure if 0 rows
+                    if "Data transfer failed" in str(check_error):
+                        raise  # Re-raise our own exception
+                    logger.warning(f"Could not verify source data for {table_name}: {check_error}")
+                    # Still raise an error - 0 rows when we expect data is suspicious
+                    raise Exception(
+                        f"Data transfer returned 0 rows for {table_name} and could not verify source data. "
+                        f"This may indicate a problem with the transfer."
+                    )
+        
+        return total_rows
 
-        while True:
-            # Get batch of data from source
-            source_data = self.source.extract_data(
-                database=source_database or self.source.config.get("database"),
-                schema=source_schema or self.source.config.get("schema", "dbo" if isinstance(self.source, SQLServerConnector) else "public"),
-                table_name=table_name,
-                limit=batch_size,
-                offset=offset
-            )
+    def _start_progress(self, session: TransferSession, rows_copied: int = 0) -> None:
+        """Report a table as copying, with its (estimated) source row count as the total to copy."""
+        if self.progress is None:
+            return
+        self.progress.set_stage(session.table_name, STAGE_COUNTING)
+        try:
+            total_rows = session.row_estimate
+        except Exception as e:
+            logger.warning(f"Could not count rows of {session.table_name} for progress reporting: {e}")
+            total_rows = None
+        self.progress.start_table(session.table_name, total_rows, rows_copied)
+
+    def _copy_rows(
+        self,
+        session: TransferSession,
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None,
+        delete_previous_rows: bool = False,
+        upsert_keys: Optional[List[str]] = None,
+        watermark: Optional[WatermarkTracker] = None,
+        lower_inclusive: bool = False
+    ) -> int:
+        """Stream rows (optionally one key range) from source and insert them into target.
 
-            if not source_data.get("rows"):
-                break
+        Rows are read over the session's source connection and written with
+        the session's loader, both kept open for the next copy of the table.
+        The written rows are committed before returning.
 
+        With ``delete_previous_rows``, full load rows an interrupted run left
+        in the key range are deleted in the same transaction as the first
+        rows written.
+
+        Rows flow through a reader thread, a conversion thread and the
+        writing (calling) thread, connected by bounded queues of
+        ``queue_depth`` batches (full_load_config, default 4; 0 reads,
+        converts and writes in lockstep), so reading the next batches from
+        the source overlaps writing to the target.
+
+        Batches are sized by the session's batch sizer, which sees the rows
+        read by the conversion stage and the time every write takes.
+
+        With full_load_config "columnar" (requires pyarrow) batches travel as
+        Arrow record batches from the source to the loader, which appends
+        the metadata columns as constant arrays.
+
+        With ``upsert_keys``, the target rows with the keys of a batch are
+        deleted before the batch is written, in the same transaction, so
+        rows copied again replace their previous version. ``watermark`` is
+        updated with the rows of every batch. ``lower_inclusive`` also reads
+        the rows with key == lower_key.
+
+        Returns:
+            Number of rows copied
+        """
+        table_name = session.table_name
+        # Stream the table over one source connection; memory is bounded by the
+        # batch size times the number of batches queued between the stages
+        total_rows = 0
+        columnar = columnar_enabled(self.options)
+        batches = session.iter_rows(
+            key_columns=key_columns, lower_key=lower_key, upper_key=upper_key,
+            columnar=columnar, lower_inclusive=lower_inclusive
+        )
+        stages = StagedPipeline(f"copy-{table_name}", int(self.options.get("queue_depth", 4)))
+
+        # Bulk loader on the session's target connection, created on the first batch;
+        # None means the target has no bulk loader and batches are INSERTed
+        loader: Optional[BaseLoader] = None
+        rejected_before = 0
+        batch_sizer = session.batch_sizer
+
+        def batch_keys(source_data: Dict[str, Any]) -> Optional[List[Tuple[Any, ...]]]:
+            # Keys of the batch's rows, read before the loader converts them
+            if not upsert_keys:
+                return None
+            if columnar:
+                record_batch = source_data["batch"]
+                columns = [
+                    record_batch.column(record_batch.schema.get_field_index(column)).to_pylist()
+                    for column in upsert_keys
+                ]
+                return list(zip(*columns))
+            indexes = [source_data["column_names"].index(column) for column in upsert_keys]
+            return [tuple(row[index] for index in indexes) for row in source_data["rows"]]
+
+        def observe_watermark(source_data: Dict[str, Any]) -> None:
+            if watermark is None:
+                return
+            if columnar:
+                watermark.observe_record_batch(source_data["batch"])
+            else:
+                watermark.observe_rows(source_data["rows"], source_data["column_names"])
+
+        def prepare(source_data: Dict[str, Any]) -> Tuple[Any, int, int, Optional[List[Tuple[Any, ...]]]]:
+            observe_watermark(source_data)
+            keys = batch_keys(source_data)
+            if columnar:
+                record_batch = source_data["batch"]
+                batch_sizer.observe_row_bytes(record_batch.nbytes / max(1, record_batch.num_rows))
+                return loader.prepare_record_batch(record_batch), record_batch.num_rows, record_batch.nbytes, keys
             rows = source_data["rows"]
-            column_names = source_data["column_names"]
+            byte_count = estimate_batch_bytes(rows)
+            batch_sizer.observe_row_bytes(byte_count / max(1, len(rows)))
+            return loader.prepare(rows), len(rows), byte_count, keys
 
-            # Insert batch into target
-            try:
-                self._insert_batch(
-                    table_name=table_name,
-                    rows=rows,
-                    column_names=column_names,
-                    target_database=target_database,
-                    target_schema=target_schema
+        try:
+            source_batches = stages.start(batches)
+            first_batch = next(source_batches, None)
+
+            if first_batch is not None:
+                loader = session.get_loader(first_batch["column_names"])
+                if loader is None and upsert_keys:
+                    raise Exception(f"Cannot upsert rows into {table_name} without a bulk loader for the target")
+                if loader is not None:
+                    rejected_before = loader.rejected_rows
+                    loader.open()
+                    if delete_previous_rows:
+                        loader.delete_full_load_rows(key_columns, lower_key, upper_key)
+                elif delete_previous_rows:
+                    logger.warning(
+                        f"Cannot delete rows of an interrupted full load from {table_name} without a bulk loader, "
+                        f"the resumed range may be duplicated"
+                    )
+
+                source_batches = itertools.chain([first_batch], source_batches)
+                if loader is not None:
+                    # Convert the next batches to the loader's wire format while one is written
+                    prepared_batches = stages.start(source_batches, prepare)
+                else:
+                    def unprepared(source_batches):
+                        for source_data in source_batches:
+                            observe_watermark(source_data)
+                            yield source_data, source_data["row_count"], 0, None
+
+                    prepared_batches = unprepared(source_batches)
+
+                for batch, row_count, byte_count, keys in prepared_batches:
+                    # Insert batch into target
+                    try:
+                        write_started = time.monotonic()
+                        if loader is not None:
+                            if keys:
+                                loader.delete_rows_by_keys(upsert_keys, keys)
+                            batch_rows_inserted = loader.write_prepared(batch, row_count)
+                        else:
+                            rows = record_batch_to_rows(batch["batch"]) if columnar else batch["rows"]
+                            byte_count = estimate_batch_bytes(rows)
+                            batch_sizer.observe_row_bytes(byte_count / max(1, len(rows)))
+                            self._insert_batch(
+                                table_name=table_name,
+                                rows=rows,
+                                column_names=batch["column_names"],
+                                target_database=session.target_database,
+                                target_schema=session.target_schema,
+                                conn=session.target_connection()
+                            )
+                            batch_rows_inserted = row_count
+                        batch_sizer.observe_write(row_count, time.monotonic() - write_started)
+                        # Verify rows were actually inserted
+                        total_rows += batch_rows_inserted
+                        if self.progress is not None:
+                            self.progress.add_rows(table_name, batch_rows_inserted, byte_count)
+
+                        logger.debug(f"Successfully inserted {batch_rows_inserted} rows into target")
+                    except Exception as e:
+                        logger.error(f"Failed to insert batch of {row_count} rows: {e}")
+                        # Re-raise to fail the transfer
+                        raise Exception(f"Data insertion failed for {table_name}: {str(e)}")
+
+                    logger.info(
+                        f"Transferred {total_rows} rows for table {table_name} "
+                        f"(batch of {row_count} rows)"
+                    )
+            elif delete_previous_rows:
+                # Range is empty now; still remove what the interrupted run wrote
+                self._delete_full_load_rows(
+                    table_name, session.target_database, session.target_schema, key_columns, lower_key, upper_key
                 )
-                # Verify rows were actually inserted
-                batch_rows_inserted = len(rows)
-                total_rows += batch_rows_inserted
-                offset += batch_rows_inserted
-                
-                logger.debug(f"Successfully inserted {batch_rows_inserted} rows into target")
-            except Exception as e:
-                logger.error(f"Failed to insert batch of {len(rows)} rows: {e}")
-                # Re-raise to fail the transfer
-                raise Exception(f"Data insertion failed for {table_name}: {str(e)}")
 
-            logger.info(
-                f"Transferred {total_rows} rows for table {table_name} "
-                f"(batch of {len(rows)} rows)"
+            if loader is not None:
+                loader.commit()
+                rejected_rows = loader.rejected_rows - rejected_before
+                if rejected_rows:
+                    logger.warning(
+                        f"{rejected_rows} rows of {table_name} were rejected by the target and not loaded; "
+                        f"first errors: {loader.rejected_row_errors[:5]}"
+                    )
+        except Exception:
+            if loader is not None:
+                loader.rollback()
+            raise
+        finally:
+            # Stop the reader and conversion threads before the source cursor is closed
+            stages.stop()
+            batches.close()
+
+        return total_rows
+
+    def _transfer_data_incremental(self, session: TransferSession) -> int:
+        """Reload the rows of a table from its stored watermark on.
+
+        Rows whose watermark column (full_load_config "watermark_column",
+        see ingestion.watermarks) is at or above the watermark of the
+        previous run are read in watermark order and upserted into the
+        target by primary key. Rows with the watermark value itself are read
+        again, as rows committed after the previous run may share it; only
+        for a column declared "watermark_strictly_increasing" are rows read
+        above it. The first run, or a run with a different watermark column,
+        replaces all full load rows of the target table. The new watermark
+        is stored once the copied rows are committed.
+
+        Returns:
+            Number of rows copied
+
+        Raises:
+            ValueError: If the table has no watermark column or no primary key
+        """
+        table_name = session.table_name
+        column = get_watermark_column(self.options, table_name)
+        if not column:
+            raise ValueError(f"Incremental reload of {table_name} requires a watermark_column in full_load_config")
+        key_columns = session.key_columns
+        if not key_columns:
+            raise ValueError(f"Incremental reload of {table_name} requires a primary key to upsert rows")
+
+        stored = self.watermarks.get(table_name)
+        full_reload = stored is None or stored["column"] != column or stored["value"] is None
+        # Rows committed after the previous run may share the watermark value
+        lower_inclusive = not is_watermark_strictly_increasing(self.options, table_name)
+        if full_reload:
+            if stored is not None and stored["column"] != column:
+                logger.info(f"Watermark column of {table_name} changed from {stored['column']} to {column}, reloading the table")
+            lower_key = None
+            tracker = WatermarkTracker(column)
+        else:
+            lower_key = [stored["value"]]
+            tracker = WatermarkTracker(column, stored["value"])
+            logger.info(f"Reloading rows of {table_name} with {column} {'>=' if lower_inclusive else '>'} {stored['value']!r}")
+
+        if self.progress is not None:
+            # Changed rows are not counted up front
+            self.progress.start_table(table_name, None)
+        total_rows = self._copy_rows(
+            session,
+            key_columns=[column],
+            lower_key=lower_key,
+            delete_previous_rows=full_reload,
+            upsert_keys=None if full_reload else key_columns,
+            watermark=tracker,
+            lower_inclusive=lower_inclusive
+        )
+
+        if tracker.value is not None:
+            self.watermarks.set(table_name, column, tracker.value, total_rows)
+        return total_rows
+
+    def _transfer_data_pk_range(
+        self,
+        session: TransferSession,
+        parallel_chunks: int
+    ) -> int:
+        """Copy a table as primary key ranges, several ranges at a time.
+
+        Ranges are copied on up to ``parallel_chunks`` forked sessions, so
+        the copies run on separate source and target connections. Falls
+        back to a single cursor when the table has no primary key.
+
+        Returns:
+            Number of rows transferred
+        """
+        table_name = session.table_name
+        key_columns = session.key_columns
+        if not key_columns:
+            logger.warning(f"Table {table_name} has no primary key, falling back to a single cursor")
+            return self._copy_rows(session)
+
+        ranges = self.source.get_key_ranges(
+            database=session.source_database,
+            schema=session.source_schema,
+            table_name=table_name,
+            key_columns=key_columns,
+            num_ranges=parallel_chunks
+        )
+        logger.info(f"Copying {table_name} as {len(ranges)} key ranges on {key_columns}")
+
+        def copy_range(range_session: TransferSession, key_range: Tuple[Optional[List[Any]], Optional[List[Any]]]) -> int:
+            lower_key, upper_key = key_range
+            return self._copy_rows(
+                range_session, key_columns=key_columns, lower_key=lower_key, upper_key=upper_key
             )
 
-            if not source_data.get("has_more", False):
-                break
+        total_rows = 0
+        errors = []
+        for key_range, rows, error in run_with_sessions(session, copy_range, ranges, parallel_chunks, "pk-range"):
+            if error is not None:
+                logger.error(f"Key range {key_range} of {table_name} failed: {error}")
+                errors.append(error)
+            else:
+                total_rows += rows
+
+        if errors:
+            raise errors[0]
+        return total_rows
 
-        logger.info(f"Data transfer completed: {total_rows} rows transferred for {table_name}")
-        
-        # If we attempted to transfer data but got 0 rows, check if source has data
-        if total_rows == 0:
-            # Check if source actually has data
-            try:
-                check_data = self.source.extract_data(
-                    database=source_database or self.source.config.get("database"),
-                    schema=source_schema or self.source.config.get("schema", "dbo" if isinstance(self.source, SQLServerConnector) else "public"),
+    def _transfer_data_checkpointed(
+        self,
+        session: TransferSession,
+        strategy: str,
+        parallel_chunks: int
+    ) -> int:
+        """Copy a table in primary key chunks, checkpointing every committed chunk.
+
+        A table with a checkpoint left by an interrupted run resumes from it:
+        completed chunks are skipped and started chunks have their rows
+        deleted from the target before they are copied again. A table gets
+        one chunk per full_load_config "checkpoint_chunk_rows" rows of its
+        row estimate (default 500000), at most "checkpoint_chunks" (default
+        32); a small table, or one without a primary key, is a single chunk
+        read with one cursor and no boundary query. With the "pk_range"
+        strategy up to ``parallel_chunks`` chunks are copied concurrently.
+
+        Returns:
+            Number of rows transferred, including chunks completed by earlier runs
+        """
+        table_name = session.table_name
+        checkpoint = self.checkpoints.get(table_name)
+        if checkpoint and checkpoint["status"] == TABLE_COMPLETED:
+            logger.info(f"Skipping {table_name}, copied by an earlier run ({checkpoint['rows_copied']} rows)")
+            if self.progress is not None:
+                self.progress.start_table(table_name, checkpoint["rows_copied"], checkpoint["rows_copied"])
+            return checkpoint["rows_copied"]
+
+        key_columns = session.key_columns
+
+        if checkpoint and checkpoint["chunks"] and (key_columns or len(checkpoint["chunks"]) == 1):
+            chunks = checkpoint["chunks"]
+            chunk_states = checkpoint["chunk_states"]
+            rows_copied = checkpoint["rows_copied"]
+            logger.info(
+                f"Resuming {table_name}: {chunk_states.count(CHUNK_COMPLETED)} of {len(chunks)} chunks "
+                f"({rows_copied} rows) copied by an earlier run"
+            )
+        else:
+            if checkpoint:
+                # Chunks of the earlier run cannot be reused; start over without its rows
+                logger.warning(f"Checkpoint of {table_name} does not match the table, restarting its full load")
+                self._delete_full_load_rows(table_name, session.target_database, session.target_schema)
+            num_chunks = max(1, int(self.options.get("checkpoint_chunks", 32)))
+            if key_columns and num_chunks > 1:
+                # Chunk boundaries cost a key scan; only tables large enough to resume are chunked
+                chunk_rows = max(1, int(self.options.get("checkpoint_chunk_rows", 500000)))
+                num_chunks = min(num_chunks, math.ceil(session.row_estimate / chunk_rows))
+            if key_columns and num_chunks > 1:
+                chunks = self.source.get_key_ranges(
+                    database=session.source_database,
+                    schema=session.source_schema,
                     table_name=table_name,
-                    limit=1,
-                    offset=0
+                    key_columns=key_columns,
+                    num_ranges=num_chunks
                 )
-                if check_data.get("rows") or check_data.get("total_rows", 0) > 0:
-                    # Source has data but we transferred 0 rows - this is a failure
-                    raise Exception(
-                        f"Data transfer failed for {table_name}: Source has data ({check_data.get('total_rows', 'unknown')} rows) "
-                        f"but 0 rows were transferred. This indicates an insertion failure."
-                    )
-                else:
-                    logger.info(f"Source table {table_name} is empty, 0 rows transferred is expected")
-            except Exception as check_error:
-                # If we can't check, assume failure if 0 rows
-                if "Data transfer failed" in str(check_error):
-                    raise  # Re-raise our own exception
-                logger.warning(f"Could not verify source data for {table_name}: {check_error}")
-                # Still raise an error - 0 rows when we expect data is suspicious
-                raise Exception(
-                    f"Data transfer returned 0 rows for {table_name} and could not verify source data. "
-                    f"This may indicate a problem with the transfer."
-                )
-        
-        return total_rows
+            else:
+                chunks = [(None, None)]
+            chunk_states = [CHUNK_PENDING] * len(chunks)
+            rows_copied = 0
+            self.checkpoints.start_table(table_name, chunks)
+
+        self._start_progress(session, rows_copied)
+        pending = [index for index, state in enumerate(chunk_states) if state != CHUNK_COMPLETED]
+        workers = max(1, min(parallel_chunks, len(pending))) if strategy == "pk_range" else 1
+
+        def copy_chunk(chunk_session: TransferSession, index: int) -> int:
+            lower_key, upper_key = chunks[index]
+            self.checkpoints.start_chunk(table_name, index)
+            rows = self._copy_rows(
+                chunk_session,
+                key_columns=key_columns or None, lower_key=lower_key, upper_key=upper_key,
+                delete_previous_rows=chunk_states[index] == CHUNK_STARTED
+            )
+            # The chunk's rows are committed on the target once _copy_rows returns
+            self.checkpoints.complete_chunk(table_name, index, rows)
+            return rows
+
+        errors = []
+        for index, rows, error in run_with_sessions(session, copy_chunk, pending, workers, "checkpoint-chunk"):
+            if error is not None:
+                logger.error(f"Chunk {index} {chunks[index]} of {table_name} failed: {error}")
+                errors.append(error)
+            else:
+                rows_copied += rows
+
+        if errors:
+            raise errors[0]
+        self.checkpoints.complete_table(table_name)
+        return rows_copied
+
+    def _delete_full_load_rows(
+        self,
+        table_name: str,
+        target_database: Optional[str],
+        target_schema: Optional[str],
+        key_columns: Optional[List[str]] = None,
+        lower_key: Optional[List[Any]] = None,
+        upper_key: Optional[List[Any]] = None
+    ) -> None:
+        """Delete full load rows of an interrupted run from the target and commit."""
+        loader = create_loader(
+            self.target,
+            table_name,
+            [],
+            database=target_database,
+            schema=target_schema,
+            options=self.options
+        )
+        if loader is None:
+            logger.warning(
+                f"Cannot delete rows of an interrupted full load from {table_name} without a bulk loader, "
+                f"rows may be duplicated"
+            )
+            return
+        with loader:
+            loader.delete_full_load_rows(key_columns, lower_key, upper_key)
 
     def _insert_batch(
         self,
@@ -938,20 +1712,26 @@ class DataTransfer:
         rows: List[List[Any]],
         column_names: List[str],
         target_database: Optional[str],
-        target_schema: Optional[str]
+        target_schema: Optional[str],
+        conn=None
     ) -> None:
-        """Insert a batch of rows into target database."""
+        """Insert a batch of rows into target database.
+
+        With ``conn`` the batch is inserted and committed over that open
+        connection, which is left open; otherwise a connection is opened and
+        closed for the batch.
+        """
         if isinstance(self.target, SQLServerConnector):
             self._insert_batch_sqlserver(
-                table_name, rows, column_names, target_database, target_schema
+                table_name, rows, column_names, target_database, target_schema, conn
             )
         elif isinstance(self.target, PostgreSQLConnector):
             self._insert_batch_postgresql(
-                table_name, rows, column_names, target_database, target_schema
+                table_name, rows, column_names, target_database, target_schema, conn
             )
         elif isinstance(self.target, OracleConnector):
             self._insert_batch_oracle(
-                table_name, rows, column_names, target_database, target_schema
+                table_name, rows, column_names, target_database, target_schema, conn
             )
         else:
             raise NotImplementedError(
@@ -964,7 +1744,8 @@ class DataTransfer:
         rows: List[List[Any]],
         column_names: List[str],
         database: Optional[str],
-        schema: Optional[str]
+        schema: Optional[str],
+        connection=None
     ) -> None:
         """Insert batch into SQL Server with transaction management."""
         schema_name = schema or "dbo"
@@ -972,7 +1753,7 @@ class DataTransfer:
         cursor = None
         
         try:
-            conn = self.target.connect()
+            conn = connection or self.target.connect()
             # pyodbc connections have autocommit as a property
             # Set to False to use transactions (default is True)
             if hasattr(conn, 'autocommit'):
@@ -1023,7 +1804,7 @@ class DataTransfer:
                     cursor.close()
                 except Exception:
                     pass
-            if conn:
+            if conn and connection is None:
                 try:
                     conn.close()
                 except Exception:
@@ -1035,7 +1816,8 @@ class DataTransfer:
         rows: List[List[Any]],
         column_names: List[str],
         database: Optional[str],
-        schema: Optional[str]
+        schema: Optional[str],
+        connection=None
     ) -> None:
         """Insert batch into PostgreSQL with transaction management.
         Target table has row_id (serial) + __op, __source_ts_ms, __deleted for SCD2.
@@ -1049,7 +1831,7 @@ class DataTransfer:
         cursor = None
         
         try:
-            conn = self.target.connect()
+            conn = connection or self.target.connect()
             conn.autocommit = False
             cursor = conn.cursor()
 
@@ -1092,7 +1874,7 @@ class DataTransfer:
                     cursor.close()
                 except Exception:
                     pass
-            if conn:
+            if conn and connection is None:
                 try:
                     conn.close()
                 except Exception:
@@ -1104,7 +1886,8 @@ class DataTransfer:
         rows: List[List[Any]],
         column_names: List[str],
         database: Optional[str],
-        schema: Optional[str]
+        schema: Optional[str],
+        connection=None
     ) -> None:
         """Insert batch into Oracle. Target table has row_id IDENTITY + __op, __source_ts_ms, __deleted. Full load appends __op='r', __source_ts_ms, __deleted=NULL."""
         schema_name = (schema or self.target.config.get("schema") or self.target.config.get("user") or "PUBLIC").upper()
@@ -1113,7 +1896,7 @@ class DataTransfer:
         cursor = None
 
         try:
-            conn = self.target.connect()
+            conn = connection or self.target.connect()
             cursor = conn.cursor()
 
             insert_columns = column_names + ["__op", "__source_ts_ms", "__deleted"]
@@ -1142,7 +1925,7 @@ class DataTransfer:
                     cursor.close()
                 except Exception:
                     pass
-            if conn:
+            if conn and connection is None:
                 try:
                     conn.close()
                 except Exception:
@@ -9,6 +9,7 @@ from ingestion.exceptions import ValidationError
 from ingestion.connectors.base_connector import BaseConnector
 from ingestion.connectors.postgresql import PostgreSQLConnector
 from ingestion.connectors.sqlserver import SQLServerConnector
+from ingestion.table_stats import TableStatsCache
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,8 @@ def validate_source_data(
     connector: BaseConnector,
     database: str,
     schema: str,
-    table_name: str
+    table_name: str,
+    stats: Optional[TableStatsCache] = None
 ) -> Dict[str, Any]:
     """Verify source table exists and has data.
     
@@ -26,6 +28,9 @@ def validate_source_data(
         database: Database name
         schema: Schema name
         table_name: Table name
+        stats: Table statistics of the run; when given, the existence and
+            row count are read from it (row_count may then be a catalog
+            estimate) instead of queried again (optional)
         
     Returns:
         Dictionary with validation results
@@ -34,6 +39,20 @@ def validate_source_data(
         ValidationError: If validation fails
     """
     try:
+        if stats is not None:
+            table_stats = stats.get(table_name)
+            if not table_stats["table_exists"]:
+                raise ValidationError(
+                    f"Source table {schema}.{table_name} not found in database {database}",
+                    validation_type="table_existence"
+                )
+            return {
+                "valid": True,
+                "table_exists": True,
+                "row_count": table_stats["row_estimate"],
+                "has_data": table_stats["has_data"]
+            }
+        
         # Check if table exists by extracting schema
         schema_result = connector.extract_schema(
             database=database,
@@ -400,6 +419,7 @@ def validate_data_integrity(
         )
 from ingestion.connectors.postgresql import PostgreSQLConnector
 from ingestion.connectors.sqlserver import SQLServerConnector
+from ingestion.table_stats import TableStatsCache
 
 logger = logging.getLogger(__name__)
 
@@ -408,7 +428,8 @@ def validate_source_data(
     connector: BaseConnector,
     database: str,
     schema: str,
-    table_name: str
+    table_name: str,
+    stats: Optional[TableStatsCache] = None
 ) -> Dict[str, Any]:
     """Verify source table exists and has data.
     
@@ -417,6 +438,9 @@ def validate_source_data(
         database: Database name
         schema: Schema name
         table_name: Table name
+        stats: Table statistics of the run; when given, the existence and
+            row count are read from it (row_count may then be a catalog
+            estimate) instead of queried again (optional)
         
     Returns:
         Dictionary with validation results
@@ -425,6 +449,20 @@ def validate_source_data(
         ValidationError: If validation fails
     """
     try:
+        if stats is not None:
+            table_stats = stats.get(table_name)
+            if not table_stats["table_exists"]:
+                raise ValidationError(
+                    f"Source table {schema}.{table_name} not found in database {database}",
+                    validation_type="table_existence"
+                )
+            return {
+                "valid": True,
+                "table_exists": True,
+                "row_count": table_stats["row_estimate"],
+                "has_data": table_stats["has_data"]
+            }
+        
         # Check if table exists by extracting schema
         schema_result = connector.extract_schema(
             database=database,
@@ -0,0 +1,166 @@
+"""Watermarks of incremental reloads, the highest source value copied per table."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from ingestion.checkpoints import decode_key_value, encode_key_value
+
+logger = logging.getLogger(__name__)
+
+
+def get_watermark_column(options: Optional[Dict[str, Any]], table_name: str) -> Optional[str]:
+    """Watermark column of a table in an incremental reload.
+
+    Read from full_load_config: the table's entry in "tables"
+    ({"orders": {"watermark_column": "updated_at"}}), else the pipeline-wide
+    "watermark_column".
+    """
+    options = options or {}
+    table_options = (options.get("tables") or {}).get(table_name) or {}
+    return table_options.get("watermark_column") or options.get("watermark_column")
+
+
+def is_watermark_strictly_increasing(options: Optional[Dict[str, Any]], table_name: str) -> bool:
+    """Whether a table's watermark column is declared strictly increasing.
+
+    Read from full_load_config like get_watermark_column
+    ("watermark_strictly_increasing", default False). Only a column no two
+    rows share and that is assigned in commit order (e.g. an identity
+    column) may be declared so; rows of other columns committed later with
+    the stored watermark value would be missed by an exclusive bound.
+    """
+    options = options or {}
+    table_options = (options.get("tables") or {}).get(table_name) or {}
+    if "watermark_strictly_increasing" in table_options:
+        return bool(table_options["watermark_strictly_increasing"])
+    return bool(options.get("watermark_strictly_increasing", False))
+
+
+class WatermarkTracker:
+    """Tracks the highest watermark column value among the rows of one table copy.
+
+    Batches may be observed from several threads (key ranges copied
+    concurrently); NULL values are ignored.
+    """
+
+    def __init__(self, column: str, value: Any = None):
+        """Initialize watermark tracker.
+
+        Args:
+            column: Watermark column name
+            value: Watermark the copy starts from (None for a first run)
+        """
+        self.column = column
+        self.value = value
+        self._lock = threading.Lock()
+
+    def _update(self, values: Sequence[Any]) -> None:
+        values = [value for value in values if value is not None]
+        if not values:
+            return
+        highest = max(values)
+        with self._lock:
+            if self.value is None or highest > self.value:
+                self.value = highest
+
+    def observe_rows(self, rows: Sequence[Sequence[Any]], column_names: List[str]) -> None:
+        """Update the watermark from a batch of rows."""
+        index = column_names.index(self.column)
+        self._update([row[index] for row in rows])
+
+    def observe_record_batch(self, batch) -> None:
+        """Update the watermark from an Arrow record batch."""
+        self._update(batch.column(batch.schema.get_field_index(self.column)).to_pylist())
+
+
+class WatermarkStore:
+    """Persists the watermark of every table of an incremental reload pipeline.
+
+    A watermark is stored after the rows up to it are committed on the
+    target, so a failed run is repeated from the previous watermark. Rows
+    of the failed run that were committed are upserted again, which leaves
+    the target unchanged.
+    """
+
+    def __init__(self, session_factory, pipeline_id: str):
+        """Initialize watermark store.
+
+        Args:
+            session_factory: Metadata database session factory (generator, as set from api.py)
+            pipeline_id: Pipeline ID the watermarks belong to
+        """
+        self.session_factory = session_factory
+        self.pipeline_id = pipeline_id
+        self._lock = threading.Lock()
+
+    def get(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """Get the watermark of a table.
+
+        Returns:
+            Dictionary with column, value (decoded), rows_copied (by the last
+            run) and updated_at, or None when the table has no watermark
+
+        Raises:
+            Exception: If the metadata database cannot be read; an unknown
+                watermark would reload the whole table
+        """
+        from ingestion.database.models_db import IncrementalWatermarkModel
+
+        db = next(self.session_factory())
+        try:
+            model = db.query(IncrementalWatermarkModel).filter(
+                IncrementalWatermarkModel.pipeline_id == self.pipeline_id,
+                IncrementalWatermarkModel.table_name == table_name
+            ).first()
+            if not model:
+                return None
+            return {
+                "column": model.watermark_column,
+                "value": decode_key_value(model.watermark_value),
+                "rows_copied": model.rows_copied or 0,
+                "updated_at": model.updated_at
+            }
+        finally:
+            db.close()
+
+    def set(self, table_name: str, column: str, value: Any, rows_copied: int) -> None:
+        """Store the watermark of a table after a run committed its rows.
+
+        Args:
+            table_name: Source table name
+            column: Watermark column name
+            value: Highest watermark column value copied
+            rows_copied: Rows copied by the run
+        """
+        from ingestion.database.models_db import IncrementalWatermarkModel
+
+        with self._lock:
+            db = next(self.session_factory())
+            try:
+                model = db.query(IncrementalWatermarkModel).filter(
+                    IncrementalWatermarkModel.pipeline_id == self.pipeline_id,
+                    IncrementalWatermarkModel.table_name == table_name
+                ).first()
+                if model is None:
+                    model = IncrementalWatermarkModel(
+                        id=str(uuid.uuid4()),
+                        pipeline_id=self.pipeline_id,
+                        table_name=table_name
+                    )
+                    db.add(model)
+                model.watermark_column = column
+                model.watermark_value = encode_key_value(value)
+                model.rows_copied = rows_copied
+                model.updated_at = datetime.utcnow()
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+        logger.info(f"Stored watermark {column} = {value!r} for {table_name} ({rows_copied} rows copied)")